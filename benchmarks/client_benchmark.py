@@ -0,0 +1,251 @@
+"""
+Client throughput benchmarks against FakeScannerService.
+
+Each scenario runs in its own interpreter so peak RSS is measured per scenario:
+
+    python benchmarks/client_benchmark.py --jobs 20 --pages 10 --page-size 1048576 --page-latency 0.01
+
+Reports pages/s, p50/p99 latency of a single page download and peak RSS.
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from dynamsoftservice import (  # noqa: E402
+    JobStatus,
+    RequestHook,
+    RetryPolicy,
+    ScannerController,
+    ScanOrchestrator,
+)
+from fakeservice import FakeScannerService  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+try:
+    import aiohttp  # noqa: F401
+except ImportError:
+    aiohttp = None
+
+
+SCENARIOS = ('sync', 'streaming', 'prefetch', 'concurrent', 'async')
+
+
+class _PageLatency(RequestHook):
+    def __init__(self) -> None:
+        self.latencies: List[float] = []
+        self.errors = 0
+
+    def after_request(self, event: Dict[str, Any]) -> None:
+        if event.get('error') or (event.get('statusCode') or 0) >= 400:
+            self.errors += 1
+        elif event['path'].endswith('/next-page') and event.get('statusCode') == 200:
+            self.latencies.append(event['total'])
+
+
+def _controller(latency: _PageLatency, **kwargs: Any) -> ScannerController:
+    # Injected 503s on GETs are retried quickly; a failed next-page simply ends that job early.
+    return ScannerController(hooks=[latency], retry=RetryPolicy(backoff_factor=0.01, max_backoff=0.1), **kwargs)
+
+
+class _NullWriter:
+    def write(self, data: bytes) -> int:
+        return len(data)
+
+
+def _peak_rss_mb() -> float:
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere.
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+def _scan_jobs(controller: ScannerController, host: str, jobs: int, read_pages: Callable[[str], int]) -> int:
+    device = controller.getDevices(host)[0]
+    pages = 0
+    for _ in range(jobs):
+        job_id = controller.createJob(host, {'device': device['device'], 'autoRun': True}).get('jobuid')
+        if not job_id:
+            continue
+        try:
+            pages += read_pages(job_id)
+        finally:
+            controller.deleteJob(host, job_id)
+    return pages
+
+
+def run_sync(host: str, options: argparse.Namespace, latency: _PageLatency) -> int:
+    controller = _controller(latency)
+
+    def read_pages(job_id: str) -> int:
+        return sum(1 for _ in controller.iterImageStreams(host, job_id))
+
+    return _scan_jobs(controller, host, options.jobs, read_pages)
+
+
+def run_streaming(host: str, options: argparse.Namespace, latency: _PageLatency) -> int:
+    controller = _controller(latency)
+    sink = _NullWriter()
+
+    def read_pages(job_id: str) -> int:
+        count = 0
+        while controller.writeImageStream(host, job_id, sink) is not None:
+            count += 1
+        return count
+
+    return _scan_jobs(controller, host, options.jobs, read_pages)
+
+
+def run_prefetch(host: str, options: argparse.Namespace, latency: _PageLatency) -> int:
+    controller = _controller(latency)
+
+    def read_pages(job_id: str) -> int:
+        return sum(1 for _ in controller.iterImageStreams(host, job_id, prefetch=2))
+
+    return _scan_jobs(controller, host, options.jobs, read_pages)
+
+
+def run_concurrent(host: str, options: argparse.Namespace, latency: _PageLatency) -> int:
+    controller = _controller(latency, pool_maxsize=options.workers)
+    devices = controller.getDevices(host)
+    orchestrator = ScanOrchestrator(controller, host, max_workers=options.workers)
+    jobs_per_device = max(options.jobs // max(len(devices), 1), 1)
+    return sum(1 for _ in orchestrator.run(devices, {'autoRun': True}, jobsPerDevice=jobs_per_device))
+
+
+def run_async(host: str, options: argparse.Namespace, latency: _PageLatency) -> int:
+    from dynamsoftservice import AsyncScannerController
+
+    async def scan_job(controller: AsyncScannerController, device: Dict[str, Any]) -> int:
+        job_id = (await controller.createJob(host, {'device': device['device'], 'autoRun': True})).get('jobuid')
+        count = 0
+        if not job_id:
+            latency.errors += 1
+            return count
+        try:
+            while True:
+                started = time.perf_counter()
+                image_stream = await controller.getImageStream(host, job_id)
+                if image_stream is None:
+                    latency.errors += controller.last_error is not None
+                    break
+                latency.latencies.append(time.perf_counter() - started)
+                count += 1
+        finally:
+            await controller.updateJob(host, job_id, {'status': JobStatus.CANCELED})
+            await controller.deleteJob(host, job_id)
+        return count
+
+    async def main() -> int:
+        async with AsyncScannerController() as controller:
+            devices = await controller.getDevices(host)
+            if not devices:
+                return 0
+            tasks = [scan_job(controller, devices[index % len(devices)]) for index in range(options.jobs)]
+            return sum(await asyncio.gather(*tasks))
+
+    return asyncio.run(main())
+
+
+RUNNERS = {
+    'sync': run_sync,
+    'streaming': run_streaming,
+    'prefetch': run_prefetch,
+    'concurrent': run_concurrent,
+    'async': run_async,
+}
+
+
+def run_scenario(name: str, host: str, options: argparse.Namespace) -> Dict[str, Any]:
+    latency = _PageLatency()
+    started = time.perf_counter()
+    pages = RUNNERS[name](host, options, latency)
+    elapsed = time.perf_counter() - started
+    return {
+        'scenario': name,
+        'pages': pages,
+        'seconds': elapsed,
+        'pagesPerSecond': pages / elapsed if elapsed else 0.0,
+        'p50': _percentile(latency.latencies, 0.5),
+        'p99': _percentile(latency.latencies, 0.99),
+        'errors': latency.errors,
+        'peakRssMb': _peak_rss_mb(),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Benchmark ScannerController against an in-process fake service.')
+    parser.add_argument('--scenario', action='append', choices=SCENARIOS, help='Scenario to run; repeat for several. Default: all.')
+    parser.add_argument('--jobs', type=int, default=8, help='Scan jobs per scenario.')
+    parser.add_argument('--pages', type=int, default=10, help='Pages per scan job.')
+    parser.add_argument('--page-size', type=int, default=1024 * 1024, help='Bytes per page.')
+    parser.add_argument('--page-latency', type=float, default=0.0, help='Seconds the fake scanner spends per page.')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Random +/- seconds added to the page latency.')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with 503.')
+    parser.add_argument('--workers', type=int, default=4, help='Worker threads for the concurrent scenario.')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON lines.')
+    parser.add_argument('--host', help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def main() -> None:
+    options = parse_args()
+    if options.host:
+        # Child process: run exactly one scenario against the parent's fake service.
+        print(json.dumps(run_scenario(options.scenario[0], options.host, options)))
+        return
+
+    scenarios = options.scenario or [name for name in SCENARIOS if name != 'async' or aiohttp is not None]
+    service = FakeScannerService(
+        pages_per_job=options.pages,
+        page_size=options.page_size,
+        page_latency=options.page_latency,
+        jitter=options.jitter,
+        error_rate=options.error_rate,
+        seed=0,
+    )
+    results = []
+    with service:
+        for name in scenarios:
+            command = [sys.executable, os.path.abspath(__file__), '--scenario', name, '--host', service.host]
+            command += [
+                '--jobs', str(options.jobs),
+                '--pages', str(options.pages),
+                '--workers', str(options.workers),
+            ]
+            output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+            results.append(json.loads(output.strip().splitlines()[-1]))
+
+    if options.json:
+        for result in results:
+            print(json.dumps(result))
+        return
+
+    print(f"{'scenario':<12}{'pages':>8}{'pages/s':>12}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}{'peak RSS MB':>14}")
+    for result in results:
+        print(
+            f"{result['scenario']:<12}{result['pages']:>8}{result['pagesPerSecond']:>12.1f}"
+            f"{result['p50'] * 1000:>10.2f}{result['p99'] * 1000:>10.2f}{result['errors']:>8}{result['peakRssMb']:>14.1f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,334 @@
+import json
+import random
+import socket
+import socketserver
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from dynamsoftservice import JobStatus, ScannerType
+
+
+DEFAULT_FAKE_PAGE_SIZE = 256 * 1024
+DEFAULT_FAKE_PAGES_PER_JOB = 3
+
+_PAGE_SIGNATURES = {
+    'image/png': b'\x89PNG\r\n\x1a\n',
+    'image/jpeg': b'\xff\xd8\xff\xe0',
+    'image/tiff': b'II*\x00',
+    'application/pdf': b'%PDF-1.4\n',
+}
+
+
+class _FakeServer(socketserver.ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.connections: Set[socket.socket] = set()
+        self.connections_lock = threading.Lock()
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        with self.connections_lock:
+            self.connections.add(request)
+        super().process_request(request, client_address)
+
+    def shutdown_request(self, request: Any) -> None:
+        with self.connections_lock:
+            self.connections.discard(request)
+        super().shutdown_request(request)
+
+    def close_connections(self) -> None:
+        # Keep-alive connections outlive serve_forever(); cut them so stop() looks like a dead service.
+        with self.connections_lock:
+            connections = list(self.connections)
+        for connection in connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+class _FakeJob:
+    def __init__(self, jobuid: str, device: str, status: str, page_count: int) -> None:
+        self.jobuid = jobuid
+        self.device = device
+        self.status = status
+        self.page_count = page_count
+        self.delivered = 0
+        self.lock = threading.Lock()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'jobuid': self.jobuid, 'device': self.device, 'status': self.status, 'pageCount': self.delivered}
+
+
+class FakeScannerService:
+    """
+    An in-process stand-in for the Dynamic Web TWAIN Service REST API.
+
+    It implements the endpoints ScannerController uses (``server``, ``device/scanners``, scan jobs,
+    ``next-page``, ``next-page-info``, ``storage/documents`` and ``process/*``). Page size,
+    per-page latency, jitter and an injected 503 error rate are configurable, so client
+    throughput can be measured without a scanner.
+
+        with FakeScannerService(pages_per_job=10, page_latency=0.05) as service:
+            controller.getDevices(service.host)
+    """
+
+    def __init__(
+        self,
+        devices: Optional[List[Dict[str, Any]]] = None,
+        pages_per_job: int = DEFAULT_FAKE_PAGES_PER_JOB,
+        page_size: int = DEFAULT_FAKE_PAGE_SIZE,
+        page_latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        blank_rate: float = 0.0,
+        seed: Optional[int] = None,
+        port: int = 0,
+    ) -> None:
+        self.devices = devices if devices is not None else [
+            {'name': f'Fake Scanner {index}', 'device': f'fake-device-{index}', 'type': ScannerType.TWAINSCANNER}
+            for index in range(1, 5)
+        ]
+        self.pages_per_job = pages_per_job
+        self.page_size = page_size
+        self.page_latency = page_latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.blank_rate = blank_rate
+        self.port = port
+        self.request_count = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, _FakeJob] = {}
+        self._documents: Dict[str, List[Dict[str, Any]]] = {}
+        self._settings: Dict[str, Any] = {'logLevel': 0}
+        self._bodies: Dict[Tuple[str, int], bytes] = {}
+        self._server: Optional[_FakeServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def host(self) -> str:
+        if self._server is None:
+            raise RuntimeError('FakeScannerService is not running.')
+        return f'http://127.0.0.1:{self._server.server_address[1]}'
+
+    def __enter__(self) -> 'FakeScannerService':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Start serving on a background thread."""
+        if self._server is not None:
+            return
+        service = self
+
+        class Handler(_FakeRequestHandler):
+            fake_service = service
+
+        self._server = _FakeServer(('127.0.0.1', self.port), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, name='dynamsoftservice-fake', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server.close_connections()
+        self._server = None
+
+    def _body(self, content_type: str, size: int) -> bytes:
+        # Bodies are built once per type and size so the server adds no allocation noise to benchmarks.
+        key = (content_type, size)
+        body = self._bodies.get(key)
+        if body is None:
+            signature = _PAGE_SIGNATURES.get(content_type, b'')
+            body = (signature + bytes(max(size - len(signature), 0)))[:max(size, len(signature))]
+            self._bodies[key] = body
+        return body
+
+    def _should_fail(self) -> bool:
+        with self._lock:
+            self.request_count += 1
+            return self.error_rate > 0 and self._random.random() < self.error_rate
+
+    def _page_delay(self) -> float:
+        if self.page_latency <= 0 and self.jitter <= 0:
+            return 0.0
+        with self._lock:
+            offset = self._random.uniform(-self.jitter, self.jitter) if self.jitter > 0 else 0.0
+        return max(self.page_latency + offset, 0.0)
+
+    def _is_blank(self, source: str) -> bool:
+        if self.blank_rate <= 0:
+            return False
+        return random.Random(source).random() < self.blank_rate
+
+    def handle(self, method: str, path: str, query: Dict[str, str], body: Any) -> Tuple[int, str, Any]:
+        """Route one request. Returns ``(status, content_type, payload)``; payload is bytes or JSON data."""
+        if self._should_fail():
+            return 503, 'application/json', {'message': 'Injected failure.'}
+
+        segments = [segment for segment in path.split('/') if segment]
+        if segments[:1] == ['api']:
+            segments = segments[1:]
+
+        if segments == ['server', 'version']:
+            return 200, 'application/json', {'version': 'fake', 'compatible': True}
+        if segments == ['server']:
+            if method == 'PATCH' and isinstance(body, dict):
+                self._settings.update(body)
+            return 200, 'application/json', dict(self._settings)
+        if segments == ['device', 'scanners'] and method == 'GET':
+            scanner_type = int(query.get('type', '0') or 0)
+            devices = [device for device in self.devices if not scanner_type or device.get('type', 0) & scanner_type]
+            return 200, 'application/json', devices
+        if segments[:3] == ['device', 'scanners', 'jobs']:
+            return self._handle_job(method, segments[3:], query, body)
+        if segments[:2] == ['storage', 'documents']:
+            return self._handle_document(method, segments[2:], query, body)
+        if segments == ['process', 'check-blank'] and method == 'POST':
+            return 200, 'application/json', {'isBlank': self._is_blank((body or {}).get('source', ''))}
+        if segments == ['process', 'read-barcode'] and method == 'POST':
+            source = (body or {}).get('source', '')
+            return 200, 'application/json', [{'format': 'QR_CODE', 'text': source.rsplit('/', 1)[-1]}]
+        return 404, 'application/json', {'message': 'Not found.'}
+
+    def _handle_job(self, method: str, segments: List[str], query: Dict[str, str], body: Any) -> Tuple[int, str, Any]:
+        if not segments:
+            if method != 'POST':
+                return 405, 'application/json', {'message': 'Method not allowed.'}
+            parameters = body if isinstance(body, dict) else {}
+            if not any(device['device'] == parameters.get('device') for device in self.devices):
+                return 400, 'application/json', {'message': 'Unknown device.'}
+            job = _FakeJob(
+                uuid.uuid4().hex,
+                parameters['device'],
+                JobStatus.RUNNING if parameters.get('autoRun') else JobStatus.PENDING,
+                self.pages_per_job,
+            )
+            with self._lock:
+                self._jobs[job.jobuid] = job
+            return 201, 'application/json', job.to_dict()
+
+        with self._lock:
+            job = self._jobs.get(segments[0])
+        if job is None:
+            return 404, 'application/json', {'message': 'Job not found.'}
+
+        action = segments[1:]
+        if not action:
+            if method == 'GET':
+                return 200, 'application/json', job.to_dict()
+            if method == 'PATCH':
+                job.status = (body or {}).get('status', job.status)
+                return 200, 'application/json', job.to_dict()
+            if method == 'DELETE':
+                with self._lock:
+                    self._jobs.pop(job.jobuid, None)
+                return 204, '', b''
+        if action in (['next-page'], ['next-page-info']) and method == 'GET':
+            with job.lock:
+                if job.status == JobStatus.CANCELED or job.delivered >= job.page_count:
+                    if job.status != JobStatus.CANCELED:
+                        job.status = JobStatus.COMPLETED
+                    return 204, '', b''
+                job.delivered += 1
+                index = job.delivered
+            time.sleep(self._page_delay())
+            if action == ['next-page']:
+                content_type = query.get('type', 'image/png')
+                return 200, content_type, self._body(content_type, self.page_size)
+            return 200, 'application/json', {'url': f'{self.host}/api/device/scanners/jobs/{job.jobuid}/pages/{index}', 'index': index}
+        if action[:1] == ['pages'] and len(action) == 2 and method == 'GET':
+            content_type = query.get('type', 'image/png')
+            return 200, content_type, self._body(content_type, self.page_size)
+        if action == ['scanner', 'capabilities']:
+            return 200, 'application/json', []
+        if action == ['scanner', 'settings']:
+            return 200, 'application/json', {}
+        return 404, 'application/json', {'message': 'Not found.'}
+
+    def _handle_document(self, method: str, segments: List[str], query: Dict[str, str], body: Any) -> Tuple[int, str, Any]:
+        if not segments:
+            if method != 'POST':
+                return 405, 'application/json', {'message': 'Method not allowed.'}
+            uid = uuid.uuid4().hex
+            with self._lock:
+                self._documents[uid] = []
+            return 201, 'application/json', {'uid': uid}
+
+        with self._lock:
+            pages = self._documents.get(segments[0])
+        if pages is None:
+            return 404, 'application/json', {'message': 'Document not found.'}
+
+        uid, action = segments[0], segments[1:]
+        if not action:
+            if method == 'GET':
+                return 200, 'application/json', {'uid': uid, 'pages': list(pages)}
+            if method == 'DELETE':
+                with self._lock:
+                    self._documents.pop(uid, None)
+                return 204, '', b''
+        if action == ['content'] and method == 'GET':
+            content_type = query.get('type', 'application/pdf')
+            return 200, content_type, self._body(content_type, self.page_size * max(len(pages), 1))
+        if action == ['pages'] and method == 'POST':
+            page = {'uid': uuid.uuid4().hex, 'source': (body or {}).get('source', '')}
+            with self._lock:
+                pages.append(page)
+            return 201, 'application/json', {'pages': [page]}
+        if action[:1] == ['pages'] and len(action) == 2 and method == 'DELETE':
+            with self._lock:
+                pages[:] = [page for page in pages if page['uid'] != action[1]]
+            return 204, '', b''
+        return 404, 'application/json', {'message': 'Not found.'}
+
+
+class _FakeRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Buffer writes so headers and body leave in one segment instead of stalling on Nagle/delayed ACK.
+    wbufsize = 64 * 1024
+    fake_service: FakeScannerService
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _dispatch(self) -> None:
+        url = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        length = int(self.headers.get('Content-Length') or 0)
+        raw_body = self.rfile.read(length) if length else b''
+        try:
+            body = json.loads(raw_body) if raw_body else None
+        except ValueError:
+            body = None
+
+        status, content_type, payload = self.fake_service.handle(self.command, url.path, query, body)
+        data = payload if isinstance(payload, bytes) else json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        if content_type:
+            self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = _dispatch
+    do_POST = _dispatch
+    do_PATCH = _dispatch
+    do_DELETE = _dispatch
+
+
+__all__ = [
+    'FakeScannerService',
+]
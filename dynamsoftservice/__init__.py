@@ -1,14 +1,49 @@
+import abc
+import copy
+import itertools
 import json
 import os
+import queue
+import random
+import socket
+import threading
 import time
 import requests
-from typing import List, Any, Dict, Optional
+from requests.adapters import HTTPAdapter
+from typing import Callable, Iterator, List, Any, Dict, Optional, Sequence, Tuple, Union
+from urllib.parse import urlsplit
 
 
 DEFAULT_TIMEOUT = 30
 DEFAULT_IMAGE_TYPE = 'image/png'
 DEFAULT_DOCUMENT_TYPE = 'application/pdf'
 DEFAULT_CHUNK_SIZE = 8192
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_MAX_BACKOFF = 10.0
+DEFAULT_RETRY_STATUS_CODES = (502, 503, 504)
+DEFAULT_RETRY_METHODS = ('GET', 'HEAD', 'OPTIONS')
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_POLL_MIN_INTERVAL = 0.25
+DEFAULT_POLL_MAX_INTERVAL = 5.0
+DEFAULT_POLL_BACKOFF = 1.5
+DEFAULT_BREAKER_FAILURE_THRESHOLD = 5
+DEFAULT_BREAKER_RECOVERY_TIMEOUT = 30.0
+DEFAULT_BREAKER_PROBE_TIMEOUT = 2.0
+# Suggested (connect, read) timeouts per endpoint template, for ScannerController(timeout_profiles=...).
+# Pings and metadata fail fast; page delivery may legitimately wait for paper to be fed.
+DEFAULT_TIMEOUT_PROFILES: Dict[str, Tuple[float, float]] = {
+    'server/version': (1.0, 2.0),
+    'server': (1.0, 5.0),
+    'device/scanners': (2.0, 15.0),
+    'device/scanners/jobs/{jobId}': (2.0, 10.0),
+    'device/scanners/jobs/{jobId}/next-page': (2.0, 120.0),
+    'device/scanners/jobs/{jobId}/next-page-info': (2.0, 120.0),
+}
+# Calls on the job resource itself (checkJob, updateJob, deleteJob) ignore the job deadline so an
+# expired job can still be cancelled and deleted.
+_DEADLINE_EXEMPT_PATHS = ('device/scanners/jobs/{jobId}',)
 
 
 class ScannerType:
@@ -29,6 +64,9 @@ class JobStatus:
     CANCELED = 'canceled'
 
 
+TERMINAL_JOB_STATUSES = (JobStatus.COMPLETED, JobStatus.FAULTED, JobStatus.CANCELED)
+
+
 class ScannerServiceError(RuntimeError):
     """Raised when the Dynamic Web TWAIN Service returns an error response."""
 
@@ -37,33 +75,575 @@ class ScannerServiceError(RuntimeError):
         self.status_code = status_code
         self.details = details or {}
 
-class ScannerController:
+class RetryPolicy:
     """
-    A class that provides methods to interact with the Dynamic Web TWAIN Service API.
+    Retry settings for requests that are safe to replay.
+
+    Only methods listed in ``methods`` are retried, and callers can veto individual requests
+    (``next-page`` dequeues a page, so it is never replayed). Delays grow as
+    ``backoff_factor * 2 ** (attempt - 1)``, capped at ``max_backoff``, with up to ``jitter``
+    of the delay removed at random. A numeric ``Retry-After`` header takes precedence.
     """
 
     def __init__(
         self,
-        timeout: int = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        jitter: float = 0.5,
+        status_codes: Tuple[int, ...] = DEFAULT_RETRY_STATUS_CODES,
+        methods: Tuple[str, ...] = DEFAULT_RETRY_METHODS,
+        on_attempt: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> None:
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.status_codes = status_codes
+        self.methods = tuple(method.upper() for method in methods)
+        self.on_attempt = on_attempt
+
+    def allows(self, method: str, idempotent: Optional[bool] = None) -> bool:
+        if idempotent is not None:
+            return idempotent
+        return method.upper() in self.methods
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        if retry_after:
+            try:
+                return min(self.max_backoff, max(0.0, float(retry_after)))
+            except ValueError:
+                pass
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        return delay - random.uniform(0, delay * self.jitter)
+
+
+class CircuitState:
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+
+class _HostCircuit:
+    def __init__(self) -> None:
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trips = 0
+        self.last_error: Optional[str] = None
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker that makes requests to a dead service fail fast.
+
+    After ``failure_threshold`` consecutive connection errors, timeouts or ``failure_status_codes``
+    responses, the circuit of that host opens. Requests then fail immediately without touching the
+    network. Once ``recovery_timeout`` seconds have passed, the next request probes the host with
+    ``server/version`` first. Only one caller probes at a time (half-open) while the others keep
+    failing fast. A successful probe closes the circuit and a failed one re-opens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_BREAKER_FAILURE_THRESHOLD,
+        recovery_timeout: float = DEFAULT_BREAKER_RECOVERY_TIMEOUT,
+        failure_status_codes: Tuple[int, ...] = DEFAULT_RETRY_STATUS_CODES,
+        probe_timeout: float = DEFAULT_BREAKER_PROBE_TIMEOUT,
+    ) -> None:
+        self.failure_threshold = max(failure_threshold, 1)
+        self.recovery_timeout = recovery_timeout
+        self.failure_status_codes = failure_status_codes
+        self.probe_timeout = probe_timeout
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, _HostCircuit] = {}
+
+    def acquire(self, host: str) -> str:
+        """
+        Decide whether a request to ``host`` may proceed.
+
+        Returns ``CircuitState.CLOSED`` to proceed, ``CircuitState.OPEN`` to fail fast, or
+        ``CircuitState.HALF_OPEN`` when the caller has been chosen to probe the host.
+        """
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None or circuit.state == CircuitState.CLOSED:
+                return CircuitState.CLOSED
+            if circuit.state == CircuitState.OPEN and time.monotonic() - circuit.opened_at >= self.recovery_timeout:
+                circuit.state = CircuitState.HALF_OPEN
+                return CircuitState.HALF_OPEN
+            return CircuitState.OPEN
+
+    def record_success(self, host: str) -> None:
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is not None:
+                circuit.state = CircuitState.CLOSED
+                circuit.failures = 0
+
+    def record_failure(self, host: str, error: str) -> None:
+        with self._lock:
+            circuit = self._circuits.setdefault(host, _HostCircuit())
+            circuit.failures += 1
+            circuit.last_error = error
+            if circuit.state == CircuitState.HALF_OPEN or (
+                circuit.state == CircuitState.CLOSED and circuit.failures >= self.failure_threshold
+            ):
+                if circuit.state == CircuitState.CLOSED:
+                    circuit.trips += 1
+                circuit.state = CircuitState.OPEN
+                circuit.opened_at = time.monotonic()
+
+    def retry_after(self, host: str) -> float:
+        """Seconds until an open circuit lets a probe through."""
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None or circuit.state != CircuitState.OPEN:
+                return 0.0
+            return max(0.0, self.recovery_timeout - (time.monotonic() - circuit.opened_at))
+
+    def health(self) -> Dict[str, Dict[str, Any]]:
+        """Get the circuit state of every host that has failed at least once."""
+        with self._lock:
+            circuits = list(self._circuits.items())
+        return {
+            host: {
+                'state': circuit.state,
+                'consecutiveFailures': circuit.failures,
+                'trips': circuit.trips,
+                'lastError': circuit.last_error,
+                'retryAfter': self.retry_after(host),
+            }
+            for host, circuit in circuits
+        }
+
+    def reset(self, host: Optional[str] = None) -> None:
+        """Close the circuit of one host, or of every host."""
+        with self._lock:
+            if host is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(host, None)
+
+
+class RequestHook:
+    """
+    Base class for request instrumentation registered through ``ScannerController(hooks=[...])``.
+
+    Both methods receive the same event dict. ``before_request`` sees ``method``, ``host``,
+    ``path`` (a template such as ``device/scanners/jobs/{jobId}/next-page``), ``url``, ``jobId``
+    and ``start``. ``after_request`` additionally sees ``statusCode`` (None on transport errors),
+    ``error``, ``attempts``, ``bytes`` received, ``ttfb`` (seconds until response headers were
+    parsed, including connection setup) and ``total`` (seconds until the body was consumed).
+    Calls rejected before anything is sent, because the host's circuit is open or the job deadline
+    has expired, are reported too, with ``statusCode`` None, ``attempts`` 0 and the reason in ``error``.
+    """
+
+    def before_request(self, event: Dict[str, Any]) -> None:
+        pass
+
+    def after_request(self, event: Dict[str, Any]) -> None:
+        pass
+
+
+class _NoTrace:
+    """Context manager used in place of a span when tracing is disabled."""
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        return None
+
+
+_NO_TRACE = _NoTrace()
+_FILE_SEQUENCE = itertools.count(1)
+_PATH_ID_PLACEHOLDERS = {'jobs': '{jobId}', 'documents': '{docId}', 'pages': '{pageId}'}
+
+
+def _describe_path(path: str) -> Tuple[str, str]:
+    """Turn a concrete API path into its endpoint template and extract the job ID it refers to."""
+    segments = path.strip('/').split('/')
+    if segments and segments[0] == 'api':
+        segments = segments[1:]
+    job_id = ''
+    for index in range(1, len(segments)):
+        placeholder = _PATH_ID_PLACEHOLDERS.get(segments[index - 1])
+        if placeholder and not segments[index].startswith('{'):
+            if placeholder == '{jobId}':
+                job_id = segments[index]
+            segments[index] = placeholder
+    return '/'.join(segments), job_id
+
+
+class _TunedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies socket options to every pooled connection."""
+
+    def __init__(self, socket_options: List[Tuple[int, int, int]], **kwargs: Any) -> None:
+        self.socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs['socket_options'] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+class Transport(abc.ABC):
+    """
+    Base class for the HTTP layer behind ``ScannerController(transport=...)``.
+
+    ``request`` takes the arguments of ``requests.Session.request`` that the controller uses and
+    returns an object with the ``requests.Response`` surface the controller reads: ``status_code``,
+    ``ok``, ``reason``, ``headers``, ``content``, ``text``, ``json()``, ``iter_content()``,
+    ``elapsed`` and ``close()``. Transport failures must be raised as ``requests.RequestException``
+    subclasses, both from ``request`` and while a streamed body is read.
+    """
+
+    @abc.abstractmethod
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        timeout: Optional[Union[float, Tuple[float, float]]] = None,
         verify: bool = True,
-        session: Optional[requests.Session] = None,
-        raise_errors: bool = False,
+        stream: bool = False,
+    ) -> Any:
+        """Send one request. Subclasses must implement it."""
+
+    def close(self) -> None:
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {}
+
+
+class RequestsTransport(Transport):
+    """The default transport: a ``requests.Session`` with one request in flight per pooled HTTP/1.1 connection."""
+
+    def __init__(self, session: requests.Session) -> None:
+        self.session = session
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        timeout: Optional[Union[float, Tuple[float, float]]] = None,
+        verify: bool = True,
+        stream: bool = False,
+    ) -> requests.Response:
+        return self.session.request(
+            method=method,
+            url=url,
+            headers=headers,
+            params=params,
+            json=json,
+            timeout=timeout,
+            verify=verify,
+            stream=stream,
+        )
+
+    def close(self) -> None:
+        self.session.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report connection reuse per host pool.
+
+        ``misses`` counts new connections opened and ``hits`` counts requests served on an
+        already open connection. ``idle`` is the number of connections waiting in the pool.
+        """
+        pools: List[Dict[str, Any]] = []
+        seen = set()
+        for adapter in self.session.adapters.values():
+            pool_manager = getattr(adapter, 'poolmanager', None)
+            if pool_manager is None or id(pool_manager) in seen:
+                continue
+            seen.add(id(pool_manager))
+            for key in pool_manager.pools.keys():
+                pool = pool_manager.pools.get(key)
+                if pool is None:
+                    continue
+                requests_sent = pool.num_requests
+                connections = pool.num_connections
+                pools.append(
+                    {
+                        'scheme': pool.scheme,
+                        'host': pool.host,
+                        'port': pool.port,
+                        'requests': requests_sent,
+                        'hits': max(requests_sent - connections, 0),
+                        'misses': connections,
+                        'idle': pool.pool.qsize() if pool.pool is not None else 0,
+                        'maxsize': pool.pool.maxsize if pool.pool is not None else 0,
+                    }
+                )
+        return {
+            'pools': pools,
+            'requests': sum(item['requests'] for item in pools),
+            'hits': sum(item['hits'] for item in pools),
+            'misses': sum(item['misses'] for item in pools),
+        }
+
+
+class _FlightCall:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _SingleFlight:
+    """Collapses concurrent calls that share a key into one execution whose outcome all callers receive."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Any, _FlightCall] = {}
+
+    def do(self, key: Any, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Run ``fn`` once per key at a time. Returns ``(result, shared)``; ``shared`` is True for followers."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _FlightCall()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+
+class _PrefetchState:
+    # Shared with the producer thread. It must not reference the PrefetchIterator, so an abandoned
+    # iterator can still be garbage-collected and closed.
+    def __init__(self, depth: int) -> None:
+        self.pending: 'queue.Queue[Tuple[str, Any]]' = queue.Queue(maxsize=depth)
+        self.stopped = threading.Event()
+        self.held: List[Tuple[str, Any]] = []
+
+    def put(self, item: Tuple[str, Any]) -> bool:
+        while not self.stopped.is_set():
+            try:
+                self.pending.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        # The consumer has stopped; keep the item so close() can hand it back.
+        self.held.append(item)
+        return False
+
+    def produce(self, fetch: Callable[[], Any], is_done: Callable[[Any], bool], controller: Optional[Any]) -> None:
+        try:
+            while not self.stopped.is_set():
+                result = fetch()
+                if is_done(result):
+                    break
+                if not self.put(('page', result)):
+                    return
+        except BaseException as error:
+            self.put(('error', error))
+            return
+        # last_error is per thread, so the producer's outcome travels with the end marker.
+        self.put(('done', controller.last_error if controller is not None else None))
+
+
+class PrefetchIterator:
+    """
+    Iterates over pages fetched ahead on a background thread.
+
+    A bounded queue provides backpressure: the producer blocks once ``depth`` pages are waiting.
+    ``next-page`` removes a page from the service queue, so pages fetched ahead cannot be put back.
+    When iteration stops early, close() waits for the request in flight and moves every fetched
+    but unconsumed page to ``leftover``, in scan order.
+
+    A failed fetch also ends the pages, as it does without prefetching. When ``controller`` is
+    given, the ``last_error`` the producer thread saw when it stopped is set on the thread that
+    reaches the end of the iteration or calls close(), so a failure is not mistaken for the end.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], Any],
+        depth: int,
+        is_done: Callable[[Any], bool],
+        controller: Optional['ScannerController'] = None,
     ) -> None:
-        self.timeout = timeout
-        self.verify = verify
-        self.raise_errors = raise_errors
-        self.session = session or requests.Session()
-        self.last_error: Optional[Dict[str, Any]] = None
+        self.leftover: List[Any] = []
+        self._controller = controller
+        self._state = _PrefetchState(depth)
+        self._finished = False
+        self._worker = threading.Thread(
+            target=self._state.produce,
+            args=(fetch, is_done, controller),
+            name='dynamsoftservice-prefetch',
+            daemon=True,
+        )
+        self._worker.start()
 
-    def __enter__(self) -> 'ScannerController':
+    def __iter__(self) -> 'PrefetchIterator':
+        return self
+
+    def __next__(self) -> Any:
+        if self._finished:
+            raise StopIteration
+        kind, value = self._state.pending.get()
+        if kind == 'page':
+            return value
+        self.close()
+        if kind == 'error':
+            raise value
+        self._report(value)
+        raise StopIteration
+
+    def __enter__(self) -> 'PrefetchIterator':
         return self
 
     def __exit__(self, exc_type, exc_value, traceback) -> None:
         self.close()
 
-    def close(self) -> None:
-        """Close the underlying HTTP session."""
-        self.session.close()
+    def __del__(self) -> None:
+        self._state.stopped.set()
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Stop prefetching and collect the pages that were fetched but not consumed into ``leftover``.
+
+        With ``wait=False`` it returns without waiting for the request in flight, which may take up
+        to its read timeout. The page that request returns is then dropped.
+        """
+        if self._finished:
+            return
+        self._finished = True
+        self._state.stopped.set()
+        if wait:
+            self._worker.join()
+        items: List[Tuple[str, Any]] = []
+        while True:
+            try:
+                items.append(self._state.pending.get_nowait())
+            except queue.Empty:
+                break
+        items.extend(self._state.held)
+        self.leftover.extend(value for kind, value in items if kind == 'page')
+        for kind, value in items:
+            # Only a failure is reported here; the consumer may have its own error from while it stopped.
+            if kind == 'done' and value is not None:
+                self._report(value)
+
+    def _report(self, error: Optional[Dict[str, Any]]) -> None:
+        if self._controller is not None:
+            self._controller.last_error = error
+
+
+class _PageLookupError(Exception):
+    """Carries a failed next-page-info lookup from a prefetch thread to the consumer."""
+
+    def __init__(self, error: Dict[str, Any]) -> None:
+        super().__init__(error.get('error') or error.get('message') or 'Failed to get page info.')
+        self.error = error
+
+
+class _TTLCache:
+    """Thread-safe time-based cache whose misses are loaded through a single flight."""
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[Any, Tuple[float, Any]] = {}
+        self._flight = _SingleFlight()
+
+    def get(self, key: Any, load: Callable[[], Tuple[Any, bool]]) -> Any:
+        """
+        Return the cached value for ``key`` or call ``load``, which returns ``(value, cacheable)``.
+
+        Every caller gets a deep copy, so mutating a returned value never changes the cache.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return copy.deepcopy(entry[1])
+
+        def refresh() -> Any:
+            value, cacheable = load()
+            if cacheable:
+                with self._lock:
+                    self._entries[key] = (time.monotonic() + self.ttl, value)
+            return value
+
+        value, _ = self._flight.do(key, refresh)
+        return copy.deepcopy(value)
+
+    def invalidate(self, predicate: Optional[Callable[[Any], bool]] = None) -> None:
+        with self._lock:
+            if predicate is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+
+class BufferPool:
+    """
+    A pool of reusable ``bytearray`` buffers for getImageBuffer and getDocumentBuffer.
+
+    Buffers keep their capacity between pages, so a steady scan stream stops allocating
+    page-sized objects once every pooled buffer has grown to the largest page size.
+    """
+
+    def __init__(self, max_buffers: int = 8, initial_size: int = 0) -> None:
+        self.max_buffers = max_buffers
+        self.initial_size = initial_size
+        self._lock = threading.Lock()
+        self._buffers: List[bytearray] = []
+
+    def acquire(self) -> bytearray:
+        """Take a buffer from the pool, or allocate one when the pool is empty."""
+        with self._lock:
+            if self._buffers:
+                return self._buffers.pop()
+        return bytearray(self.initial_size)
+
+    def release(self, buffer: bytearray) -> None:
+        """Return a buffer to the pool. Every memoryview of it must be released first."""
+        with self._lock:
+            if len(self._buffers) < self.max_buffers:
+                self._buffers.append(buffer)
+
+
+class _BufferWriter:
+    """Writable that fills a bytearray in place, growing it only when it is too small."""
+
+    def __init__(self, buffer: bytearray) -> None:
+        self.buffer = buffer
+        self.size = 0
+
+    def write(self, chunk: bytes) -> int:
+        end = self.size + len(chunk)
+        self.buffer[self.size:end] = chunk
+        self.size = end
+        return len(chunk)
+
+
+class _ControllerBase:
+    """Request-building helpers shared by the synchronous and asynchronous controllers."""
 
     def _build_url(self, host: str, path: str) -> str:
         base_url = host.rstrip('/')
@@ -103,6 +683,149 @@ class ScannerController:
                 cleaned[key] = value
         return cleaned
 
+    def _resolve_extension(self, content_type: str) -> str:
+        extension_map = {
+            'image/jpeg': '.jpg',
+            'image/png': '.png',
+            'image/tiff': '.tiff',
+            'application/pdf': '.pdf',
+        }
+        return extension_map.get(content_type, '.bin')
+
+    def _unique_filename(self, prefix: str, content_type: str) -> str:
+        # The process-wide sequence keeps two pages saved within the same millisecond apart.
+        return f"{prefix}_{int(time.time() * 1000)}_{next(_FILE_SEQUENCE)}{self._resolve_extension(content_type)}"
+
+
+class ScannerController(_ControllerBase):
+    """
+    A class that provides methods to interact with the Dynamic Web TWAIN Service API.
+    """
+
+    def __init__(
+        self,
+        timeout: int = DEFAULT_TIMEOUT,
+        verify: bool = True,
+        session: Optional[requests.Session] = None,
+        raise_errors: bool = False,
+        retry: Optional[RetryPolicy] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        tcp_nodelay: bool = True,
+        cache_ttl: float = 0,
+        hooks: Optional[List[RequestHook]] = None,
+        tracer: Optional[Any] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        connect_timeout: Optional[float] = None,
+        timeout_profiles: Optional[Dict[str, Union[float, Tuple[float, float]]]] = None,
+        job_deadline: Optional[float] = None,
+        coalesce: bool = False,
+        transport: Optional[Transport] = None,
+        http2: bool = False,
+    ) -> None:
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.timeout_profiles = dict(timeout_profiles or {})
+        self.job_deadline = job_deadline
+        self._deadlines: Dict[str, float] = {}
+        self._deadlines_lock = threading.Lock()
+        self.verify = verify
+        self.raise_errors = raise_errors
+        self.retry = retry
+        self.hooks: List[RequestHook] = list(hooks or [])
+        self.tracer = tracer
+        if tracer is not None:
+            self.hooks.append(tracer)
+        self.circuit_breaker = circuit_breaker
+        self.coalesce = coalesce
+        self._flight = _SingleFlight()
+        self.cache_ttl = cache_ttl
+        self._cache = _TTLCache(cache_ttl)
+        if transport is None and http2 and session is None:
+            transport = self._create_http2_transport(pool_maxsize, keep_alive)
+        if transport is None:
+            session = session or self._create_session(pool_connections, pool_maxsize, pool_block, keep_alive, tcp_nodelay)
+            transport = RequestsTransport(session)
+        self.transport = transport
+        # Kept for callers that tune the requests session directly; None with other transports.
+        self.session: Optional[requests.Session] = getattr(transport, 'session', None)
+        self._local = threading.local()
+
+    def __enter__(self) -> 'ScannerController':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def last_error(self) -> Optional[Dict[str, Any]]:
+        """
+        The normalized error payload of the last failed call made by the current thread, or None.
+
+        It is kept per thread, so worker threads sharing a controller never see each other's errors.
+        """
+        return getattr(self._local, 'last_error', None)
+
+    @last_error.setter
+    def last_error(self, value: Optional[Dict[str, Any]]) -> None:
+        self._local.last_error = value
+
+    @property
+    def last_attempts(self) -> List[Dict[str, Any]]:
+        """Per-attempt timing of the last request made by the current thread."""
+        return getattr(self._local, 'last_attempts', [])
+
+    @last_attempts.setter
+    def last_attempts(self, value: List[Dict[str, Any]]) -> None:
+        self._local.last_attempts = value
+
+    def close(self) -> None:
+        """Close the underlying HTTP transport."""
+        self.transport.close()
+
+    def _create_http2_transport(self, pool_maxsize: int, keep_alive: bool) -> Optional[Transport]:
+        # Without httpx and h2 installed, the controller falls back to the requests transport.
+        try:
+            return HTTPXTransport(http2=True, max_connections=pool_maxsize, keep_alive=keep_alive)
+        except ImportError:
+            return None
+
+    def _create_session(
+        self,
+        pool_connections: int,
+        pool_maxsize: int,
+        pool_block: bool,
+        keep_alive: bool,
+        tcp_nodelay: bool,
+    ) -> requests.Session:
+        socket_options = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1 if tcp_nodelay else 0)]
+        if keep_alive:
+            socket_options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+
+        session = requests.Session()
+        adapter = _TunedHTTPAdapter(
+            socket_options,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        if not keep_alive:
+            session.headers['Connection'] = 'close'
+        return session
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report connection statistics from the transport.
+
+        The default transport reports reuse per host pool: ``misses`` counts new connections opened
+        and ``hits`` counts requests served on an already open connection.
+        """
+        return self.transport.stats()
+
     def _send_request(
         self,
         method: str,
@@ -112,29 +835,222 @@ class ScannerController:
         params: Optional[Dict[str, Any]] = None,
         payload: Optional[Dict[str, Any]] = None,
         stream: bool = False,
-        timeout: Optional[int] = None,
+        timeout: Optional[Union[float, Tuple[float, float]]] = None,
         absolute_url: Optional[str] = None,
+        idempotent: Optional[bool] = None,
     ) -> Optional[requests.Response]:
         request_url = absolute_url or self._build_url(host, path)
-        try:
-            response = self.session.request(
-                method=method,
-                url=request_url,
-                headers=headers,
-                params=self._clean_params(params),
-                json=payload,
-                timeout=timeout or self.timeout,
-                verify=self.verify,
-                stream=stream,
+        template, job_id = _describe_path(urlsplit(absolute_url).path if absolute_url else path)
+        budget_job = job_id if job_id and template not in _DEADLINE_EXEMPT_PATHS else ''
+        event: Optional[Dict[str, Any]] = None
+        if self.hooks:
+            event = self._start_event(method, host, urlsplit(absolute_url).path if absolute_url else path, request_url)
+
+        remaining = self.jobBudget(budget_job)
+        if remaining is not None and remaining <= 0:
+            self._fail_fast({'error': 'Job deadline exceeded.', 'jobId': job_id}, event)
+            return None
+
+        circuit = self._circuit_key(request_url) if self.circuit_breaker is not None else ''
+        if circuit and not self._circuit_allows(circuit):
+            self._fail_fast(
+                {
+                    'error': 'Circuit open: the service host is failing.',
+                    'host': circuit,
+                    'retryAfter': self.circuit_breaker.retry_after(circuit),
+                },
+                event,
             )
+            return None
+
+        policy = self.retry
+        retryable = policy is not None and policy.allows(method, idempotent)
+        attempts: List[Dict[str, Any]] = []
+        self.last_attempts = attempts
+        while True:
+            attempt: Dict[str, Any] = {'attempt': len(attempts) + 1, 'method': method, 'url': request_url}
+            attempts.append(attempt)
+            remaining = self.jobBudget(budget_job)
+            can_retry = retryable and len(attempts) <= policy.max_retries and (remaining is None or remaining > 0)
+            started = time.monotonic()
+            try:
+                response = self.transport.request(
+                    method=method,
+                    url=request_url,
+                    headers=headers,
+                    params=self._clean_params(params),
+                    json=payload,
+                    timeout=self._request_timeout(template, timeout, remaining),
+                    verify=self.verify,
+                    stream=stream,
+                )
+            except requests.RequestException as error:
+                attempt.update(elapsed=time.monotonic() - started, statusCode=None, error=str(error))
+                if can_retry:
+                    self._wait_before_retry(attempt, self._budget_delay(budget_job, policy.backoff(attempt['attempt'])))
+                    continue
+                self._notify_attempt(attempt)
+                if circuit:
+                    self.circuit_breaker.record_failure(circuit, str(error))
+                if event is not None:
+                    event['attempts'] = len(attempts)
+                    self._finish_event(event, error=str(error))
+                error_payload = {'error': str(error)}
+                self.last_error = error_payload
+                if self.raise_errors:
+                    raise ScannerServiceError(str(error), details=error_payload)
+                return None
+
+            attempt.update(elapsed=time.monotonic() - started, statusCode=response.status_code, error=None)
+            if can_retry and response.status_code in policy.status_codes:
+                response.close()
+                delay = policy.backoff(attempt['attempt'], response.headers.get('Retry-After'))
+                self._wait_before_retry(attempt, self._budget_delay(budget_job, delay))
+                continue
+            self._notify_attempt(attempt)
+            if circuit:
+                if response.status_code in self.circuit_breaker.failure_status_codes:
+                    self.circuit_breaker.record_failure(circuit, f'HTTP {response.status_code}')
+                else:
+                    self.circuit_breaker.record_success(circuit)
+            if event is not None:
+                event.update(statusCode=response.status_code, attempts=len(attempts), ttfb=response.elapsed.total_seconds())
+                if stream:
+                    # Streamed bodies are consumed later; the event is completed when the response is released.
+                    response._instrumentation_event = event
+                else:
+                    self._finish_event(event, received=len(response.content))
             self.last_error = None
             return response
-        except requests.RequestException as error:
-            payload = {'error': str(error)}
-            self.last_error = payload
-            if self.raise_errors:
-                raise ScannerServiceError(str(error), details=payload)
-        return None
+
+    def _fail_fast(self, error_payload: Dict[str, Any], event: Optional[Dict[str, Any]] = None) -> None:
+        if event is not None:
+            # Hooks still see the rejected call, as a request that made no attempts.
+            event['attempts'] = 0
+            self._finish_event(event, error=error_payload['error'])
+        self.last_error = error_payload
+        if self.raise_errors:
+            raise ScannerServiceError(error_payload['error'], details=error_payload)
+
+    def _request_timeout(
+        self,
+        template: str,
+        timeout: Optional[Union[float, Tuple[float, float]]],
+        remaining: Optional[float],
+    ) -> Tuple[float, float]:
+        configured = timeout or self.timeout_profiles.get(template) or self.timeout
+        if isinstance(configured, tuple):
+            connect, read = configured
+        else:
+            connect, read = min(self.connect_timeout or configured, configured), configured
+        if remaining is not None:
+            # Never wait past the job deadline; the floor keeps requests from getting a zero timeout.
+            connect, read = max(min(connect, remaining), 0.01), max(min(read, remaining), 0.01)
+        return connect, read
+
+    def _budget_delay(self, jobId: str, delay: float) -> float:
+        remaining = self.jobBudget(jobId)
+        return delay if remaining is None else max(0.0, min(delay, remaining))
+
+    def setJobDeadline(self, jobId: str, seconds: Optional[float]) -> None:
+        """
+        Give a job an overall time budget. Every later call on the job inherits what is left of it.
+
+        Request timeouts are capped at the remaining budget, and retries stop when it runs out. Calls
+        made after it has expired fail fast. checkJob, updateJob and deleteJob are exempt, so the job
+        can still be cancelled and cleaned up. Pass None to remove the deadline.
+        """
+        with self._deadlines_lock:
+            if seconds is None:
+                self._deadlines.pop(jobId, None)
+            else:
+                self._deadlines[jobId] = time.monotonic() + seconds
+
+    def jobBudget(self, jobId: str) -> Optional[float]:
+        """Seconds left before the job deadline, or None when the job has no deadline."""
+        if not jobId:
+            return None
+        with self._deadlines_lock:
+            deadline = self._deadlines.get(jobId)
+        return None if deadline is None else deadline - time.monotonic()
+
+    def _circuit_key(self, request_url: str) -> str:
+        parts = urlsplit(request_url)
+        return f'{parts.scheme}://{parts.netloc}'
+
+    def _circuit_allows(self, circuit: str) -> bool:
+        decision = self.circuit_breaker.acquire(circuit)
+        if decision != CircuitState.HALF_OPEN:
+            return decision == CircuitState.CLOSED
+
+        # This caller probes on behalf of everyone; the others keep failing fast until it reports back.
+        try:
+            response = self.transport.request(
+                'GET',
+                f'{circuit}/api/server/version',
+                timeout=self.circuit_breaker.probe_timeout,
+                verify=self.verify,
+            )
+            with response:
+                healthy = response.ok and bool(response.json().get('version'))
+            error = '' if healthy else f'Probe failed with HTTP {response.status_code}'
+        except (requests.RequestException, ValueError, AttributeError) as probe_error:
+            healthy, error = False, str(probe_error)
+        if healthy:
+            self.circuit_breaker.record_success(circuit)
+        else:
+            self.circuit_breaker.record_failure(circuit, error)
+        return healthy
+
+    def hostHealth(self) -> Dict[str, Dict[str, Any]]:
+        """Get the circuit breaker state per service host. Empty without a circuit breaker."""
+        if self.circuit_breaker is None:
+            return {}
+        return self.circuit_breaker.health()
+
+    def _start_event(self, method: str, host: str, path: str, url: str) -> Dict[str, Any]:
+        template, job_id = _describe_path(path)
+        event: Dict[str, Any] = {
+            'method': method,
+            'host': host,
+            'path': template,
+            'url': url,
+            'jobId': job_id,
+            'start': time.time(),
+            '_started': time.perf_counter(),
+        }
+        for hook in self.hooks:
+            hook.before_request(event)
+        return event
+
+    def _finish_event(self, event: Dict[str, Any], received: int = 0, error: Optional[str] = None) -> None:
+        event.setdefault('statusCode', None)
+        event.setdefault('ttfb', None)
+        event['error'] = error
+        event['bytes'] = received
+        event['total'] = time.perf_counter() - event.pop('_started')
+        for hook in self.hooks:
+            hook.after_request(event)
+
+    def _trace(self, name: str, path: str = '', attributes: Optional[Dict[str, Any]] = None) -> Any:
+        if self.tracer is None:
+            return _NO_TRACE
+        return self.tracer.span(name, jobId=_describe_path(path)[1], attributes=attributes)
+
+    def _release_response(self, response: requests.Response, received: int = 0, error: Optional[str] = None) -> None:
+        response.close()
+        event = response.__dict__.pop('_instrumentation_event', None)
+        if event is not None:
+            self._finish_event(event, received=received, error=error)
+
+    def _wait_before_retry(self, attempt: Dict[str, Any], delay: float) -> None:
+        attempt['delay'] = delay
+        self._notify_attempt(attempt)
+        time.sleep(delay)
+
+    def _notify_attempt(self, attempt: Dict[str, Any]) -> None:
+        if self.retry is not None and self.retry.on_attempt is not None:
+            self.retry.on_attempt(attempt)
 
     def _handle_response_error(self, response: requests.Response) -> Dict[str, Any]:
         error_payload: Dict[str, Any] = {
@@ -171,8 +1087,51 @@ class ScannerController:
         payload: Optional[Dict[str, Any]] = None,
         fallback: Optional[Any] = None,
         allow_no_content: bool = False,
+        idempotent: Optional[bool] = None,
     ) -> Any:
-        response = self._send_request(method, host, path, headers=headers, params=params, payload=payload)
+        if self.coalesce and method == 'GET' and idempotent is not False:
+            # Identical GETs in flight at the same time share one upstream request; each caller gets its own deep copy.
+            key = (
+                host,
+                path,
+                tuple(sorted(self._clean_params(params).items())),
+                tuple(sorted((headers or {}).items())),
+                allow_no_content,
+            )
+
+            def load() -> Tuple[Any, bool, Optional[Dict[str, Any]]]:
+                result = self._fetch_json(method, host, path, headers, params, payload, fallback, allow_no_content, idempotent)
+                return result, result is fallback, self.last_error
+
+            (result, failed, error), shared = self._flight.do(key, load)
+            if shared:
+                # last_error is per thread, so followers take the leader's outcome explicitly.
+                self.last_error = error
+            # Callers rely on getting their own fallback object back on failure (see _request_cached_json).
+            return fallback if failed else copy.deepcopy(result)
+        return self._fetch_json(method, host, path, headers, params, payload, fallback, allow_no_content, idempotent)
+
+    def _fetch_json(
+        self,
+        method: str,
+        host: str,
+        path: str,
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, Any]],
+        payload: Optional[Dict[str, Any]],
+        fallback: Optional[Any],
+        allow_no_content: bool,
+        idempotent: Optional[bool],
+    ) -> Any:
+        response = self._send_request(
+            method,
+            host,
+            path,
+            headers=headers,
+            params=params,
+            payload=payload,
+            idempotent=idempotent,
+        )
         if response is None:
             return fallback if fallback is not None else self.last_error
 
@@ -197,6 +1156,35 @@ class ScannerController:
                 raise ScannerServiceError(str(error), status_code=response.status_code, details=error_payload)
             return fallback if fallback is not None else error_payload
 
+    def _request_cached_json(
+        self,
+        host: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        fallback: Optional[Any] = None,
+    ) -> Any:
+        if self.cache_ttl <= 0:
+            return self._request_json('GET', host, path, params=params, fallback=fallback)
+
+        def load() -> Tuple[Tuple[Any, bool, Optional[Dict[str, Any]]], bool]:
+            response = self._request_json('GET', host, path, params=params, fallback=fallback)
+            # _request_json hands back the fallback object itself on failure, so only real payloads are cached.
+            failed = response is fallback
+            return (response, failed, self.last_error), not failed
+
+        key = (host, path, tuple(sorted(self._clean_params(params).items())))
+        response, failed, error = self._cache.get(key, load)
+        # Cache hits and followers of a shared refresh did not run the request in this thread.
+        self.last_error = error
+        return fallback if failed else response
+
+    def invalidate(self, host: Optional[str] = None) -> None:
+        """Drop cached getDevices/getServerInfo results, for one host or for all hosts."""
+        if host is None:
+            self._cache.invalidate()
+        else:
+            self._cache.invalidate(lambda key: key[0] == host)
+
     def _request_content(
         self,
         method: str,
@@ -207,6 +1195,7 @@ class ScannerController:
         payload: Optional[Dict[str, Any]] = None,
         allow_no_content: bool = False,
         absolute_url: Optional[str] = None,
+        idempotent: Optional[bool] = None,
     ) -> Optional[bytes]:
         response = self._send_request(
             method,
@@ -216,6 +1205,7 @@ class ScannerController:
             params=params,
             payload=payload,
             absolute_url=absolute_url,
+            idempotent=idempotent,
         )
         if response is None:
             return None
@@ -229,6 +1219,156 @@ class ScannerController:
             return None
         return response.content
 
+    def _open_content_stream(
+        self,
+        method: str,
+        host: str,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        payload: Optional[Dict[str, Any]] = None,
+        allow_no_content: bool = False,
+        absolute_url: Optional[str] = None,
+        idempotent: Optional[bool] = None,
+    ) -> Optional[requests.Response]:
+        response = self._send_request(
+            method,
+            host,
+            path,
+            headers=headers,
+            params=params,
+            payload=payload,
+            stream=True,
+            absolute_url=absolute_url,
+            idempotent=idempotent,
+        )
+        if response is None:
+            return None
+
+        if response.status_code == 204 and allow_no_content:
+            self._release_response(response)
+            self.last_error = None
+            return None
+
+        if not response.ok:
+            try:
+                self._handle_response_error(response)
+            finally:
+                self._release_response(response, received=len(response.content or b''))
+            return None
+        return response
+
+    def _copy_response(
+        self,
+        response: requests.Response,
+        output: Any,
+        chunk_size: int,
+        timing: Optional[Dict[str, float]] = None,
+    ) -> Optional[int]:
+        written = 0
+        failure: Optional[str] = None
+        try:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if chunk:
+                    if timing is None:
+                        output.write(chunk)
+                    else:
+                        # Only the write calls are timed; reading the body is the request's time.
+                        started = time.perf_counter()
+                        output.write(chunk)
+                        timing['write'] += time.perf_counter() - started
+                    written += len(chunk)
+        except requests.RequestException as error:
+            failure = str(error)
+            payload = {'error': failure}
+            self.last_error = payload
+            if self.raise_errors:
+                raise ScannerServiceError(failure, details=payload)
+            return None
+        finally:
+            self._release_response(response, received=written, error=failure)
+        return written
+
+    def _request_to_writer(
+        self,
+        method: str,
+        host: str,
+        path: str,
+        output: Any,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        allow_no_content: bool = False,
+        absolute_url: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        idempotent: Optional[bool] = None,
+    ) -> Optional[int]:
+        response = self._open_content_stream(
+            method,
+            host,
+            path,
+            headers=headers,
+            params=params,
+            allow_no_content=allow_no_content,
+            absolute_url=absolute_url,
+            idempotent=idempotent,
+        )
+        if response is None:
+            return None
+        return self._copy_response(response, output, chunk_size)
+
+    def _request_to_file(
+        self,
+        method: str,
+        host: str,
+        path: str,
+        directory: str,
+        prefix: str,
+        content_type: str,
+        filename: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        allow_no_content: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        idempotent: Optional[bool] = None,
+    ) -> str:
+        response = self._open_content_stream(
+            method,
+            host,
+            path,
+            headers=headers,
+            params=params,
+            allow_no_content=allow_no_content,
+            idempotent=idempotent,
+        )
+        if response is None:
+            return ''
+
+        os.makedirs(directory, exist_ok=True)
+        resolved_filename = filename or self._unique_filename(prefix, content_type)
+        path_to_file = os.path.join(directory, resolved_filename)
+        # Stream into a hidden temporary file so a failed download never leaves a partial page behind.
+        temporary_path = os.path.join(directory, f'.{resolved_filename}.part')
+        written: Optional[int] = None
+        try:
+            output_stream = open(temporary_path, 'wb')
+        except OSError:
+            self._release_response(response)
+            raise
+        timing = {'write': 0.0} if self.tracer is not None else None
+        try:
+            with output_stream:
+                written = self._copy_response(response, output_stream, chunk_size, timing)
+            if written:
+                # Disk writes interleave with the network reads, so the span covers the commit of the
+                # finished file and carries the time spent in write calls as ``writeSeconds``.
+                attributes = {'path': path_to_file, 'bytes': written, 'writeSeconds': timing['write'] if timing else 0.0}
+                with self._trace('file.write', path, attributes):
+                    os.replace(temporary_path, path_to_file)
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+        return resolved_filename if written else ''
+
     def _request_success(
         self,
         method: str,
@@ -250,15 +1390,6 @@ class ScannerController:
         self._handle_response_error(response)
         return False
 
-    def _resolve_extension(self, content_type: str) -> str:
-        extension_map = {
-            'image/jpeg': '.jpg',
-            'image/png': '.png',
-            'image/tiff': '.tiff',
-            'application/pdf': '.pdf',
-        }
-        return extension_map.get(content_type, '.bin')
-
     def _write_content_to_file(
         self,
         content: Optional[bytes],
@@ -271,11 +1402,11 @@ class ScannerController:
             return ''
 
         os.makedirs(directory, exist_ok=True)
-        extension = self._resolve_extension(content_type)
-        resolved_filename = filename or f"{prefix}_{int(time.time() * 1000)}{extension}"
+        resolved_filename = filename or self._unique_filename(prefix, content_type)
         path_to_file = os.path.join(directory, resolved_filename)
-        with open(path_to_file, 'wb') as output_stream:
-            output_stream.write(content)
+        with self._trace('file.write', attributes={'path': path_to_file, 'bytes': len(content)}):
+            with open(path_to_file, 'wb') as output_stream:
+                output_stream.write(content)
         return resolved_filename
 
     def getServerSettings(self, host: str) -> Dict[str, Any]:
@@ -296,16 +1427,20 @@ class ScannerController:
         return response if isinstance(response, dict) else {}
 
     def getServerInfo(self, host: str) -> Dict[str, Any]:
-        """Get version info of the TWAIN server."""
-        response = self._request_json('GET', host, 'server/version', fallback={"version": "", "compatible": False})
+        """Get version info of the TWAIN server. Cached for ``cache_ttl`` seconds when enabled."""
+        response = self._request_cached_json(host, 'server/version', fallback={"version": "", "compatible": False})
         return response if isinstance(response, dict) else {"version": "", "compatible": False}
 
     def getDevices(self, host: str, scannerType: Optional[int] = None) -> List[Any]:
-        """Get a list of available scanners."""
+        """Get a list of available scanners. Cached for ``cache_ttl`` seconds when enabled."""
         params = {'type': scannerType} if scannerType is not None else None
-        response = self._request_json('GET', host, 'device/scanners', params=params, fallback=[])
+        response = self._request_cached_json(host, 'device/scanners', params=params, fallback=[])
         return response if isinstance(response, list) else []
 
+    def listDevices(self, host: str, scannerType: Optional[int] = None) -> List['Device']:
+        """Get the available scanners as Device models. getDevices returns the full payloads as dicts."""
+        return Device.wrap_all(device for device in self.getDevices(host, scannerType) if isinstance(device, dict))
+
     def createJob(self, host: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new scan job."""
         payload = dict(parameters)
@@ -318,13 +1453,23 @@ class ScannerController:
             payload=payload,
             fallback={},
         )
+        if isinstance(response, dict) and response.get('jobuid'):
+            if self.job_deadline is not None:
+                self.setJobDeadline(response['jobuid'], self.job_deadline)
+            if self.tracer is not None:
+                self.tracer.start_job(response['jobuid'], {'host': host, 'device': payload.get('device', '')})
         return response if isinstance(response, dict) else {}
 
     def deleteJob(self, host: str, jobId: str) -> bool:
         """Delete a scan job."""
         if not jobId:
             return False
-        return self._request_success('DELETE', host, f'device/scanners/jobs/{jobId}', expected_status_codes=[204])
+        try:
+            return self._request_success('DELETE', host, f'device/scanners/jobs/{jobId}', expected_status_codes=[204])
+        finally:
+            self.setJobDeadline(jobId, None)
+            if self.tracer is not None:
+                self.tracer.end_job(jobId)
 
     def updateJob(self, host: str, jobId: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Update scan job status (e.g., 'running', 'canceled')."""
@@ -343,6 +1488,59 @@ class ScannerController:
         response = self._request_json('GET', host, f'device/scanners/jobs/{jobId}', fallback={})
         return response if isinstance(response, dict) else {}
 
+    def getJob(self, host: str, jobId: str) -> Optional['Job']:
+        """Check a scan job and return it as a Job model, or None when the call failed."""
+        info = self.checkJob(host, jobId)
+        return Job.from_payload(info) if info else None
+
+    def waitForJob(
+        self,
+        host: str,
+        jobId: str,
+        timeout: Optional[float] = None,
+        minInterval: float = DEFAULT_POLL_MIN_INTERVAL,
+        maxInterval: float = DEFAULT_POLL_MAX_INTERVAL,
+        onChange: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Poll checkJob until the job is completed, faulted or canceled.
+
+        Polling starts every ``minInterval`` seconds and backs off towards ``maxInterval`` while the
+        status does not change. Returns the last job info; when ``timeout`` expires first,
+        ``last_error`` is set (or ScannerServiceError raised) and the last seen info is returned.
+        Without ``timeout``, the job deadline set with setJobDeadline applies.
+        """
+        if timeout is None:
+            timeout = self.jobBudget(jobId)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval = minInterval
+        status = None
+        info: Dict[str, Any] = {}
+        while True:
+            info = self.checkJob(host, jobId)
+            if not info and self.last_error and self.last_error.get('statusCode') == 404:
+                return info
+            if info and info.get('status') != status:
+                status = info.get('status')
+                interval = minInterval
+                if onChange is not None:
+                    onChange(info)
+            else:
+                interval = min(maxInterval, interval * DEFAULT_POLL_BACKOFF)
+            if status in TERMINAL_JOB_STATUSES:
+                return info
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    error_payload = {'message': 'Timed out waiting for job.', 'jobuid': jobId, 'status': status}
+                    self.last_error = error_payload
+                    if self.raise_errors:
+                        raise ScannerServiceError(error_payload['message'], details=error_payload)
+                    return info
+                interval = min(interval, remaining)
+            time.sleep(interval)
+
     def getImageStream(self, host: str, jobId: str, imageType: str = DEFAULT_IMAGE_TYPE) -> Optional[bytes]:
         """Get the next scanned image as a byte stream."""
         return self._request_content(
@@ -351,8 +1549,74 @@ class ScannerController:
             f'device/scanners/jobs/{jobId}/next-page',
             params={'type': imageType},
             allow_no_content=True,
+            idempotent=False,
+        )
+
+    def getImageStreamAs(
+        self,
+        host: str,
+        jobId: str,
+        accept: Sequence[str],
+        transcoder: Optional['Transcoder'] = None,
+        lossless: bool = False,
+    ) -> Optional[Tuple[str, bytes]]:
+        """
+        Get the next scanned image in the most compact format the consumer accepts.
+
+        The page is requested in an accepted wire format when there is one. Otherwise it is requested
+        in the most compact wire format and converted to ``accept[0]`` with ``transcoder``. Returns
+        ``(imageType, content)``, or None when no pages remain.
+        """
+        wire_type = negotiate_image_type(accept, lossless=lossless)
+        if wire_type not in accept and transcoder is None:
+            raise ValueError(f'A transcoder is required to deliver {accept[0]}.')
+        image_stream = self.getImageStream(host, jobId, imageType=wire_type)
+        if image_stream is None:
+            return None
+        if wire_type in accept:
+            return wire_type, image_stream
+        return accept[0], transcoder.transcode(image_stream, wire_type, accept[0])
+
+    def writeImageStream(
+        self,
+        host: str,
+        jobId: str,
+        output: Any,
+        imageType: str = DEFAULT_IMAGE_TYPE,
+        chunkSize: int = DEFAULT_CHUNK_SIZE,
+    ) -> Optional[int]:
+        """Stream the next scanned image into a writable object in chunks. Returns the byte count, or None when no pages remain."""
+        return self._request_to_writer(
+            'GET',
+            host,
+            f'device/scanners/jobs/{jobId}/next-page',
+            output,
+            params={'type': imageType},
+            allow_no_content=True,
+            idempotent=False,
+            chunk_size=chunkSize,
         )
 
+    def getImageBuffer(
+        self,
+        host: str,
+        jobId: str,
+        imageType: str = DEFAULT_IMAGE_TYPE,
+        buffer: Optional[bytearray] = None,
+        chunkSize: int = DEFAULT_CHUNK_SIZE,
+    ) -> Optional[memoryview]:
+        """
+        Read the next scanned image into ``buffer`` (a new bytearray by default) without an intermediate bytes copy.
+
+        Returns a memoryview of the filled part of the buffer, or None when no pages remain.
+        Release the view before reusing or resizing the buffer.
+        """
+        writer = _BufferWriter(buffer if buffer is not None else bytearray())
+        written = self.writeImageStream(host, jobId, writer, imageType=imageType, chunkSize=chunkSize)
+        if written is None:
+            return None
+        return memoryview(writer.buffer)[:writer.size]
+
     def getImageFile(
         self,
         host: str,
@@ -360,10 +1624,22 @@ class ScannerController:
         directory: str,
         imageType: str = DEFAULT_IMAGE_TYPE,
         filename: Optional[str] = None,
+        chunkSize: int = DEFAULT_CHUNK_SIZE,
     ) -> str:
-        """Download a single scanned image and save it to disk."""
-        content = self.getImageStream(host, jobId, imageType=imageType)
-        return self._write_content_to_file(content, directory, 'image', imageType, filename=filename)
+        """Download a single scanned image and stream it to disk."""
+        return self._request_to_file(
+            'GET',
+            host,
+            f'device/scanners/jobs/{jobId}/next-page',
+            directory,
+            'image',
+            imageType,
+            filename=filename,
+            params={'type': imageType},
+            allow_no_content=True,
+            idempotent=False,
+            chunk_size=chunkSize,
+        )
 
     def getImageFiles(
         self,
@@ -371,25 +1647,88 @@ class ScannerController:
         jobId: str,
         directory: str,
         imageType: str = DEFAULT_IMAGE_TYPE,
+        chunkSize: int = DEFAULT_CHUNK_SIZE,
+        writers: int = 0,
+        fsync: bool = False,
     ) -> List[str]:
-        """Download all scanned images of a job as files."""
-        images = []
-        while True:
-            filename = self.getImageFile(host, jobId, directory, imageType=imageType)
-            if not filename:
-                break
-            images.append(filename)
-        return images
+        """
+        Download all scanned images of a job as files.
+
+        With ``writers`` > 0 pages are fetched on the calling thread and written by a PageWriter with
+        that many I/O threads, named ``image_{jobId}_{sequence}``. ``fsync`` forces each page to disk
+        in batches before it is renamed into place.
+        """
+        if writers <= 0:
+            return list(self.iterImageFiles(host, jobId, directory, imageType=imageType, chunkSize=chunkSize))
+
+        page_writer = PageWriter(
+            directory,
+            prefix=f'image_{jobId}',
+            extension=self._resolve_extension(imageType),
+            max_workers=writers,
+            fsync=fsync,
+        )
+        with page_writer:
+            for image_stream in self.iterImageStreams(host, jobId, imageType=imageType):
+                page_writer.submit(image_stream)
+        return [os.path.basename(path) for path in page_writer.paths]
+
+    def iterImageFiles(
+        self,
+        host: str,
+        jobId: str,
+        directory: str,
+        imageType: str = DEFAULT_IMAGE_TYPE,
+        chunkSize: int = DEFAULT_CHUNK_SIZE,
+        prefetch: int = 0,
+    ) -> Iterator[str]:
+        """
+        Yield the filename of each scanned image as soon as it has been saved to disk.
+
+        With ``prefetch`` > 0 the next pages are downloaded on a background thread while the
+        caller works on the current one; at most ``prefetch`` finished pages wait in the queue.
+        A PrefetchIterator is returned then. Pages saved ahead are already on disk: if you stop
+        early, call its close() and read the filenames you did not receive from ``leftover``.
+        """
+        def fetch() -> str:
+            return self.getImageFile(host, jobId, directory, imageType=imageType, chunkSize=chunkSize)
+
+        if prefetch > 0:
+            return PrefetchIterator(fetch, prefetch, lambda filename: not filename, controller=self)
+        return self._iter_pages(fetch, lambda filename: not filename)
 
     def getImageStreams(self, host: str, jobId: str, imageType: str = DEFAULT_IMAGE_TYPE) -> List[bytes]:
         """Get all scanned images as byte streams."""
-        streams = []
+        return list(self.iterImageStreams(host, jobId, imageType=imageType))
+
+    def iterImageStreams(
+        self,
+        host: str,
+        jobId: str,
+        imageType: str = DEFAULT_IMAGE_TYPE,
+        prefetch: int = 0,
+    ) -> Iterator[bytes]:
+        """
+        Yield each scanned image as soon as it is fetched.
+
+        With ``prefetch`` > 0 the next ``next-page`` request runs on a background thread while the
+        caller processes the current page; at most ``prefetch`` pages are buffered ahead. A
+        PrefetchIterator is returned then. ``next-page`` removes pages from the service, so if you
+        stop early, call its close() and read the pages you did not receive from ``leftover``.
+        """
+        def fetch() -> Optional[bytes]:
+            return self.getImageStream(host, jobId, imageType=imageType)
+
+        if prefetch > 0:
+            return PrefetchIterator(fetch, prefetch, lambda image_stream: image_stream is None, controller=self)
+        return self._iter_pages(fetch, lambda image_stream: image_stream is None)
+
+    def _iter_pages(self, fetch: Callable[[], Any], is_done: Callable[[Any], bool]) -> Iterator[Any]:
         while True:
-            image_stream = self.getImageStream(host, jobId, imageType=imageType)
-            if image_stream is None:
+            result = fetch()
+            if is_done(result):
                 break
-            streams.append(image_stream)
-        return streams
+            yield result
 
     def getImageInfo(self, host: str, jobId: str) -> Dict[str, Any]:
         """Get information of the next scanned page."""
@@ -399,11 +1738,17 @@ class ScannerController:
             f'device/scanners/jobs/{jobId}/next-page-info',
             fallback={},
             allow_no_content=True,
+            idempotent=False,
         )
         if isinstance(response, list):
             return response[0] if response else {}
         return response if isinstance(response, dict) else {}
 
+    def getPageInfo(self, host: str, jobId: str) -> Optional['PageInfo']:
+        """Get the next scanned page as a PageInfo model, or None when there are no more pages."""
+        info = self.getImageInfo(host, jobId)
+        return PageInfo.from_payload(info) if info else None
+
     def getScannerCapabilities(self, host: str, jobId: str, caps: Optional[List[int]] = None) -> Any:
         """Get scanner capabilities (e.g., DPI, color mode)."""
         params = {'caps': caps} if caps else None
@@ -453,6 +1798,11 @@ class ScannerController:
         )
         return response if isinstance(response, dict) else {}
 
+    def getDocument(self, host: str, docId: str, password: str = '') -> Optional['Document']:
+        """Get document metadata as a Document model, or None when the call failed."""
+        info = self.getDocumentInfo(host, docId, password)
+        return Document.from_payload(info) if info else None
+
     def deleteDocument(self, host: str, docId: str, password: str = '') -> bool:
         """Delete an existing document."""
         return self._request_success(
@@ -471,12 +1821,23 @@ class ScannerController:
         parameters: Optional[Dict[str, Any]] = None,
         documentPassword: str = '',
         filename: Optional[str] = None,
+        chunkSize: int = DEFAULT_CHUNK_SIZE,
     ) -> str:
-        """Download a document (PDF) and save it to disk."""
+        """Download a document (PDF) and stream it to disk."""
         request_parameters = dict(parameters or {})
         output_type = request_parameters.get('type', DEFAULT_DOCUMENT_TYPE)
-        content = self.getDocumentStream(host, docId, parameters=request_parameters, documentPassword=documentPassword)
-        return self._write_content_to_file(content, directory, 'document', output_type, filename=filename)
+        return self._request_to_file(
+            'GET',
+            host,
+            f'storage/documents/{docId}/content',
+            directory,
+            'document',
+            output_type,
+            filename=filename,
+            headers=self._make_headers(content_type=None, document_password=documentPassword),
+            params=request_parameters,
+            chunk_size=chunkSize,
+        )
 
     def getDocumentStream(
         self,
@@ -494,6 +1855,49 @@ class ScannerController:
             params=parameters,
         )
 
+    def writeDocumentStream(
+        self,
+        host: str,
+        docId: str,
+        output: Any,
+        parameters: Optional[Dict[str, Any]] = None,
+        documentPassword: str = '',
+        chunkSize: int = DEFAULT_CHUNK_SIZE,
+    ) -> Optional[int]:
+        """Stream document content into a writable object in chunks. Returns the byte count, or None on failure."""
+        return self._request_to_writer(
+            'GET',
+            host,
+            f'storage/documents/{docId}/content',
+            output,
+            headers=self._make_headers(content_type=None, document_password=documentPassword),
+            params=parameters,
+            chunk_size=chunkSize,
+        )
+
+    def getDocumentBuffer(
+        self,
+        host: str,
+        docId: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        documentPassword: str = '',
+        buffer: Optional[bytearray] = None,
+        chunkSize: int = DEFAULT_CHUNK_SIZE,
+    ) -> Optional[memoryview]:
+        """Read document content into ``buffer`` and return a memoryview of it, or None on failure."""
+        writer = _BufferWriter(buffer if buffer is not None else bytearray())
+        written = self.writeDocumentStream(
+            host,
+            docId,
+            writer,
+            parameters=parameters,
+            documentPassword=documentPassword,
+            chunkSize=chunkSize,
+        )
+        if written is None:
+            return None
+        return memoryview(writer.buffer)[:writer.size]
+
     def insertPage(self, host: str, docId: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Insert a new page into an existing document."""
         payload = dict(parameters)
@@ -508,6 +1912,72 @@ class ScannerController:
         )
         return response if isinstance(response, dict) else {}
 
+    def scanToDocument(
+        self,
+        host: str,
+        jobId: str,
+        docParams: Optional[Dict[str, Any]] = None,
+        docId: str = '',
+        prefetch: int = 2,
+    ) -> Dict[str, Any]:
+        """
+        Insert every page of a job into a stored document and return the document info.
+
+        A new document is created from ``docParams`` unless ``docId`` is given. Page info is
+        fetched from ``next-page-info`` up to ``prefetch`` pages ahead on a background thread
+        while pages are inserted in scan order. Returns an empty dict on failure, with
+        ``last_error`` describing it. A document created by this call is deleted again when
+        the call fails, so no half-built document is left on the service.
+        """
+        parameters = dict(docParams or {})
+        password = parameters.get('password', '')
+        created = not docId
+        if created:
+            docId = self.createDocument(host, parameters).get('uid', '')
+            if not docId:
+                return {}
+
+        def fetch() -> Dict[str, Any]:
+            info = self.getImageInfo(host, jobId)
+            if not info and self.last_error is not None:
+                # Runs on the prefetch thread: the failure travels to the consumer with the result.
+                raise _PageLookupError(self.last_error)
+            return info
+
+        pages = PrefetchIterator(fetch, max(prefetch, 1), lambda info: not info.get('url'))
+        try:
+            for info in pages:
+                inserted = self.insertPage(host, docId, {'password': password, 'source': info['url']})
+                if not inserted:
+                    # The document is discarded, so there is no need to wait for a lookup in flight.
+                    pages.close(wait=False)
+                    self._discard_document(host, docId, password, created)
+                    return {}
+        except _PageLookupError as failure:
+            self._discard_document(host, docId, password, created)
+            self.last_error = failure.error
+            return {}
+        except BaseException:
+            pages.close(wait=False)
+            self._discard_document(host, docId, password, created)
+            raise
+
+        document = self.getDocumentInfo(host, docId, password=password)
+        if document:
+            document.setdefault('uid', docId)
+        return document
+
+    def _discard_document(self, host: str, docId: str, password: str, created: bool) -> None:
+        # Remove a document scanToDocument created before failing, keeping the original error.
+        if not created:
+            return
+        error = self.last_error
+        try:
+            self.deleteDocument(host, docId, password=password)
+        except ScannerServiceError:
+            pass
+        self.last_error = error
+
     def deletePage(self, host: str, docId: str, pageId: str, password: str = '') -> bool:
         """Delete a page from a document."""
         return self._request_success(
@@ -552,13 +2022,68 @@ class ScannerController:
         return self._request_content('GET', '', '', allow_no_content=True, absolute_url=url)
 
 
+from .aio import AsyncScannerController
+from .orchestrator import ScanJobResult, ScanOrchestrator, ScanPage
+from .pool import ScannerServicePool, ServiceHost
+from .registry import DeviceRegistry, RegistryDiff, get_scanner_id
+from .watch import JobWatcher
+from .metrics import MetricsCollector
+from .tracing import FileSpanExporter, InMemorySpanExporter, Span, Tracer
+from .writer import PageWriter
+from .session import ScanSession
+from .processing import PageProcessor, ProcessedPage
+from .transcode import LOSSLESS_IMAGE_TYPES, WIRE_IMAGE_TYPES, Transcoder, negotiate_image_type
+from .transport import HTTPXTransport
+from .models import Device, Document, Job, PageInfo
+
+
 __all__ = [
+    'AsyncScannerController',
+    'BufferPool',
+    'CircuitBreaker',
+    'CircuitState',
     'DEFAULT_CHUNK_SIZE',
     'DEFAULT_DOCUMENT_TYPE',
     'DEFAULT_IMAGE_TYPE',
+    'DEFAULT_POOL_CONNECTIONS',
+    'DEFAULT_POOL_MAXSIZE',
     'DEFAULT_TIMEOUT',
+    'DEFAULT_TIMEOUT_PROFILES',
+    'Device',
+    'DeviceRegistry',
+    'Document',
+    'FileSpanExporter',
+    'HTTPXTransport',
+    'InMemorySpanExporter',
+    'Job',
     'JobStatus',
+    'JobWatcher',
+    'LOSSLESS_IMAGE_TYPES',
+    'MetricsCollector',
+    'PageInfo',
+    'PageProcessor',
+    'PageWriter',
+    'PrefetchIterator',
+    'ProcessedPage',
+    'RegistryDiff',
+    'RequestsTransport',
+    'RequestHook',
+    'RetryPolicy',
+    'ScanJobResult',
+    'ScanOrchestrator',
+    'ScanPage',
+    'ScanSession',
     'ScannerController',
+    'ScannerServicePool',
     'ScannerServiceError',
     'ScannerType',
+    'ServiceHost',
+    'Span',
+    'TERMINAL_JOB_STATUSES',
+    'Tracer',
+    'Transcoder',
+    'Transport',
+    'WIRE_IMAGE_TYPES',
+    'get_scanner_id',
+    'negotiate_image_type',
 ]
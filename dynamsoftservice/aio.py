@@ -0,0 +1,714 @@
+import contextvars
+import json
+import os
+from collections.abc import Awaitable
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from . import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_DOCUMENT_TYPE,
+    DEFAULT_IMAGE_TYPE,
+    DEFAULT_TIMEOUT,
+    ScannerServiceError,
+    _ControllerBase,
+)
+
+
+DEFAULT_POOL_LIMIT = 100
+DEFAULT_POOL_LIMIT_PER_HOST = 0
+
+# Imported on first use, so importing dynamsoftservice does not pay for aiohttp and asyncio.
+aiohttp: Any = None
+# aiohttp's ClientTimeout raises asyncio.TimeoutError, which is not the built-in TimeoutError before Python 3.11.
+_TRANSPORT_ERRORS: Tuple[type, ...] = ()
+
+
+def _load_aiohttp() -> bool:
+    global aiohttp, _TRANSPORT_ERRORS
+    if aiohttp is None:
+        try:
+            import aiohttp as module
+        except ImportError:
+            return False
+        import asyncio
+
+        _TRANSPORT_ERRORS = (module.ClientError, asyncio.TimeoutError)
+        aiohttp = module
+    return True
+
+
+class AsyncScannerController(_ControllerBase):
+    """
+    An asyncio counterpart of ScannerController backed by a pooled aiohttp session.
+
+    Every public method mirrors the synchronous API and must be awaited. Errors follow the same
+    rules: failed calls return the same fallback values and update ``last_error``, or raise
+    ``ScannerServiceError`` when ``raise_errors`` is enabled. ``last_error`` is kept per task, as
+    the synchronous controller keeps it per thread.
+    """
+
+    def __init__(
+        self,
+        timeout: int = DEFAULT_TIMEOUT,
+        verify: bool = True,
+        session: Optional['aiohttp.ClientSession'] = None,
+        raise_errors: bool = False,
+        limit: int = DEFAULT_POOL_LIMIT,
+        limit_per_host: int = DEFAULT_POOL_LIMIT_PER_HOST,
+    ) -> None:
+        if not _load_aiohttp():
+            raise ImportError(
+                'AsyncScannerController requires aiohttp. Install it with "pip install twain-wia-sane-scanner[async]".'
+            )
+        self.timeout = timeout
+        self.verify = verify
+        self.raise_errors = raise_errors
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.session = session
+        self._owns_session = session is None
+        self._last_error: 'contextvars.ContextVar[Optional[Dict[str, Any]]]' = contextvars.ContextVar(
+            'last_error', default=None
+        )
+
+    @property
+    def last_error(self) -> Optional[Dict[str, Any]]:
+        """
+        The normalized error payload of the last failed call made by the current task, or None.
+
+        It is kept per asyncio task, so tasks sharing a controller never see each other's errors.
+        A task started with ``asyncio.gather`` or ``create_task`` begins with its parent's value.
+        """
+        return self._last_error.get()
+
+    @last_error.setter
+    def last_error(self, value: Optional[Dict[str, Any]]) -> None:
+        self._last_error.set(value)
+
+    async def __aenter__(self) -> 'AsyncScannerController':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session if this controller created it."""
+        if self.session is not None and self._owns_session:
+            await self.session.close()
+            self.session = None
+
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        # The session is created lazily so that it binds to the running event loop.
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host)
+            self.session = aiohttp.ClientSession(connector=connector)
+            self._owns_session = True
+        return self.session
+
+    def _set_transport_error(self, error: BaseException) -> None:
+        payload = {'error': str(error) or error.__class__.__name__}
+        self.last_error = payload
+        if self.raise_errors:
+            raise ScannerServiceError(payload['error'], details=payload)
+
+    async def _send_request(
+        self,
+        method: str,
+        host: str,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        payload: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int] = None,
+        absolute_url: Optional[str] = None,
+    ) -> Optional['aiohttp.ClientResponse']:
+        request_url = absolute_url or self._build_url(host, path)
+        try:
+            response = await self._get_session().request(
+                method,
+                request_url,
+                headers=headers,
+                params=self._clean_params(params),
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=timeout or self.timeout),
+                ssl=None if self.verify else False,
+            )
+            self.last_error = None
+            return response
+        except _TRANSPORT_ERRORS as error:
+            self._set_transport_error(error)
+        return None
+
+    async def _handle_response_error(self, response: 'aiohttp.ClientResponse') -> Dict[str, Any]:
+        error_payload: Dict[str, Any] = {
+            'statusCode': response.status,
+            'message': response.reason or 'Request failed.',
+        }
+        text = await response.text()
+        try:
+            data = json.loads(text)
+            if isinstance(data, dict):
+                error_payload.update(data)
+            else:
+                error_payload['error'] = data
+        except ValueError:
+            if text:
+                error_payload['error'] = text
+                error_payload['message'] = text
+
+        self.last_error = error_payload
+        if self.raise_errors:
+            raise ScannerServiceError(
+                error_payload.get('message', 'Request failed.'),
+                status_code=response.status,
+                details=error_payload,
+            )
+        return error_payload
+
+    async def _request_json(
+        self,
+        method: str,
+        host: str,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        payload: Optional[Dict[str, Any]] = None,
+        fallback: Optional[Any] = None,
+        allow_no_content: bool = False,
+    ) -> Any:
+        response = await self._send_request(method, host, path, headers=headers, params=params, payload=payload)
+        if response is None:
+            return fallback if fallback is not None else self.last_error
+
+        async with response:
+            if response.status == 204 and allow_no_content:
+                self.last_error = None
+                return fallback
+
+            if not response.ok:
+                error_payload = await self._handle_response_error(response)
+                return fallback if fallback is not None else error_payload
+
+            try:
+                text = await response.text()
+            except _TRANSPORT_ERRORS as error:
+                self._set_transport_error(error)
+                return fallback if fallback is not None else self.last_error
+
+            try:
+                return json.loads(text)
+            except ValueError as error:
+                error_payload = {
+                    'statusCode': response.status,
+                    'message': str(error),
+                    'error': text,
+                }
+                self.last_error = error_payload
+                if self.raise_errors:
+                    raise ScannerServiceError(str(error), status_code=response.status, details=error_payload)
+                return fallback if fallback is not None else error_payload
+
+    async def _open_content_stream(
+        self,
+        method: str,
+        host: str,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        allow_no_content: bool = False,
+        absolute_url: Optional[str] = None,
+    ) -> Optional['aiohttp.ClientResponse']:
+        response = await self._send_request(
+            method,
+            host,
+            path,
+            headers=headers,
+            params=params,
+            absolute_url=absolute_url,
+        )
+        if response is None:
+            return None
+
+        if response.status == 204 and allow_no_content:
+            response.release()
+            self.last_error = None
+            return None
+
+        if not response.ok:
+            try:
+                await self._handle_response_error(response)
+            finally:
+                response.release()
+            return None
+        return response
+
+    async def _copy_response(self, response: 'aiohttp.ClientResponse', output: Any, chunk_size: int) -> Optional[int]:
+        written = 0
+        try:
+            async for chunk in response.content.iter_chunked(chunk_size):
+                result = output.write(chunk)
+                if isinstance(result, Awaitable):
+                    await result
+                written += len(chunk)
+        except _TRANSPORT_ERRORS as error:
+            self._set_transport_error(error)
+            return None
+        finally:
+            response.release()
+        return written
+
+    async def _request_content(
+        self,
+        method: str,
+        host: str,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        allow_no_content: bool = False,
+        absolute_url: Optional[str] = None,
+    ) -> Optional[bytes]:
+        response = await self._open_content_stream(
+            method,
+            host,
+            path,
+            headers=headers,
+            params=params,
+            allow_no_content=allow_no_content,
+            absolute_url=absolute_url,
+        )
+        if response is None:
+            return None
+        try:
+            return await response.read()
+        except _TRANSPORT_ERRORS as error:
+            self._set_transport_error(error)
+            return None
+        finally:
+            response.release()
+
+    async def _request_to_writer(
+        self,
+        method: str,
+        host: str,
+        path: str,
+        output: Any,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        allow_no_content: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Optional[int]:
+        response = await self._open_content_stream(
+            method,
+            host,
+            path,
+            headers=headers,
+            params=params,
+            allow_no_content=allow_no_content,
+        )
+        if response is None:
+            return None
+        return await self._copy_response(response, output, chunk_size)
+
+    async def _request_to_file(
+        self,
+        method: str,
+        host: str,
+        path: str,
+        directory: str,
+        prefix: str,
+        content_type: str,
+        filename: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        allow_no_content: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> str:
+        response = await self._open_content_stream(
+            method,
+            host,
+            path,
+            headers=headers,
+            params=params,
+            allow_no_content=allow_no_content,
+        )
+        if response is None:
+            return ''
+
+        os.makedirs(directory, exist_ok=True)
+        resolved_filename = filename or self._unique_filename(prefix, content_type)
+        path_to_file = os.path.join(directory, resolved_filename)
+        temporary_path = os.path.join(directory, f'.{resolved_filename}.part')
+        written: Optional[int] = None
+        try:
+            with open(temporary_path, 'wb') as output_stream:
+                written = await self._copy_response(response, output_stream, chunk_size)
+            if written:
+                os.replace(temporary_path, path_to_file)
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+        return resolved_filename if written else ''
+
+    async def _request_success(
+        self,
+        method: str,
+        host: str,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        payload: Optional[Dict[str, Any]] = None,
+        expected_status_codes: Optional[List[int]] = None,
+    ) -> bool:
+        expected = expected_status_codes or [200, 204]
+        response = await self._send_request(method, host, path, headers=headers, params=params, payload=payload)
+        if response is None:
+            return False
+        async with response:
+            if response.status in expected:
+                self.last_error = None
+                return True
+
+            await self._handle_response_error(response)
+            return False
+
+    async def getServerSettings(self, host: str) -> Dict[str, Any]:
+        """Get Dynamic Web TWAIN Service runtime settings."""
+        response = await self._request_json('GET', host, 'server', fallback={})
+        return response if isinstance(response, dict) else {}
+
+    async def updateServerSettings(self, host: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Update Dynamic Web TWAIN Service runtime settings."""
+        response = await self._request_json(
+            'PATCH',
+            host,
+            'server',
+            headers=self._make_headers(),
+            payload=parameters,
+            fallback={},
+        )
+        return response if isinstance(response, dict) else {}
+
+    async def getServerInfo(self, host: str) -> Dict[str, Any]:
+        """Get version info of the TWAIN server."""
+        response = await self._request_json('GET', host, 'server/version', fallback={"version": "", "compatible": False})
+        return response if isinstance(response, dict) else {"version": "", "compatible": False}
+
+    async def getDevices(self, host: str, scannerType: Optional[int] = None) -> List[Any]:
+        """Get a list of available scanners."""
+        params = {'type': scannerType} if scannerType is not None else None
+        response = await self._request_json('GET', host, 'device/scanners', params=params, fallback=[])
+        return response if isinstance(response, list) else []
+
+    async def createJob(self, host: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a new scan job."""
+        payload = dict(parameters)
+        product_key = payload.pop('license', '')
+        response = await self._request_json(
+            'POST',
+            host,
+            'device/scanners/jobs',
+            headers=self._make_headers(product_key=product_key),
+            payload=payload,
+            fallback={},
+        )
+        return response if isinstance(response, dict) else {}
+
+    async def deleteJob(self, host: str, jobId: str) -> bool:
+        """Delete a scan job."""
+        if not jobId:
+            return False
+        return await self._request_success('DELETE', host, f'device/scanners/jobs/{jobId}', expected_status_codes=[204])
+
+    async def updateJob(self, host: str, jobId: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Update scan job status (e.g., 'running', 'canceled')."""
+        response = await self._request_json(
+            'PATCH',
+            host,
+            f'device/scanners/jobs/{jobId}',
+            headers=self._make_headers(),
+            payload=parameters,
+            fallback={},
+        )
+        return response if isinstance(response, dict) else {}
+
+    async def checkJob(self, host: str, jobId: str) -> Dict[str, Any]:
+        """Check the status of an existing scan job."""
+        response = await self._request_json('GET', host, f'device/scanners/jobs/{jobId}', fallback={})
+        return response if isinstance(response, dict) else {}
+
+    async def getImageStream(self, host: str, jobId: str, imageType: str = DEFAULT_IMAGE_TYPE) -> Optional[bytes]:
+        """Get the next scanned image as a byte stream."""
+        return await self._request_content(
+            'GET',
+            host,
+            f'device/scanners/jobs/{jobId}/next-page',
+            params={'type': imageType},
+            allow_no_content=True,
+        )
+
+    async def writeImageStream(
+        self,
+        host: str,
+        jobId: str,
+        output: Any,
+        imageType: str = DEFAULT_IMAGE_TYPE,
+        chunkSize: int = DEFAULT_CHUNK_SIZE,
+    ) -> Optional[int]:
+        """Stream the next scanned image into a writable object. ``output.write`` may be a coroutine function."""
+        return await self._request_to_writer(
+            'GET',
+            host,
+            f'device/scanners/jobs/{jobId}/next-page',
+            output,
+            params={'type': imageType},
+            allow_no_content=True,
+            chunk_size=chunkSize,
+        )
+
+    async def getImageFile(
+        self,
+        host: str,
+        jobId: str,
+        directory: str,
+        imageType: str = DEFAULT_IMAGE_TYPE,
+        filename: Optional[str] = None,
+        chunkSize: int = DEFAULT_CHUNK_SIZE,
+    ) -> str:
+        """Download a single scanned image and stream it to disk."""
+        return await self._request_to_file(
+            'GET',
+            host,
+            f'device/scanners/jobs/{jobId}/next-page',
+            directory,
+            'image',
+            imageType,
+            filename=filename,
+            params={'type': imageType},
+            allow_no_content=True,
+            chunk_size=chunkSize,
+        )
+
+    async def getImageFiles(
+        self,
+        host: str,
+        jobId: str,
+        directory: str,
+        imageType: str = DEFAULT_IMAGE_TYPE,
+        chunkSize: int = DEFAULT_CHUNK_SIZE,
+    ) -> List[str]:
+        """Download all scanned images of a job as files."""
+        images = []
+        while True:
+            filename = await self.getImageFile(host, jobId, directory, imageType=imageType, chunkSize=chunkSize)
+            if not filename:
+                break
+            images.append(filename)
+        return images
+
+    async def iterImageStreams(self, host: str, jobId: str, imageType: str = DEFAULT_IMAGE_TYPE) -> AsyncIterator[bytes]:
+        """Yield each scanned image as soon as it is fetched (``async for page in ...``)."""
+        while True:
+            image_stream = await self.getImageStream(host, jobId, imageType=imageType)
+            if image_stream is None:
+                break
+            yield image_stream
+
+    async def getImageStreams(self, host: str, jobId: str, imageType: str = DEFAULT_IMAGE_TYPE) -> List[bytes]:
+        """Get all scanned images as byte streams."""
+        return [image_stream async for image_stream in self.iterImageStreams(host, jobId, imageType=imageType)]
+
+    async def getImageInfo(self, host: str, jobId: str) -> Dict[str, Any]:
+        """Get information of the next scanned page."""
+        response = await self._request_json(
+            'GET',
+            host,
+            f'device/scanners/jobs/{jobId}/next-page-info',
+            fallback={},
+            allow_no_content=True,
+        )
+        if isinstance(response, list):
+            return response[0] if response else {}
+        return response if isinstance(response, dict) else {}
+
+    async def getScannerCapabilities(self, host: str, jobId: str, caps: Optional[List[int]] = None) -> Any:
+        """Get scanner capabilities (e.g., DPI, color mode)."""
+        params = {'caps': caps} if caps else None
+        return await self._request_json(
+            'GET',
+            host,
+            f'device/scanners/jobs/{jobId}/scanner/capabilities',
+            params=params,
+            fallback=[],
+        )
+
+    async def getScannerSettings(self, host: str, jobId: str, showUI: bool = True) -> Dict[str, Any]:
+        """Retrieve TWAIN settings for a pending scan job."""
+        response = await self._request_json(
+            'GET',
+            host,
+            f'device/scanners/jobs/{jobId}/scanner/settings',
+            params={'showui': showUI},
+            fallback={},
+        )
+        return response if isinstance(response, dict) else {}
+
+    ##################
+    # Document-related
+    ##################
+
+    async def createDocument(self, host: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a new document."""
+        response = await self._request_json(
+            'POST',
+            host,
+            'storage/documents',
+            headers=self._make_headers(),
+            payload=parameters,
+            fallback={},
+        )
+        return response if isinstance(response, dict) else {}
+
+    async def getDocumentInfo(self, host: str, docId: str, password: str = '') -> Dict[str, Any]:
+        """Get document metadata."""
+        response = await self._request_json(
+            'GET',
+            host,
+            f'storage/documents/{docId}',
+            headers=self._make_headers(content_type=None, document_password=password),
+            fallback={},
+        )
+        return response if isinstance(response, dict) else {}
+
+    async def deleteDocument(self, host: str, docId: str, password: str = '') -> bool:
+        """Delete an existing document."""
+        return await self._request_success(
+            'DELETE',
+            host,
+            f'storage/documents/{docId}',
+            headers=self._make_headers(content_type=None, document_password=password),
+            expected_status_codes=[204],
+        )
+
+    async def getDocumentFile(
+        self,
+        host: str,
+        docId: str,
+        directory: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        documentPassword: str = '',
+        filename: Optional[str] = None,
+        chunkSize: int = DEFAULT_CHUNK_SIZE,
+    ) -> str:
+        """Download a document (PDF) and stream it to disk."""
+        request_parameters = dict(parameters or {})
+        output_type = request_parameters.get('type', DEFAULT_DOCUMENT_TYPE)
+        return await self._request_to_file(
+            'GET',
+            host,
+            f'storage/documents/{docId}/content',
+            directory,
+            'document',
+            output_type,
+            filename=filename,
+            headers=self._make_headers(content_type=None, document_password=documentPassword),
+            params=request_parameters,
+            chunk_size=chunkSize,
+        )
+
+    async def getDocumentStream(
+        self,
+        host: str,
+        docId: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        documentPassword: str = '',
+    ) -> Optional[bytes]:
+        """Get document content as byte stream."""
+        return await self._request_content(
+            'GET',
+            host,
+            f'storage/documents/{docId}/content',
+            headers=self._make_headers(content_type=None, document_password=documentPassword),
+            params=parameters,
+        )
+
+    async def writeDocumentStream(
+        self,
+        host: str,
+        docId: str,
+        output: Any,
+        parameters: Optional[Dict[str, Any]] = None,
+        documentPassword: str = '',
+        chunkSize: int = DEFAULT_CHUNK_SIZE,
+    ) -> Optional[int]:
+        """Stream document content into a writable object. ``output.write`` may be a coroutine function."""
+        return await self._request_to_writer(
+            'GET',
+            host,
+            f'storage/documents/{docId}/content',
+            output,
+            headers=self._make_headers(content_type=None, document_password=documentPassword),
+            params=parameters,
+            chunk_size=chunkSize,
+        )
+
+    async def insertPage(self, host: str, docId: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Insert a new page into an existing document."""
+        payload = dict(parameters)
+        document_password = payload.pop('password', '')
+        response = await self._request_json(
+            'POST',
+            host,
+            f'storage/documents/{docId}/pages',
+            headers=self._make_headers(document_password=document_password),
+            payload=payload,
+            fallback={},
+        )
+        return response if isinstance(response, dict) else {}
+
+    async def deletePage(self, host: str, docId: str, pageId: str, password: str = '') -> bool:
+        """Delete a page from a document."""
+        return await self._request_success(
+            'DELETE',
+            host,
+            f'storage/documents/{docId}/pages/{pageId}',
+            headers=self._make_headers(content_type=None, document_password=password),
+            expected_status_codes=[204],
+        )
+
+    ##################
+    # Processing-related
+    ##################
+
+    async def readBarcode(self, host: str, parameters: Dict[str, Any]) -> Any:
+        """Read barcodes from a scanned page source URL."""
+        payload = dict(parameters)
+        product_key = payload.pop('license', '')
+        return await self._request_json(
+            'POST',
+            host,
+            'process/read-barcode',
+            headers=self._make_headers(product_key=product_key),
+            payload=payload,
+            fallback=[],
+        )
+
+    async def checkBlank(self, host: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Check whether a scanned page source URL is blank."""
+        response = await self._request_json(
+            'POST',
+            host,
+            'process/check-blank',
+            headers=self._make_headers(),
+            payload=parameters,
+            fallback={},
+        )
+        return response if isinstance(response, dict) else {}
+
+    async def getStreamFromUrl(self, url: str) -> Optional[bytes]:
+        """Download binary content from an absolute Dynamic Web TWAIN URL."""
+        return await self._request_content('GET', '', '', allow_no_content=True, absolute_url=url)
+
+
+__all__ = [
+    'AsyncScannerController',
+]
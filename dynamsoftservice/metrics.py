@@ -0,0 +1,144 @@
+import bisect
+import threading
+from typing import Any, Dict, List, Tuple
+
+from . import RequestHook
+
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+class _Histogram:
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket that holds the q-quantile; the observed maximum for the overflow bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= rank:
+                return self.buckets[index] if index < len(self.buckets) else self.max
+        return self.max
+
+
+class _EndpointMetrics:
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.total = _Histogram(buckets)
+        self.ttfb = _Histogram(buckets)
+        self.bytes = 0
+        self.errors = 0
+
+
+class MetricsCollector(RequestHook):
+    """
+    In-memory latency, throughput and error statistics per endpoint.
+
+    Register it with ``ScannerController(hooks=[collector])``. Requests are grouped by method,
+    endpoint template and status code (``error`` for transport failures).
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._endpoints: Dict[Tuple[str, str, str], _EndpointMetrics] = {}
+
+    def after_request(self, event: Dict[str, Any]) -> None:
+        status = str(event['statusCode']) if event.get('statusCode') is not None else 'error'
+        key = (event['method'], event['path'], status)
+        with self._lock:
+            metrics = self._endpoints.get(key)
+            if metrics is None:
+                metrics = self._endpoints[key] = _EndpointMetrics(self.buckets)
+            metrics.total.observe(event['total'])
+            if event.get('ttfb') is not None:
+                metrics.ttfb.observe(event['ttfb'])
+            metrics.bytes += event.get('bytes') or 0
+            if event.get('error') or status == 'error' or int(status) >= 400:
+                metrics.errors += 1
+
+    def reset(self) -> None:
+        """Drop every recorded observation."""
+        with self._lock:
+            self._endpoints.clear()
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Summaries per endpoint, slowest p99 first. Quantiles are bucket upper bounds."""
+        with self._lock:
+            items = list(self._endpoints.items())
+            summary = [
+                {
+                    'method': method,
+                    'path': path,
+                    'status': status,
+                    'count': metrics.total.count,
+                    'errors': metrics.errors,
+                    'bytes': metrics.bytes,
+                    'totalSeconds': metrics.total.sum,
+                    'mean': metrics.total.sum / metrics.total.count if metrics.total.count else 0.0,
+                    'p50': metrics.total.quantile(0.5),
+                    'p99': metrics.total.quantile(0.99),
+                    'max': metrics.total.max,
+                    'ttfbP50': metrics.ttfb.quantile(0.5),
+                    'ttfbP99': metrics.ttfb.quantile(0.99),
+                }
+                for (method, path, status), metrics in items
+            ]
+        return sorted(summary, key=lambda item: item['p99'], reverse=True)
+
+    def to_prometheus(self, prefix: str = 'dynamsoftservice') -> str:
+        """Render the collected metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+        with self._lock:
+            items = sorted(self._endpoints.items())
+            for name, attribute, help_text in (
+                ('request_duration_seconds', 'total', 'Time from sending a request until its body was consumed.'),
+                ('request_ttfb_seconds', 'ttfb', 'Time from sending a request until its response headers arrived.'),
+            ):
+                metric = f'{prefix}_{name}'
+                lines.append(f'# HELP {metric} {help_text}')
+                lines.append(f'# TYPE {metric} histogram')
+                for key, metrics in items:
+                    histogram: _Histogram = getattr(metrics, attribute)
+                    labels = self._labels(key)
+                    cumulative = 0
+                    for bound, bucket_count in zip(self.buckets, histogram.counts):
+                        cumulative += bucket_count
+                        lines.append(f'{metric}_bucket{{{labels},le="{bound:g}"}} {cumulative}')
+                    lines.append(f'{metric}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                    lines.append(f'{metric}_sum{{{labels}}} {histogram.sum:.6f}')
+                    lines.append(f'{metric}_count{{{labels}}} {histogram.count}')
+
+            for name, attribute, help_text in (
+                ('response_bytes_total', 'bytes', 'Response body bytes received.'),
+                ('request_errors_total', 'errors', 'Requests that failed with a transport error or an HTTP error status.'),
+            ):
+                metric = f'{prefix}_{name}'
+                lines.append(f'# HELP {metric} {help_text}')
+                lines.append(f'# TYPE {metric} counter')
+                for key, metrics in items:
+                    lines.append(f'{metric}{{{self._labels(key)}}} {getattr(metrics, attribute)}')
+        return '\n'.join(lines) + '\n'
+
+    def _labels(self, key: Tuple[str, str, str]) -> str:
+        method, path, status = key
+        return f'method="{method}",path="{path}",status="{status}"'
+
+
+__all__ = [
+    'DEFAULT_LATENCY_BUCKETS',
+    'MetricsCollector',
+]
@@ -0,0 +1,152 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar
+
+from . import TERMINAL_JOB_STATUSES
+from .registry import get_scanner_id
+
+
+_M = TypeVar('_M', bound='_Model')
+
+
+class _Model:
+    """
+    A typed record of the fields the client uses from one JSON object returned by the service.
+
+    ``from_payload`` copies those fields into slots and drops the payload dict, so a model holds no
+    dict and reading a field is a plain slot lookup. Fields the service may add are not kept; call
+    the dict-returning method (getDevices, checkJob, ...) when you need the whole payload. Models
+    can also be read by payload key (``model['jobuid']``, ``get``, ``in``) for the fields they keep.
+    """
+
+    __slots__ = ()
+
+    # (attribute, payload key, default) for every field copied from the payload.
+    _fields: Tuple[Tuple[str, str, Any], ...] = ()
+
+    @classmethod
+    def from_payload(cls: Type[_M], payload: Dict[str, Any]) -> _M:
+        model = cls.__new__(cls)
+        for attribute, key, default in cls._fields:
+            setattr(model, attribute, payload.get(key, default))
+        model._init_derived()
+        return model
+
+    @classmethod
+    def wrap_all(cls: Type[_M], payloads: Iterable[Dict[str, Any]]) -> List[_M]:
+        return [cls.from_payload(payload) for payload in payloads]
+
+    def _init_derived(self) -> None:
+        pass
+
+    def _attribute(self, key: str) -> Optional[str]:
+        for attribute, payload_key, _ in self._fields:
+            if payload_key == key:
+                return attribute
+        return None
+
+    def __getitem__(self, key: str) -> Any:
+        attribute = self._attribute(key)
+        if attribute is None:
+            raise KeyError(key)
+        return getattr(self, attribute)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._attribute(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for _, key, _ in self._fields)
+
+    def __eq__(self, other: object) -> bool:
+        if type(self) is not type(other):
+            return NotImplemented
+        return all(getattr(self, attribute) == getattr(other, attribute) for attribute, _, _ in self._fields)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{attribute}={getattr(self, attribute)!r}' for attribute, _, _ in self._fields)
+        return f'{type(self).__name__}({fields})'
+
+    def get(self, key: str, default: Any = None) -> Any:
+        attribute = self._attribute(key)
+        return default if attribute is None else getattr(self, attribute)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The kept fields under their payload keys."""
+        return {key: getattr(self, attribute) for attribute, key, _ in self._fields}
+
+
+class Device(_Model):
+    """A scanner from ``device/scanners``."""
+
+    __slots__ = ('name', 'device', 'type', '_id')
+    _fields = (('name', 'name', ''), ('device', 'device', ''), ('type', 'type', None))
+
+    def __init__(self, name: str = '', device: str = '', type: Optional[int] = None) -> None:
+        self.name = name
+        self.device = device
+        self.type = type
+        self._init_derived()
+
+    def _init_derived(self) -> None:
+        self._id: Optional[str] = None
+
+    @property
+    def id(self) -> str:
+        """Stable short ID derived from the ``device`` string, as used by DeviceRegistry."""
+        if self._id is None:
+            self._id = get_scanner_id({'device': self.device})
+        return self._id
+
+
+class Job(_Model):
+    """A scan job from ``createJob`` or ``checkJob``."""
+
+    __slots__ = ('jobId', 'status', 'device', 'pageCount')
+    _fields = (('jobId', 'jobuid', ''), ('status', 'status', ''), ('device', 'device', ''), ('pageCount', 'pageCount', 0))
+
+    def __init__(self, jobId: str = '', status: str = '', device: str = '', pageCount: int = 0) -> None:
+        self.jobId = jobId
+        self.status = status
+        self.device = device
+        self.pageCount = pageCount
+
+    @property
+    def done(self) -> bool:
+        return self.status in TERMINAL_JOB_STATUSES
+
+
+class PageInfo(_Model):
+    """A page announced by ``next-page-info``."""
+
+    __slots__ = ('url',)
+    _fields = (('url', 'url', ''),)
+
+    def __init__(self, url: str = '') -> None:
+        self.url = url
+
+
+class Document(_Model):
+    """A document from ``storage/documents``."""
+
+    __slots__ = ('docId', 'pages')
+    _fields = (('docId', 'uid', ''), ('pages', 'pages', None))
+
+    def __init__(self, docId: str = '', pages: Iterable[Dict[str, Any]] = ()) -> None:
+        self.docId = docId
+        self.pages = list(pages)
+
+    def _init_derived(self) -> None:
+        if self.pages is None:
+            self.pages = []
+
+    @property
+    def pageCount(self) -> int:
+        return len(self.pages)
+
+
+__all__ = [
+    'Device',
+    'Document',
+    'Job',
+    'PageInfo',
+]
@@ -0,0 +1,168 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+from . import DEFAULT_IMAGE_TYPE, JobStatus, ScannerController
+
+
+DEFAULT_ORCHESTRATOR_WORKERS = 4
+DEFAULT_ORCHESTRATOR_QUEUE_SIZE = 16
+
+
+class ScanPage(NamedTuple):
+    """A page produced by ScanOrchestrator, tagged with the device and job it came from."""
+
+    device: Dict[str, Any]
+    job_id: str
+    index: int
+    content: bytes
+
+
+class ScanJobResult(NamedTuple):
+    """Summary of one orchestrated job once its pages have been drained."""
+
+    device: Dict[str, Any]
+    job_id: str
+    page_count: int
+    status: str
+    error: Optional[Dict[str, Any]]
+
+
+class ScanOrchestrator:
+    """
+    Runs scan jobs on several devices behind one Dynamic Web TWAIN Service concurrently.
+
+    Each job goes through createJob, updateJob(RUNNING), the next-page loop and deleteJob.
+    Pages from every device are merged into one stream of ScanPage items; deleteJob is
+    always called, even when the consumer stops iterating early or a job fails.
+    """
+
+    def __init__(
+        self,
+        controller: ScannerController,
+        host: str,
+        max_workers: int = DEFAULT_ORCHESTRATOR_WORKERS,
+        per_device_limit: int = 1,
+        imageType: str = DEFAULT_IMAGE_TYPE,
+        queue_size: int = DEFAULT_ORCHESTRATOR_QUEUE_SIZE,
+    ) -> None:
+        self.controller = controller
+        self.host = host
+        self.max_workers = max_workers
+        self.per_device_limit = per_device_limit
+        self.imageType = imageType
+        self.queue_size = queue_size
+        self.results: List[ScanJobResult] = []
+        self._results_lock = threading.Lock()
+
+    def run(
+        self,
+        devices: List[Dict[str, Any]],
+        parameters: Dict[str, Any],
+        jobsPerDevice: int = 1,
+    ) -> Iterator[ScanPage]:
+        """
+        Scan on every device and yield pages as they arrive from any of them.
+
+        ``parameters`` is the createJob payload shared by all jobs; the ``device`` field is
+        filled in per device. ``results`` holds one ScanJobResult per job after iteration ends.
+        """
+        self.results = []
+        pending: 'queue.Queue[Any]' = queue.Queue(maxsize=self.queue_size)
+        stopped = threading.Event()
+        device_slots: Dict[str, threading.Semaphore] = {}
+        for device in devices:
+            device_slots.setdefault(device['device'], threading.Semaphore(self.per_device_limit))
+
+        # Round-robin submission keeps workers from queueing up behind one busy device.
+        assignments = [device for _ in range(jobsPerDevice) for device in devices]
+        done_marker = object()
+
+        def put(item: Any) -> bool:
+            while not stopped.is_set():
+                try:
+                    pending.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def worker(device: Dict[str, Any]) -> None:
+            try:
+                with device_slots[device['device']]:
+                    if not stopped.is_set():
+                        self._run_job(device, parameters, put, stopped)
+            finally:
+                put(done_marker)
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='dynamsoftservice-scan')
+        try:
+            for device in assignments:
+                executor.submit(worker, device)
+
+            remaining = len(assignments)
+            while remaining:
+                item = pending.get()
+                if item is done_marker:
+                    remaining -= 1
+                    continue
+                yield item
+        finally:
+            stopped.set()
+            executor.shutdown(wait=True)
+
+    def _run_job(self, device: Dict[str, Any], parameters: Dict[str, Any], put: Any, stopped: threading.Event) -> None:
+        job_parameters = dict(parameters)
+        job_parameters['device'] = device['device']
+        job_id = ''
+        page_count = 0
+        status = JobStatus.FAULTED
+        error: Optional[Dict[str, Any]] = None
+        try:
+            job = self.controller.createJob(self.host, job_parameters)
+            job_id = job.get('jobuid', '')
+            if not job_id:
+                error = job or self.controller.last_error or {'message': 'Failed to create scan job.'}
+                return
+
+            if not job_parameters.get('autoRun'):
+                started = self.controller.updateJob(self.host, job_id, {'status': JobStatus.RUNNING})
+                if started.get('status') not in (JobStatus.RUNNING, JobStatus.COMPLETED):
+                    error = started or self.controller.last_error or {'message': 'Failed to start scan job.'}
+                    return
+
+            while True:
+                content = self.controller.getImageStream(self.host, job_id, imageType=self.imageType)
+                if content is None:
+                    # None also ends the loop on a failed request. last_error is kept per thread, so
+                    # it describes this job's request and not another worker's.
+                    error = self.controller.last_error
+                    break
+                if not put(ScanPage(device, job_id, page_count, content)):
+                    status = JobStatus.CANCELED
+                    return
+                page_count += 1
+
+            if error is None:
+                status = self.controller.checkJob(self.host, job_id).get('status', JobStatus.COMPLETED)
+        except Exception as exception:
+            error = {'error': str(exception)}
+        finally:
+            try:
+                if job_id:
+                    if stopped.is_set() and status != JobStatus.COMPLETED:
+                        self.controller.updateJob(self.host, job_id, {'status': JobStatus.CANCELED})
+                    self.controller.deleteJob(self.host, job_id)
+            except Exception as exception:
+                error = error or {'error': str(exception)}
+            finally:
+                with self._results_lock:
+                    self.results.append(ScanJobResult(device, job_id, page_count, status, error))
+
+
+__all__ = [
+    'ScanJobResult',
+    'ScanOrchestrator',
+    'ScanPage',
+]
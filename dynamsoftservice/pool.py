@@ -0,0 +1,173 @@
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from . import DEFAULT_TIMEOUT, ScannerController
+
+
+DEFAULT_HEALTH_INTERVAL = 30
+
+
+class ServiceHost:
+    """Health and load state of one Dynamic Web TWAIN Service instance in a ScannerServicePool."""
+
+    def __init__(self, host: str, controller: ScannerController) -> None:
+        self.host = host
+        self.controller = controller
+        self.healthy = False
+        self.version = ''
+        self.devices: Dict[str, Dict[str, Any]] = {}
+        self.active_jobs: Dict[str, str] = {}
+        self.last_checked = 0.0
+
+    @property
+    def load(self) -> int:
+        return len(self.active_jobs)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'host': self.host,
+            'healthy': self.healthy,
+            'version': self.version,
+            'deviceCount': len(self.devices),
+            'activeJobs': self.load,
+            'lastChecked': self.last_checked,
+        }
+
+
+class ScannerServicePool:
+    """
+    Spreads scan jobs across several Dynamic Web TWAIN Service hosts.
+
+    Each host gets its own ScannerController, and therefore its own connection pool. Hosts are
+    probed with getServerInfo and getDevices every ``health_interval`` seconds; createJob goes to
+    the healthy host with the fewest active jobs that exposes the requested device.
+    """
+
+    def __init__(
+        self,
+        hosts: List[str],
+        scannerType: Optional[int] = None,
+        health_interval: float = DEFAULT_HEALTH_INTERVAL,
+        controller_factory: Optional[Callable[[], ScannerController]] = None,
+        timeout: int = DEFAULT_TIMEOUT,
+        verify: bool = True,
+    ) -> None:
+        factory = controller_factory or (lambda: ScannerController(timeout=timeout, verify=verify))
+        self.scannerType = scannerType
+        self.health_interval = health_interval
+        self.hosts: Dict[str, ServiceHost] = {host: ServiceHost(host, factory()) for host in hosts}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> 'ScannerServicePool':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the HTTP sessions of every host."""
+        for service_host in self.hosts.values():
+            service_host.controller.close()
+
+    def controllerFor(self, host: str) -> ScannerController:
+        """Return the controller bound to one host of the pool."""
+        return self.hosts[host].controller
+
+    def refresh(self, force: bool = True) -> None:
+        """Probe every host for health and devices. Without ``force`` only stale hosts are probed."""
+        now = time.monotonic()
+        for service_host in self.hosts.values():
+            if force or now - service_host.last_checked >= self.health_interval:
+                self._probe(service_host)
+
+    def _probe(self, service_host: ServiceHost) -> None:
+        controller = service_host.controller
+        try:
+            info = controller.getServerInfo(service_host.host)
+            healthy = bool(info.get('version'))
+            devices = controller.getDevices(service_host.host, self.scannerType) if healthy else []
+        except Exception:
+            healthy, info, devices = False, {}, []
+
+        with self._lock:
+            service_host.healthy = healthy
+            service_host.version = info.get('version', '')
+            service_host.devices = {device['device']: device for device in devices if 'device' in device}
+            service_host.last_checked = time.monotonic()
+
+    def health(self) -> Dict[str, Dict[str, Any]]:
+        """Get the health and load snapshot of every host."""
+        with self._lock:
+            return {host: service_host.to_dict() for host, service_host in self.hosts.items()}
+
+    def getDevices(self) -> List[Dict[str, Any]]:
+        """List the devices of every healthy host. Each entry carries the owning ``host``."""
+        self.refresh(force=False)
+        devices: List[Dict[str, Any]] = []
+        with self._lock:
+            for service_host in self.hosts.values():
+                if not service_host.healthy:
+                    continue
+                for device in service_host.devices.values():
+                    entry = dict(device)
+                    entry['host'] = service_host.host
+                    devices.append(entry)
+        return devices
+
+    def selectHost(self, device: str) -> Optional[str]:
+        """Pick the least-loaded healthy host that exposes ``device``."""
+        self.refresh(force=False)
+        with self._lock:
+            candidates = [
+                service_host for service_host in self.hosts.values()
+                if service_host.healthy and device in service_host.devices
+            ]
+            if not candidates:
+                return None
+            return min(candidates, key=lambda service_host: service_host.load).host
+
+    def createJob(self, parameters: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """
+        Create a scan job on the best host for ``parameters['device']``.
+
+        Returns ``(host, job)``; ``host`` is empty when no healthy host owns the device. Use the
+        returned host for every follow-up call and release the slot with deleteJob.
+        """
+        host = self.selectHost(parameters.get('device', ''))
+        if not host:
+            return '', {}
+
+        service_host = self.hosts[host]
+        with self._lock:
+            # Reserve the slot before the round-trip so concurrent callers spread out.
+            reservation = f'pending-{uuid.uuid4().hex}'
+            service_host.active_jobs[reservation] = parameters.get('device', '')
+
+        job: Dict[str, Any] = {}
+        try:
+            job = service_host.controller.createJob(host, parameters)
+        finally:
+            with self._lock:
+                device = service_host.active_jobs.pop(reservation, '')
+                if job.get('jobuid'):
+                    service_host.active_jobs[job['jobuid']] = device
+        if not job.get('jobuid'):
+            self._probe(service_host)
+        return host, job
+
+    def deleteJob(self, host: str, jobId: str) -> bool:
+        """Delete a job created through the pool and release its load slot."""
+        service_host = self.hosts[host]
+        try:
+            return service_host.controller.deleteJob(host, jobId)
+        finally:
+            with self._lock:
+                service_host.active_jobs.pop(jobId, None)
+
+
+__all__ = [
+    'ScannerServicePool',
+    'ServiceHost',
+]
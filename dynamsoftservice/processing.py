@@ -0,0 +1,169 @@
+import collections
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterator, List, NamedTuple, Optional
+
+from . import ScannerController
+
+
+DEFAULT_PROCESSING_WORKERS = 4
+
+
+class ProcessedPage(NamedTuple):
+    """A page from ``next-page-info`` annotated by PageProcessor."""
+
+    index: int
+    url: str
+    info: Dict[str, Any]
+    blank: Optional[bool]
+    barcodes: List[Any]
+    content: Optional[bytes]
+
+
+class _PendingPage:
+    def __init__(self, index: int, info: Dict[str, Any]) -> None:
+        self.index = index
+        self.info = info
+        self.url: str = info['url']
+        self.blank: 'Future[Optional[bool]]' = Future()
+        self.barcodes: 'Future[List[Any]]' = Future()
+        self.content: 'Future[Optional[bytes]]' = Future()
+
+    def futures(self) -> List['Future[Any]']:
+        return [self.blank, self.barcodes, self.content]
+
+
+class PageProcessor:
+    """
+    Runs blank-page detection and barcode reading over the pages of a scan job.
+
+    Page URLs come from ``next-page-info``. ``process/check-blank`` and ``process/read-barcode`` run
+    concurrently for every page on a bounded worker pool, and the page itself is downloaded only
+    once its blank check is done. With ``drop_blank`` blank pages are skipped before they are ever
+    downloaded. Pages are yielded in scan order.
+    """
+
+    def __init__(
+        self,
+        controller: ScannerController,
+        host: str,
+        max_workers: int = DEFAULT_PROCESSING_WORKERS,
+        check_blank: bool = True,
+        read_barcodes: bool = True,
+        drop_blank: bool = False,
+        download: bool = True,
+        blank_parameters: Optional[Dict[str, Any]] = None,
+        barcode_parameters: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.controller = controller
+        self.host = host
+        self.max_workers = max_workers
+        self.check_blank = check_blank
+        self.read_barcodes = read_barcodes
+        self.drop_blank = drop_blank
+        self.download = download
+        self.blank_parameters = dict(blank_parameters or {})
+        self.barcode_parameters = dict(barcode_parameters or {})
+        self.dropped = 0
+
+    def run(self, jobId: str) -> Iterator[ProcessedPage]:
+        """
+        Yield every page of a job with its blank flag, barcodes and content.
+
+        ``blank`` is None when the check is disabled or failed; such pages are never dropped.
+        ``content`` is None when downloading is disabled or the download failed.
+        """
+        self.dropped = 0
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='dynamsoftservice-process')
+        # Enough pages in flight to keep every worker busy while the consumer handles the oldest one.
+        window = max(self.max_workers, 1) * 2
+        pending: Deque[_PendingPage] = collections.deque()
+        index = 0
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < window:
+                    info = self.controller.getImageInfo(self.host, jobId)
+                    if not info.get('url'):
+                        exhausted = True
+                        break
+                    index += 1
+                    pending.append(self._submit(executor, _PendingPage(index, info)))
+                if not pending:
+                    return
+
+                page = pending.popleft()
+                blank = page.blank.result()
+                if blank and self.drop_blank:
+                    page.barcodes.cancel()
+                    self.dropped += 1
+                    continue
+                yield ProcessedPage(
+                    page.index,
+                    page.url,
+                    page.info,
+                    blank,
+                    page.barcodes.result(),
+                    page.content.result(),
+                )
+        finally:
+            for page in pending:
+                for future in page.futures():
+                    future.cancel()
+            executor.shutdown(wait=True)
+
+    def _submit(self, executor: ThreadPoolExecutor, page: _PendingPage) -> _PendingPage:
+        if self.check_blank:
+            self._start(executor, page.blank, self._check_blank, page.url)
+        else:
+            page.blank.set_result(None)
+        if self.read_barcodes:
+            self._start(executor, page.barcodes, self._read_barcodes, page.url)
+        else:
+            page.barcodes.set_result([])
+        page.blank.add_done_callback(lambda _: self._start_download(executor, page))
+        return page
+
+    def _start(self, executor: ThreadPoolExecutor, target: 'Future[Any]', fn: Callable[[str], Any], url: str) -> None:
+        def run() -> None:
+            if not target.set_running_or_notify_cancel():
+                return
+            try:
+                target.set_result(fn(url))
+            except BaseException as error:
+                target.set_exception(error)
+
+        try:
+            executor.submit(run)
+        except RuntimeError:
+            # The pool has been shut down because the consumer stopped iterating.
+            target.cancel()
+
+    def _start_download(self, executor: ThreadPoolExecutor, page: _PendingPage) -> None:
+        if page.blank.cancelled():
+            page.content.cancel()
+            return
+        blank = page.blank.result() if page.blank.exception() is None else None
+        if not self.download or (blank and self.drop_blank):
+            page.content.set_result(None)
+            return
+        self._start(executor, page.content, self.controller.getStreamFromUrl, page.url)
+
+    def _check_blank(self, url: str) -> Optional[bool]:
+        parameters = dict(self.blank_parameters)
+        parameters['source'] = url
+        result = self.controller.checkBlank(self.host, parameters)
+        if 'isBlank' not in result:
+            return None
+        return bool(result['isBlank'])
+
+    def _read_barcodes(self, url: str) -> List[Any]:
+        parameters = dict(self.barcode_parameters)
+        parameters['source'] = url
+        result = self.controller.readBarcode(self.host, parameters)
+        return result if isinstance(result, list) else []
+
+
+__all__ = [
+    'PageProcessor',
+    'ProcessedPage',
+]
@@ -0,0 +1,125 @@
+import hashlib
+import threading
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from . import ScannerController, _SingleFlight
+
+
+DEFAULT_REGISTRY_REFRESH_INTERVAL = 30
+DEFAULT_REGISTRY_MISS_INTERVAL = 2
+
+
+def get_scanner_id(device: Dict[str, Any]) -> str:
+    """Stable short ID of a scanner, derived from its ``device`` string."""
+    return hashlib.sha256(device['device'].encode('utf-8')).hexdigest()[:16]
+
+
+class RegistryDiff(NamedTuple):
+    """Scanners that appeared, disappeared or changed during a DeviceRegistry refresh."""
+
+    added: List[Dict[str, Any]]
+    removed: List[Dict[str, Any]]
+    changed: List[Dict[str, Any]]
+
+
+class DeviceRegistry:
+    """
+    Scanners of one service host indexed by their stable ID.
+
+    Lookups are dictionary reads. The device list is re-enumerated only when it is older than
+    ``refresh_interval`` seconds, or on a lookup miss at most once every ``miss_interval`` seconds,
+    so a newly attached scanner is found without every request paying for getDevices.
+    """
+
+    def __init__(
+        self,
+        controller: ScannerController,
+        host: str,
+        scannerType: Optional[int] = None,
+        refresh_interval: float = DEFAULT_REGISTRY_REFRESH_INTERVAL,
+        miss_interval: float = DEFAULT_REGISTRY_MISS_INTERVAL,
+        on_change: Optional[Callable[[RegistryDiff], None]] = None,
+    ) -> None:
+        self.controller = controller
+        self.host = host
+        self.scannerType = scannerType
+        self.refresh_interval = refresh_interval
+        self.miss_interval = miss_interval
+        self.on_change = on_change
+        self._devices: Dict[str, Dict[str, Any]] = {}
+        self._refreshed_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._flight = _SingleFlight()
+
+    def refresh(self) -> RegistryDiff:
+        """Enumerate devices and apply the difference to the index. Concurrent calls share one enumeration."""
+        diff, _ = self._flight.do('refresh', self._refresh)
+        return diff
+
+    def _refresh(self) -> RegistryDiff:
+        devices = self.controller.getDevices(self.host, self.scannerType)
+        if not devices and self.controller.last_error:
+            # Keep the last known devices when the service could not be reached.
+            return RegistryDiff([], [], [])
+
+        latest = {get_scanner_id(device): device for device in devices if 'device' in device}
+        with self._lock:
+            previous = self._devices
+            added = [device for scanner_id, device in latest.items() if scanner_id not in previous]
+            removed = [device for scanner_id, device in previous.items() if scanner_id not in latest]
+            changed = [
+                device for scanner_id, device in latest.items()
+                if scanner_id in previous and previous[scanner_id] != device
+            ]
+            self._devices = latest
+            self._refreshed_at = time.monotonic()
+
+        diff = RegistryDiff(added, removed, changed)
+        if self.on_change is not None and (added or removed or changed):
+            self.on_change(diff)
+        return diff
+
+    def _age(self) -> float:
+        if self._refreshed_at is None:
+            return float('inf')
+        return time.monotonic() - self._refreshed_at
+
+    def _ensure_fresh(self) -> None:
+        if self._age() >= self.refresh_interval:
+            self.refresh()
+
+    def get(self, scanner_id: str) -> Optional[Dict[str, Any]]:
+        """Look up a scanner by its stable ID."""
+        self._ensure_fresh()
+        with self._lock:
+            device = self._devices.get(scanner_id)
+        if device is None and self._age() >= self.miss_interval:
+            self.controller.invalidate(self.host)
+            self.refresh()
+            with self._lock:
+                device = self._devices.get(scanner_id)
+        return device
+
+    def items(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """Get ``(scanner_id, device)`` pairs for every known scanner."""
+        self._ensure_fresh()
+        with self._lock:
+            return list(self._devices.items())
+
+    def devices(self) -> List[Dict[str, Any]]:
+        """Get every known scanner."""
+        return [device for _, device in self.items()]
+
+    def invalidate(self) -> None:
+        """Force the next lookup to re-enumerate devices."""
+        self.controller.invalidate(self.host)
+        with self._lock:
+            self._refreshed_at = None
+
+
+__all__ = [
+    'DeviceRegistry',
+    'RegistryDiff',
+    'get_scanner_id',
+]
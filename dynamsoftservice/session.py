@@ -0,0 +1,177 @@
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+from . import DEFAULT_CHUNK_SIZE, DEFAULT_IMAGE_TYPE, JobStatus, ScannerController, ScannerServiceError
+
+
+JOURNAL_VERSION = 1
+
+
+class ScanSession:
+    """
+    A scan job whose progress is checkpointed to a small JSON journal on disk.
+
+    The journal records the host, job ID, image type, output directory, pages received and the
+    saved filenames. It is rewritten atomically after every page. If the process dies, resume()
+    reattaches to the job from the journal and continues pulling ``next-page`` where it stopped,
+    so a long batch does not have to be rescanned.
+
+        session = ScanSession.start(controller, host, parameters, "./output", "./output/job.journal")
+        for filename in session.iterImageFiles():
+            ...
+        session.close()
+    """
+
+    def __init__(self, controller: ScannerController, journal_path: str, state: Dict[str, Any]) -> None:
+        self.controller = controller
+        self.journal_path = journal_path
+        self._state = state
+        self._lock = threading.Lock()
+
+    @classmethod
+    def start(
+        cls,
+        controller: ScannerController,
+        host: str,
+        parameters: Dict[str, Any],
+        directory: str,
+        journal_path: str,
+        imageType: str = DEFAULT_IMAGE_TYPE,
+    ) -> Optional['ScanSession']:
+        """Create a scan job and its journal. Returns None when the job could not be created."""
+        job = controller.createJob(host, parameters)
+        jobId = job.get('jobuid', '')
+        if not jobId:
+            return None
+        session = cls(
+            controller,
+            journal_path,
+            {
+                'version': JOURNAL_VERSION,
+                'host': host,
+                'jobId': jobId,
+                'imageType': imageType,
+                'directory': directory,
+                'pages': 0,
+                'files': [],
+                'createdAt': time.time(),
+                'updatedAt': time.time(),
+            },
+        )
+        session._save()
+        return session
+
+    @classmethod
+    def resume(cls, controller: ScannerController, journal_path: str) -> Optional['ScanSession']:
+        """
+        Reattach to the job recorded in a journal. Returns None when there is no readable journal.
+
+        A page that was saved but not yet recorded when the process died is picked up from disk.
+        Check ``alive`` to find out whether the service still holds the job.
+        """
+        try:
+            with open(journal_path, 'r', encoding='utf-8') as input_stream:
+                state = json.load(input_stream)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(state, dict) or state.get('version') != JOURNAL_VERSION or not state.get('jobId'):
+            return None
+
+        session = cls(controller, journal_path, state)
+        session._adopt_orphans()
+        return session
+
+    @property
+    def host(self) -> str:
+        return self._state['host']
+
+    @property
+    def jobId(self) -> str:
+        return self._state['jobId']
+
+    @property
+    def directory(self) -> str:
+        return self._state['directory']
+
+    @property
+    def pages(self) -> int:
+        """Number of pages received so far, across every process that worked on this job."""
+        return self._state['pages']
+
+    @property
+    def files(self) -> List[str]:
+        """Filenames saved so far, in page order."""
+        return list(self._state['files'])
+
+    @property
+    def alive(self) -> bool:
+        """Whether the service still knows the job and it has not been canceled or faulted."""
+        try:
+            info = self.controller.checkJob(self.host, self.jobId)
+        except ScannerServiceError:
+            return False
+        return bool(info) and info.get('status') not in (JobStatus.CANCELED, JobStatus.FAULTED)
+
+    def _filename(self, index: int) -> str:
+        return f"image_{self.jobId}_{index:05d}{self.controller._resolve_extension(self._state['imageType'])}"
+
+    def _adopt_orphans(self) -> None:
+        # Filenames are derived from the page index, so a page renamed into place just before a crash is recognisable.
+        while os.path.exists(os.path.join(self.directory, self._filename(self.pages + 1))):
+            self._record(self._filename(self.pages + 1))
+
+    def _record(self, filename: str) -> None:
+        with self._lock:
+            self._state['pages'] += 1
+            self._state['files'].append(filename)
+            self._state['updatedAt'] = time.time()
+            self._save()
+
+    def _save(self) -> None:
+        directory = os.path.dirname(os.path.abspath(self.journal_path))
+        os.makedirs(directory, exist_ok=True)
+        temporary_path = f'{self.journal_path}.part'
+        with open(temporary_path, 'w', encoding='utf-8') as output_stream:
+            json.dump(self._state, output_stream)
+            output_stream.flush()
+            os.fsync(output_stream.fileno())
+        os.replace(temporary_path, self.journal_path)
+
+    def iterImageFiles(self, chunkSize: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+        """Yield each newly saved filename, checkpointing the journal after every page."""
+        while True:
+            saved = self.controller.getImageFile(
+                self.host,
+                self.jobId,
+                self.directory,
+                imageType=self._state['imageType'],
+                filename=self._filename(self.pages + 1),
+                chunkSize=chunkSize,
+            )
+            if not saved:
+                break
+            self._record(saved)
+            yield saved
+
+    def getImageFiles(self) -> List[str]:
+        """Download every remaining page and return the filenames of the whole job."""
+        for _ in self.iterImageFiles():
+            pass
+        return self.files
+
+    def close(self, deleteJob: bool = True) -> None:
+        """Finish the session: delete the job on the service and remove the journal."""
+        if deleteJob:
+            self.controller.deleteJob(self.host, self.jobId)
+        try:
+            os.remove(self.journal_path)
+        except OSError:
+            pass
+
+
+__all__ = [
+    'ScanSession',
+]
@@ -0,0 +1,195 @@
+import contextlib
+import json
+import random
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+from . import RequestHook
+
+
+class Span:
+    """A timed operation within a trace."""
+
+    __slots__ = ('name', 'trace_id', 'span_id', 'parent_id', 'start', 'end', 'attributes', 'status', '_started')
+
+    def __init__(self, name: str, trace_id: str, parent_id: str = '', attributes: Optional[Dict[str, Any]] = None) -> None:
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = f'{random.getrandbits(64):016x}'
+        self.parent_id = parent_id
+        self.start = time.time()
+        self.end: Optional[float] = None
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.status = 'ok'
+        self._started = time.perf_counter()
+
+    @property
+    def duration(self) -> Optional[float]:
+        if self.end is None:
+            return None
+        return self.end - self.start
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'traceId': self.trace_id,
+            'spanId': self.span_id,
+            'parentId': self.parent_id,
+            'start': self.start,
+            'end': self.end,
+            'duration': self.duration,
+            'status': self.status,
+            'attributes': self.attributes,
+        }
+
+
+class InMemorySpanExporter:
+    """Keeps finished spans in a list, for tests and ad-hoc profiling."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.spans: List[Span] = []
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.spans.clear()
+
+
+class FileSpanExporter:
+    """Appends each finished span to a local file as one JSON object per line."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as output_stream:
+                output_stream.write(line + '\n')
+
+
+class Tracer(RequestHook):
+    """
+    Span-based tracing for the scan job lifecycle.
+
+    Pass it as ``ScannerController(tracer=Tracer(exporter))``. createJob opens a root span per
+    job that deleteJob closes. Every REST call referring to that job becomes a child span, and
+    so do file writes and any ``tracer.span(name, jobId=...)`` blocks added by the application.
+    Calls outside a job are parented to the span that is active on the calling thread, if any.
+    """
+
+    def __init__(self, exporter: Any) -> None:
+        self.exporter = exporter
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, Span] = {}
+        self._local = threading.local()
+
+    def _stack(self) -> List[Span]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _parent(self, jobId: str = '') -> Optional[Span]:
+        if jobId:
+            with self._lock:
+                job_span = self._jobs.get(jobId)
+            if job_span is not None:
+                return job_span
+        stack = self._stack()
+        return stack[-1] if stack else None
+
+    def start_span(self, name: str, jobId: str = '', attributes: Optional[Dict[str, Any]] = None) -> Span:
+        """Start a span under the job span, or under the span active on this thread."""
+        parent = self._parent(jobId)
+        trace_id = parent.trace_id if parent is not None else f'{random.getrandbits(128):032x}'
+        return Span(name, trace_id, parent.span_id if parent is not None else '', attributes)
+
+    def end_span(self, span: Span, error: Optional[str] = None) -> None:
+        """Finish a span and hand it to the exporter."""
+        if span.end is not None:
+            return
+        span.end = span.start + (time.perf_counter() - span._started)
+        if error:
+            span.status = 'error'
+            span.attributes['error'] = error
+        self.exporter.export(span)
+
+    @contextlib.contextmanager
+    def span(self, name: str, jobId: str = '', attributes: Optional[Dict[str, Any]] = None) -> Iterator[Span]:
+        """Context manager that traces a block, e.g. OCR or upload work on a scanned page."""
+        current = self.start_span(name, jobId=jobId, attributes=attributes)
+        stack = self._stack()
+        stack.append(current)
+        error: Optional[str] = None
+        try:
+            yield current
+        except BaseException as exception:
+            error = str(exception) or exception.__class__.__name__
+            raise
+        finally:
+            stack.pop()
+            self.end_span(current, error=error)
+
+    def start_job(self, jobId: str, attributes: Optional[Dict[str, Any]] = None) -> Span:
+        """Open the root span of a scan job."""
+        job_attributes = {'jobId': jobId}
+        job_attributes.update(attributes or {})
+        job_span = Span('scan.job', f'{random.getrandbits(128):032x}', attributes=job_attributes)
+        with self._lock:
+            self._jobs[jobId] = job_span
+        return job_span
+
+    def end_job(self, jobId: str, error: Optional[str] = None) -> None:
+        """Close the root span of a scan job."""
+        with self._lock:
+            job_span = self._jobs.pop(jobId, None)
+        if job_span is not None:
+            self.end_span(job_span, error=error)
+
+    def close(self) -> None:
+        """Close every job span that is still open."""
+        with self._lock:
+            job_ids = list(self._jobs)
+        for jobId in job_ids:
+            self.end_job(jobId)
+
+    def before_request(self, event: Dict[str, Any]) -> None:
+        event['_span'] = self.start_span(
+            f"{event['method']} {event['path']}",
+            jobId=event.get('jobId', ''),
+            attributes={'http.method': event['method'], 'http.url': event['url'], 'jobId': event.get('jobId', '')},
+        )
+
+    def after_request(self, event: Dict[str, Any]) -> None:
+        request_span: Optional[Span] = event.pop('_span', None)
+        if request_span is None:
+            return
+        request_span.attributes.update(
+            {
+                'http.status_code': event.get('statusCode'),
+                'bytes': event.get('bytes'),
+                'ttfb': event.get('ttfb'),
+                'attempts': event.get('attempts'),
+            }
+        )
+        status_code = event.get('statusCode')
+        error = event.get('error') or (f'HTTP {status_code}' if status_code is not None and status_code >= 400 else None)
+        self.end_span(request_span, error=error)
+
+
+__all__ = [
+    'FileSpanExporter',
+    'InMemorySpanExporter',
+    'Span',
+    'Tracer',
+]
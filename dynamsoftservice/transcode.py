@@ -0,0 +1,202 @@
+import collections
+import hashlib
+import io
+import threading
+from typing import Any, Callable, Dict, Sequence, Tuple
+
+from . import _SingleFlight
+
+
+# Page formats the service can deliver from next-page, most compact first for typical scans.
+WIRE_IMAGE_TYPES = ('image/jpeg', 'image/png', 'image/tiff')
+LOSSLESS_IMAGE_TYPES = ('image/png', 'image/tiff')
+DEFAULT_TRANSCODE_CACHE_ENTRIES = 256
+DEFAULT_TRANSCODE_CACHE_BYTES = 256 * 1024 * 1024
+DEFAULT_JPEG_QUALITY = 85
+
+# Imported on first use, so importing dynamsoftservice does not pay for Pillow.
+Image: Any = None
+
+
+def _load_pillow() -> bool:
+    global Image
+    if Image is None:
+        try:
+            from PIL import Image as module
+        except ImportError:
+            return False
+        Image = module
+    return True
+
+
+_PILLOW_FORMATS = {
+    'image/jpeg': 'JPEG',
+    'image/png': 'PNG',
+    'image/tiff': 'TIFF',
+    'application/pdf': 'PDF',
+}
+_MULTIPAGE_TYPES = ('application/pdf', 'image/tiff')
+
+
+def negotiate_image_type(accept: Sequence[str], lossless: bool = False) -> str:
+    """
+    Pick the ``next-page`` type to request for a consumer that accepts the given types.
+
+    The most compact wire format the consumer accepts wins, so no local transcoding is needed.
+    When it accepts none of them, the most compact wire format is returned and the page must be
+    transcoded. ``lossless`` rules out JPEG on the wire.
+    """
+    candidates = [image_type for image_type in WIRE_IMAGE_TYPES if not lossless or image_type in LOSSLESS_IMAGE_TYPES]
+    for image_type in candidates:
+        if image_type in accept:
+            return image_type
+    return candidates[0]
+
+
+class Transcoder:
+    """
+    Converts pages between image formats with Pillow, behind a content-addressed LRU cache.
+
+    Results are keyed by the SHA-256 of the source bytes and the target type, so the same page is
+    never re-encoded into the same format twice, whichever request asks for it. Concurrent requests
+    for the same conversion share one encode. Install Pillow to use it.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_TRANSCODE_CACHE_ENTRIES,
+        max_bytes: int = DEFAULT_TRANSCODE_CACHE_BYTES,
+        quality: int = DEFAULT_JPEG_QUALITY,
+    ) -> None:
+        if not _load_pillow():
+            raise ImportError('Transcoder requires Pillow. Install it with "pip install twain-wia-sane-scanner[transcode]".')
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.quality = quality
+        self.hits = 0
+        self.misses = 0
+        self._size = 0
+        self._lock = threading.Lock()
+        self._entries: 'collections.OrderedDict[Tuple[str, str], bytes]' = collections.OrderedDict()
+        self._flight = _SingleFlight()
+
+    def transcode(self, content: bytes, source_type: str, target_type: str) -> bytes:
+        """Return ``content`` converted to ``target_type``. Pages already in that type are returned as they are."""
+        if source_type == target_type:
+            return content
+        if target_type not in _PILLOW_FORMATS:
+            raise ValueError(f'Unsupported target type: {target_type}')
+
+        key = (hashlib.sha256(content).hexdigest(), target_type)
+        return self._cached(key, lambda: self._encode(content, target_type))
+
+    def combine(self, contents: Sequence[bytes], source_type: str, target_type: str = 'application/pdf') -> bytes:
+        """
+        Return the pages in ``contents`` as one multi-page document of ``target_type``.
+
+        Only PDF and TIFF hold several pages. The result is cached by the hashes of the pages in
+        order, so exporting the same set of pages again does not re-encode them.
+        """
+        if target_type not in _MULTIPAGE_TYPES:
+            raise ValueError(f'Unsupported multi-page target type: {target_type}')
+        if not contents:
+            raise ValueError('At least one page is required.')
+
+        digests = ''.join(hashlib.sha256(content).hexdigest() for content in contents)
+        key = (hashlib.sha256(digests.encode('ascii')).hexdigest(), target_type)
+        return self._cached(key, lambda: self._encode_pages(contents, target_type))
+
+    def _cached(self, key: Tuple[str, str], encode: Callable[[], bytes]) -> bytes:
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        encoded, _ = self._flight.do(key, lambda: self._encode_and_store(key, encode))
+        return encoded
+
+    def _encode_and_store(self, key: Tuple[str, str], encode: Callable[[], bytes]) -> bytes:
+        encoded = encode()
+        if len(encoded) > self.max_bytes:
+            return encoded
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = encoded
+                self._size += len(encoded)
+            while self._entries and (len(self._entries) > self.max_entries or self._size > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+        return encoded
+
+    def _encode(self, content: bytes, target_type: str) -> bytes:
+        output = io.BytesIO()
+        with Image.open(io.BytesIO(content)) as image:
+            image.load()
+            prepared = self._prepare(image, target_type)
+            prepared.save(output, format=_PILLOW_FORMATS[target_type], **self._save_options(image.info, target_type))
+        return output.getvalue()
+
+    def _encode_pages(self, contents: Sequence[bytes], target_type: str) -> bytes:
+        pages = []
+        for content in contents:
+            with Image.open(io.BytesIO(content)) as image:
+                image.load()
+                prepared = self._prepare(image, target_type)
+                # _prepare hands back the opened image itself when it needs no conversion.
+                pages.append((prepared.copy() if prepared is image else prepared, image.info))
+        (first, info), *remaining = pages
+        output = io.BytesIO()
+        first.save(
+            output,
+            format=_PILLOW_FORMATS[target_type],
+            save_all=True,
+            append_images=[page for page, _ in remaining],
+            **self._save_options(info, target_type),
+        )
+        return output.getvalue()
+
+    def _save_options(self, info: Dict[str, Any], target_type: str) -> Dict[str, Any]:
+        options: Dict[str, Any] = {}
+        if target_type == 'image/jpeg':
+            options['quality'] = self.quality
+        elif target_type == 'application/pdf':
+            options['resolution'] = float(info.get('dpi', (72,))[0] or 72)
+        if 'dpi' in info and target_type != 'application/pdf':
+            options['dpi'] = info['dpi']
+        return options
+
+    def _prepare(self, image: Any, target_type: str) -> Any:
+        if target_type in ('image/jpeg', 'application/pdf'):
+            if image.mode in ('RGB', 'L'):
+                return image
+            if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
+                rgba = image.convert('RGBA')
+                flattened = Image.new('RGB', image.size, 'white')
+                flattened.paste(rgba, mask=rgba.getchannel('A'))
+                return flattened
+            return image.convert('RGB')
+        if target_type == 'image/png' and image.mode not in ('1', 'L', 'LA', 'P', 'RGB', 'RGBA'):
+            return image.convert('RGBA')
+        return image
+
+    def stats(self) -> Dict[str, Any]:
+        """Report cache hits, misses, entries and the bytes held."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries), 'bytes': self._size}
+
+    def clear(self) -> None:
+        """Drop every cached conversion."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+__all__ = [
+    'LOSSLESS_IMAGE_TYPES',
+    'Transcoder',
+    'WIRE_IMAGE_TYPES',
+    'negotiate_image_type',
+]
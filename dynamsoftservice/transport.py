@@ -0,0 +1,190 @@
+import datetime
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+import requests
+
+from . import DEFAULT_POOL_MAXSIZE, Transport
+
+
+# Imported on first use, so importing dynamsoftservice does not pay for httpx.
+httpx: Any = None
+
+
+def _load_httpx(http2: bool) -> bool:
+    global httpx
+    if httpx is None:
+        try:
+            import httpx as module
+        except ImportError:
+            return False
+        httpx = module
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            return False
+    return True
+
+
+def _translate_error(error: Exception) -> requests.RequestException:
+    # The controller and its callers handle transport failures as requests exceptions.
+    if isinstance(error, httpx.ConnectTimeout):
+        return requests.ConnectTimeout(str(error))
+    if isinstance(error, httpx.TimeoutException):
+        return requests.ReadTimeout(str(error))
+    if isinstance(error, (httpx.NetworkError, httpx.RemoteProtocolError)):
+        return requests.ConnectionError(str(error))
+    return requests.RequestException(str(error))
+
+
+class _HTTPXResponse:
+    """An httpx response behind the part of the ``requests.Response`` surface the controller reads."""
+
+    def __init__(self, response: Any, elapsed: float) -> None:
+        self._response = response
+        self.status_code: int = response.status_code
+        self.headers = response.headers
+        self.reason: str = response.reason_phrase
+        self.http_version: str = response.http_version
+        self.url = str(response.url)
+        # Time until the response headers were parsed, as requests reports it.
+        self.elapsed = datetime.timedelta(seconds=elapsed)
+
+    def __enter__(self) -> '_HTTPXResponse':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def _read(self) -> bytes:
+        try:
+            return self._response.read()
+        except httpx.HTTPError as error:
+            raise _translate_error(error) from error
+        except httpx.StreamError as error:
+            raise requests.RequestException(str(error)) from error
+
+    @property
+    def content(self) -> bytes:
+        return self._read()
+
+    @property
+    def text(self) -> str:
+        self._read()
+        return self._response.text
+
+    def json(self) -> Any:
+        self._read()
+        return self._response.json()
+
+    def iter_content(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        try:
+            for chunk in self._response.iter_bytes(chunk_size):
+                yield chunk
+        except httpx.HTTPError as error:
+            raise _translate_error(error) from error
+        except httpx.StreamError as error:
+            raise requests.RequestException(str(error)) from error
+
+    def close(self) -> None:
+        self._response.close()
+
+
+class HTTPXTransport(Transport):
+    """
+    A transport on httpx that negotiates HTTP/2 with the service when it can.
+
+    Over HTTPS the protocol is chosen by ALPN: when the service offers HTTP/2, every request to a
+    host is multiplexed over one connection, so many concurrent jobs share a single TCP connection
+    and TLS handshake. Otherwise, and over plain HTTP, it speaks HTTP/1.1 from a pool of up to
+    ``max_connections`` connections. Install httpx and h2 to use it.
+    """
+
+    def __init__(
+        self,
+        http2: bool = True,
+        max_connections: int = DEFAULT_POOL_MAXSIZE,
+        keep_alive: bool = True,
+        keepalive_expiry: float = 5.0,
+    ) -> None:
+        if not _load_httpx(http2):
+            raise ImportError('HTTPXTransport requires httpx and h2. Install them with "pip install twain-wia-sane-scanner[http2]".')
+        self.http2 = http2
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections if keep_alive else 0,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._lock = threading.Lock()
+        # httpx fixes certificate verification per client, so there is one client per verify setting.
+        self._clients: Dict[Any, Any] = {}
+        self._versions: Dict[str, int] = {}
+
+    def _client(self, verify: Union[bool, str]) -> Any:
+        with self._lock:
+            client = self._clients.get(verify)
+            if client is None:
+                client = self._clients[verify] = httpx.Client(http2=self.http2, verify=verify, limits=self.limits)
+            return client
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        timeout: Optional[Union[float, Tuple[float, float]]] = None,
+        verify: bool = True,
+        stream: bool = False,
+    ) -> _HTTPXResponse:
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            timeout = httpx.Timeout(read, connect=connect)
+        client = self._client(verify)
+        started = time.perf_counter()
+        try:
+            request = client.build_request(method, url, headers=headers, params=params, json=json, timeout=timeout)
+            response = _HTTPXResponse(client.send(request, stream=True), time.perf_counter() - started)
+        except (httpx.HTTPError, httpx.InvalidURL) as error:
+            raise _translate_error(error) from error
+        with self._lock:
+            self._versions[response.http_version] = self._versions.get(response.http_version, 0) + 1
+        if not stream:
+            try:
+                response._read()
+            finally:
+                response.close()
+        return response
+
+    def close(self) -> None:
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            client.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Report requests per negotiated HTTP version and the connections currently open."""
+        with self._lock:
+            versions = dict(self._versions)
+            clients = list(self._clients.values())
+        connections = 0
+        for client in clients:
+            pool = getattr(getattr(client, '_transport', None), '_pool', None)
+            connections += len(getattr(pool, 'connections', ()))
+        return {
+            'requests': sum(versions.values()),
+            'httpVersions': versions,
+            'connections': connections,
+        }
+
+
+__all__ = [
+    'HTTPXTransport',
+]
@@ -0,0 +1,206 @@
+import heapq
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from . import (
+    DEFAULT_POLL_BACKOFF,
+    DEFAULT_POLL_MAX_INTERVAL,
+    DEFAULT_POLL_MIN_INTERVAL,
+    TERMINAL_JOB_STATUSES,
+    ScannerController,
+    ScannerServiceError,
+)
+
+
+class _WatchedJob:
+    # Slotted: a long-running watcher may track thousands of jobs.
+    __slots__ = ('jobId', 'future', 'on_change', 'deadline', 'interval', 'status', 'info')
+
+    def __init__(
+        self,
+        jobId: str,
+        future: 'Future[Dict[str, Any]]',
+        on_change: Optional[Callable[[str, Dict[str, Any]], None]],
+        deadline: Optional[float],
+        interval: float,
+    ) -> None:
+        self.jobId = jobId
+        self.future = future
+        self.on_change = on_change
+        self.deadline = deadline
+        self.interval = interval
+        self.status: Optional[str] = None
+        self.info: Dict[str, Any] = {}
+
+
+class JobWatcher:
+    """
+    Watches many scan jobs on one host from a single background thread.
+
+    Each job is polled with checkJob on its own adaptive schedule: every ``min_interval``
+    seconds right after a status change, backing off towards ``max_interval`` while nothing
+    changes. watch() returns a ``concurrent.futures.Future`` that resolves with the final job
+    info; wrap it with ``asyncio.wrap_future`` to await it from an event loop.
+    """
+
+    def __init__(
+        self,
+        controller: ScannerController,
+        host: str,
+        min_interval: float = DEFAULT_POLL_MIN_INTERVAL,
+        max_interval: float = DEFAULT_POLL_MAX_INTERVAL,
+        backoff: float = DEFAULT_POLL_BACKOFF,
+    ) -> None:
+        self.controller = controller
+        self.host = host
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self._jobs: Dict[str, _WatchedJob] = {}
+        self._schedule: List[Tuple[float, int, str]] = []
+        self._sequence = 0
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> 'JobWatcher':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def watch(
+        self,
+        jobId: str,
+        on_change: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+        timeout: Optional[float] = None,
+    ) -> 'Future[Dict[str, Any]]':
+        """
+        Start watching a job. ``on_change(jobId, info)`` runs on the watcher thread for every status change.
+
+        The future fails with TimeoutError when ``timeout`` expires, and with ScannerServiceError
+        when the service reports that the job no longer exists.
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError('JobWatcher is closed.')
+            existing = self._jobs.get(jobId)
+            if existing is not None:
+                return existing.future
+
+            future: 'Future[Dict[str, Any]]' = Future()
+            deadline = None if timeout is None else time.monotonic() + timeout
+            self._jobs[jobId] = _WatchedJob(jobId, future, on_change, deadline, self.min_interval)
+            self._push(jobId, time.monotonic())
+            self._ensure_thread()
+            self._condition.notify()
+            return future
+
+    def unwatch(self, jobId: str) -> None:
+        """Stop watching a job. Its future is cancelled if it has not resolved yet."""
+        with self._condition:
+            watched = self._jobs.pop(jobId, None)
+        if watched is not None and not watched.future.done():
+            watched.future.cancel()
+
+    def close(self) -> None:
+        """Stop the watcher thread and cancel every pending watch."""
+        with self._condition:
+            self._closed = True
+            jobs = list(self._jobs.values())
+            self._jobs.clear()
+            self._condition.notify()
+        for watched in jobs:
+            if not watched.future.done():
+                watched.future.cancel()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _push(self, jobId: str, when: float) -> None:
+        self._sequence += 1
+        heapq.heappush(self._schedule, (when, self._sequence, jobId))
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='dynamsoftservice-job-watcher', daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if self._schedule and self._schedule[0][0] <= time.monotonic():
+                        break
+                    wait = self._schedule[0][0] - time.monotonic() if self._schedule else None
+                    self._condition.wait(wait)
+                if self._closed:
+                    return
+                _, _, jobId = heapq.heappop(self._schedule)
+                watched = self._jobs.get(jobId)
+            if watched is not None:
+                self._poll(watched)
+
+    def _poll(self, watched: _WatchedJob) -> None:
+        if watched.future.cancelled():
+            self._finish(watched)
+            return
+
+        try:
+            info = self.controller.checkJob(self.host, watched.jobId)
+            error = None if info else self.controller.last_error
+        except ScannerServiceError as exception:
+            info, error = {}, exception.details or {'statusCode': exception.status_code}
+
+        if not info and error and error.get('statusCode') == 404:
+            self._finish(watched, exception=ScannerServiceError('Scan job not found.', status_code=404, details=error))
+            return
+
+        if info and info.get('status') != watched.status:
+            watched.status = info.get('status')
+            watched.info = info
+            watched.interval = self.min_interval
+            if watched.on_change is not None:
+                try:
+                    watched.on_change(watched.jobId, info)
+                except Exception:
+                    pass
+        else:
+            watched.interval = min(self.max_interval, watched.interval * self.backoff)
+
+        if watched.status in TERMINAL_JOB_STATUSES:
+            self._finish(watched, result=watched.info)
+            return
+
+        now = time.monotonic()
+        if watched.deadline is not None and now >= watched.deadline:
+            self._finish(watched, exception=TimeoutError(f'Timed out waiting for job {watched.jobId}.'))
+            return
+
+        next_poll = now + watched.interval
+        if watched.deadline is not None:
+            next_poll = min(next_poll, watched.deadline)
+        with self._condition:
+            if watched.jobId in self._jobs:
+                self._push(watched.jobId, next_poll)
+
+    def _finish(
+        self,
+        watched: _WatchedJob,
+        result: Optional[Dict[str, Any]] = None,
+        exception: Optional[BaseException] = None,
+    ) -> None:
+        with self._condition:
+            self._jobs.pop(watched.jobId, None)
+        if watched.future.done():
+            return
+        if exception is not None:
+            watched.future.set_exception(exception)
+        else:
+            watched.future.set_result(result or {})
+
+
+__all__ = [
+    'JobWatcher',
+]
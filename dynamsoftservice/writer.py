@@ -0,0 +1,186 @@
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, List, Optional, Tuple
+
+
+DEFAULT_WRITER_WORKERS = 2
+DEFAULT_WRITER_MAX_PENDING = 16
+DEFAULT_FSYNC_BATCH = 16
+
+
+class PageWriter:
+    """
+    Writes pages to disk on a background thread pool so file I/O does not stall the page loop.
+
+    Each submitted page gets the next sequence number and the name ``{prefix}_{sequence}{extension}``,
+    so pages never overwrite each other however fast they arrive. With ``atomic`` a page is written
+    to a hidden ``.part`` file and renamed into place, so readers never see a partial file.
+
+    With ``fsync`` the data is forced to disk before the rename. Pages are then synced and renamed
+    in batches of ``fsync_batch``, with one directory fsync per batch; a page's future resolves once
+    its batch has been committed. At most ``max_pending`` pages are held in memory; submit() blocks
+    beyond that, so a slow disk applies back-pressure instead of buffering the whole job.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        prefix: str = 'image',
+        extension: str = '.bin',
+        max_workers: int = DEFAULT_WRITER_WORKERS,
+        atomic: bool = True,
+        fsync: bool = False,
+        fsync_batch: int = DEFAULT_FSYNC_BATCH,
+        max_pending: int = DEFAULT_WRITER_MAX_PENDING,
+    ) -> None:
+        self.directory = directory
+        self.prefix = prefix
+        self.extension = extension
+        self.atomic = atomic
+        self.fsync = fsync
+        self.fsync_batch = max(fsync_batch, 1)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='dynamsoftservice-writer')
+        self._slots = threading.BoundedSemaphore(max(max_pending, 1))
+        self._lock = threading.Lock()
+        self._sequence = 0
+        self._futures: List['Future[str]'] = []
+        self._tasks: List['Future[None]'] = []
+        self._unsynced: List[Tuple[str, str, 'Future[str]']] = []
+        self._closed = False
+        os.makedirs(directory, exist_ok=True)
+
+    def __enter__(self) -> 'PageWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def submit(self, content: Any, extension: Optional[str] = None) -> 'Future[str]':
+        """Queue a page for writing. The future resolves with the final path once the page is in place."""
+        self._slots.acquire()
+        with self._lock:
+            if self._closed:
+                self._slots.release()
+                raise RuntimeError('PageWriter is closed.')
+            self._sequence += 1
+            filename = f'{self.prefix}_{self._sequence:05d}{extension or self.extension}'
+            future: 'Future[str]' = Future()
+            self._futures.append(future)
+            self._tasks.append(self._executor.submit(self._write, filename, content, future))
+        return future
+
+    def _write(self, filename: str, content: Any, future: 'Future[str]') -> None:
+        final_path = os.path.join(self.directory, filename)
+        temporary_path = os.path.join(self.directory, f'.{filename}.part') if self.atomic else final_path
+        try:
+            with open(temporary_path, 'wb') as output_stream:
+                output_stream.write(content)
+        except BaseException as error:
+            self._remove(temporary_path)
+            future.set_exception(error)
+            return
+        finally:
+            # The page has been handed to the OS, so it no longer counts against max_pending.
+            self._slots.release()
+
+        if not self.fsync:
+            self._commit([(temporary_path, final_path, future)], sync=False)
+            return
+
+        with self._lock:
+            self._unsynced.append((temporary_path, final_path, future))
+            batch = self._take_batch(force=False)
+        if batch:
+            self._commit(batch, sync=True)
+
+    def _take_batch(self, force: bool) -> List[Tuple[str, str, 'Future[str]']]:
+        if not self._unsynced or (not force and len(self._unsynced) < self.fsync_batch):
+            return []
+        batch, self._unsynced = self._unsynced, []
+        return batch
+
+    def _commit(self, batch: List[Tuple[str, str, 'Future[str]']], sync: bool) -> None:
+        committed: List[Tuple[str, 'Future[str]']] = []
+        for temporary_path, final_path, future in batch:
+            try:
+                if sync:
+                    file_descriptor = os.open(temporary_path, os.O_RDONLY)
+                    try:
+                        os.fsync(file_descriptor)
+                    finally:
+                        os.close(file_descriptor)
+                if temporary_path != final_path:
+                    os.replace(temporary_path, final_path)
+                committed.append((final_path, future))
+            except OSError as error:
+                self._remove(temporary_path)
+                future.set_exception(error)
+        if sync and committed:
+            self._sync_directory()
+        for final_path, future in committed:
+            future.set_result(final_path)
+
+    def _sync_directory(self) -> None:
+        # Persist the renames themselves. Directories cannot be opened for fsync on Windows.
+        if not hasattr(os, 'O_DIRECTORY'):
+            return
+        file_descriptor = os.open(self.directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(file_descriptor)
+        finally:
+            os.close(file_descriptor)
+
+    def _remove(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def flush(self) -> None:
+        """Wait until every submitted page has been written, committing a partial fsync batch."""
+        with self._lock:
+            tasks = list(self._tasks)
+        for task in tasks:
+            task.result()
+        with self._lock:
+            batch = self._take_batch(force=True)
+        if batch:
+            self._commit(batch, sync=True)
+
+    def close(self) -> List[str]:
+        """Finish every pending write and stop the pool. Returns the final paths in page order."""
+        with self._lock:
+            self._closed = True
+        self.flush()
+        self._executor.shutdown(wait=True)
+        errors = [future.exception() for future in self._futures if future.exception() is not None]
+        if errors:
+            raise errors[0]
+        return self.paths
+
+    def abort(self) -> None:
+        """Stop the pool after in-flight writes finish and delete any uncommitted temporary files."""
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            batch = self._take_batch(force=True)
+        for temporary_path, _, future in batch:
+            self._remove(temporary_path)
+            future.cancel()
+
+    @property
+    def paths(self) -> List[str]:
+        """Final paths of the pages written so far, in page order."""
+        with self._lock:
+            futures = list(self._futures)
+        return [future.result() for future in futures if future.done() and not future.cancelled() and future.exception() is None]
+
+
+__all__ = [
+    'PageWriter',
+]
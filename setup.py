@@ -65,6 +65,7 @@ setup(name='twain-wia-sane-scanner',
           "Topic :: Software Development",
       ],
       install_requires=['requests'],
+      extras_require={'async': ['aiohttp'], 'transcode': ['Pillow'], 'http2': ['httpx[http2]']},
       cmdclass={
           'install': CustomInstall,
           'build_ext': CustomBuildExt,
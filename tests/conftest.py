@@ -0,0 +1,27 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+from fakeservice import FakeScannerService  # noqa: E402
+
+
+@pytest.fixture
+def service():
+    with FakeScannerService(pages_per_job=3, page_size=4096, seed=0) as fake:
+        yield fake
+
+
+@pytest.fixture
+def new_job(service):
+    """Create an auto-running job on the fake service's first scanner and return its ID."""
+
+    def create(controller):
+        device = controller.getDevices(service.host)[0]
+        return controller.createJob(service.host, {'device': device['device'], 'autoRun': True})['jobuid']
+
+    return create
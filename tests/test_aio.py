@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip('aiohttp')
+
+from dynamsoftservice import AsyncScannerController  # noqa: E402
+
+
+async def _create_job(controller, service):
+    devices = await controller.getDevices(service.host)
+    job = await controller.createJob(service.host, {'device': devices[0]['device'], 'autoRun': True})
+    return job['jobuid']
+
+
+def test_get_image_streams_yields_every_page(service):
+    async def scan():
+        async with AsyncScannerController() as controller:
+            jobId = await _create_job(controller, service)
+            pages = await controller.getImageStreams(service.host, jobId)
+            return pages, controller.last_error
+
+    pages, error = asyncio.run(scan())
+
+    assert [len(page) for page in pages] == [4096] * 3
+    assert error is None
+
+
+def test_missing_job_sets_last_error(service):
+    async def check():
+        async with AsyncScannerController() as controller:
+            info = await controller.checkJob(service.host, 'missing-job')
+            return info, controller.last_error
+
+    info, error = asyncio.run(check())
+
+    assert info == {}
+    assert error['statusCode'] == 404
+
+
+def test_timeout_sets_last_error(service):
+    service.page_latency = 0.5
+
+    async def fetch():
+        async with AsyncScannerController(timeout=0.1) as controller:
+            devices = await controller.getDevices(service.host)
+            job = await controller.createJob(service.host, {'device': devices[0]['device'], 'autoRun': True})
+            page = await controller.getImageStream(service.host, job['jobuid'])
+            return page, controller.last_error
+
+    page, error = asyncio.run(fetch())
+
+    assert page is None
+    assert error == {'error': 'TimeoutError'}
+
+
+def test_concurrent_tasks_keep_their_own_last_error(service):
+    async def run():
+        async with AsyncScannerController() as controller:
+            failed = asyncio.Event()
+
+            async def failing():
+                await controller.checkJob(service.host, 'missing-job')
+                failed.set()
+                # Let the other task finish a successful call before reading the error.
+                await asyncio.sleep(0.2)
+                return controller.last_error
+
+            async def succeeding():
+                await failed.wait()
+                await controller.getServerInfo(service.host)
+                return controller.last_error
+
+            return await asyncio.gather(failing(), succeeding())
+
+    failing_error, succeeding_error = asyncio.run(run())
+
+    assert failing_error['statusCode'] == 404
+    assert succeeding_error is None
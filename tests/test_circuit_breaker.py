@@ -0,0 +1,51 @@
+import time
+
+from dynamsoftservice import (
+    CircuitBreaker,
+    CircuitState,
+    InMemorySpanExporter,
+    MetricsCollector,
+    ScannerController,
+    Tracer,
+)
+
+
+def test_breaker_opens_fails_fast_and_recovers(service):
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0.2)
+    controller = ScannerController(circuit_breaker=breaker)
+    service.error_rate = 1.0
+
+    controller.getDevices(service.host)
+    controller.getDevices(service.host)
+    requests_while_open = service.request_count
+
+    assert controller.getDevices(service.host) == []
+    assert controller.last_error['error'].startswith('Circuit open')
+    assert service.request_count == requests_while_open
+    assert controller.hostHealth()[service.host]['state'] == CircuitState.OPEN
+
+    service.error_rate = 0.0
+    time.sleep(0.25)
+
+    assert len(controller.getDevices(service.host)) == 4
+    assert controller.hostHealth()[service.host]['state'] == CircuitState.CLOSED
+
+
+def test_rejected_calls_reach_metrics_and_traces(service):
+    metrics = MetricsCollector()
+    exporter = InMemorySpanExporter()
+    controller = ScannerController(
+        circuit_breaker=CircuitBreaker(failure_threshold=1, recovery_timeout=60),
+        hooks=[metrics],
+        tracer=Tracer(exporter),
+    )
+    service.error_rate = 1.0
+    controller.getDevices(service.host)
+
+    controller.getDevices(service.host)
+
+    rejected = [item for item in metrics.snapshot() if item['status'] == 'error']
+    assert [(item['count'], item['errors']) for item in rejected] == [(1, 1)]
+    assert exporter.spans[-1].attributes['error'].startswith('Circuit open')
+    assert exporter.spans[-1].attributes['attempts'] == 0
+    assert service.request_count == 1
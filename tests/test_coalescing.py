@@ -0,0 +1,98 @@
+import threading
+import time
+
+from dynamsoftservice import RequestHook, ScannerController
+
+
+class _HoldFirstRequest(RequestHook):
+    """Holds the leading request until the other callers have joined it."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+
+    def before_request(self, event):
+        self.release.wait(5)
+
+
+def _get_devices_concurrently(controller, service, callers, hook):
+    results = []
+    lock = threading.Lock()
+
+    def call():
+        devices = controller.getDevices(service.host)
+        with lock:
+            results.append(devices)
+
+    threads = [threading.Thread(target=call) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.2)
+    hook.release.set()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_identical_gets_share_one_request(service):
+    hook = _HoldFirstRequest()
+    controller = ScannerController(coalesce=True, hooks=[hook])
+
+    results = _get_devices_concurrently(controller, service, 16, hook)
+
+    assert service.request_count == 1
+    assert len(results) == 16
+    assert all(devices == results[0] and len(devices) == 4 for devices in results)
+    assert len({id(devices) for devices in results}) == 16
+
+
+def test_without_coalescing_every_caller_sends_a_request(service):
+    hook = _HoldFirstRequest()
+    hook.release.set()
+    controller = ScannerController(hooks=[hook], pool_maxsize=8)
+
+    _get_devices_concurrently(controller, service, 8, hook)
+
+    assert service.request_count == 8
+
+
+def test_shared_failure_reaches_every_caller(service):
+    hook = _HoldFirstRequest()
+    controller = ScannerController(coalesce=True, hooks=[hook])
+    service.error_rate = 1.0
+    errors = []
+
+    def call():
+        controller.getDevices(service.host)
+        errors.append(controller.last_error)
+
+    threads = [threading.Thread(target=call) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.2)
+    hook.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert service.request_count == 1
+    assert [error['statusCode'] for error in errors] == [503] * 4
+
+
+def test_callers_do_not_share_device_dicts(service):
+    hook = _HoldFirstRequest()
+    controller = ScannerController(coalesce=True, hooks=[hook])
+
+    first, second = _get_devices_concurrently(controller, service, 2, hook)
+    first[0]['name'] = 'Renamed by the first caller'
+
+    assert second[0]['name'] != 'Renamed by the first caller'
+
+
+def test_cached_devices_are_copied_per_call(service):
+    controller = ScannerController(cache_ttl=60)
+
+    devices = controller.getDevices(service.host)
+    devices[0]['name'] = 'Renamed by the caller'
+    cached = controller.getDevices(service.host)
+
+    assert service.request_count == 1
+    assert cached[0]['name'] != 'Renamed by the caller'
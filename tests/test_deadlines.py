@@ -0,0 +1,29 @@
+from dynamsoftservice import InMemorySpanExporter, MetricsCollector, ScannerController, Tracer
+
+
+def test_expired_deadline_fails_fast_and_is_instrumented(service, new_job):
+    metrics = MetricsCollector()
+    exporter = InMemorySpanExporter()
+    controller = ScannerController(hooks=[metrics], tracer=Tracer(exporter))
+    jobId = new_job(controller)
+    controller.setJobDeadline(jobId, 0)
+    requests_before = service.request_count
+
+    assert controller.getImageStream(service.host, jobId) is None
+
+    assert service.request_count == requests_before
+    assert controller.last_error == {'error': 'Job deadline exceeded.', 'jobId': jobId}
+    rejected = [item for item in metrics.snapshot() if item['status'] == 'error']
+    assert [(item['path'], item['errors']) for item in rejected] == [('device/scanners/jobs/{jobId}/next-page', 1)]
+    page_span = exporter.spans[-1]
+    assert page_span.attributes['error'] == 'Job deadline exceeded.'
+    assert page_span.attributes['attempts'] == 0
+
+
+def test_exempt_calls_still_run_after_the_deadline(service, new_job):
+    controller = ScannerController()
+    jobId = new_job(controller)
+    controller.setJobDeadline(jobId, 0)
+
+    assert controller.checkJob(service.host, jobId)['jobuid'] == jobId
+    assert controller.deleteJob(service.host, jobId)
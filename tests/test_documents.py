@@ -0,0 +1,68 @@
+import time
+
+from dynamsoftservice import ScannerController
+
+
+def test_scan_to_document_inserts_every_page(service, new_job):
+    controller = ScannerController()
+    jobId = new_job(controller)
+
+    document = controller.scanToDocument(service.host, jobId)
+
+    assert len(document['pages']) == 3
+    assert list(service._documents) == [document['uid']]
+    assert controller.last_error is None
+
+
+def test_failed_insert_deletes_the_created_document(service, new_job, monkeypatch):
+    controller = ScannerController()
+    jobId = new_job(controller)
+
+    def reject(host, docId, parameters):
+        controller.last_error = {'statusCode': 400, 'message': 'Invalid source.'}
+        return {}
+
+    monkeypatch.setattr(controller, 'insertPage', reject)
+
+    assert controller.scanToDocument(service.host, jobId) == {}
+    assert controller.last_error == {'statusCode': 400, 'message': 'Invalid source.'}
+    assert service._documents == {}
+
+
+def test_failed_insert_does_not_wait_for_the_lookup_in_flight(service, new_job, monkeypatch):
+    controller = ScannerController()
+    jobId = new_job(controller)
+    service.page_latency = 1.0
+    monkeypatch.setattr(controller, 'insertPage', lambda host, docId, parameters: {})
+
+    started = time.monotonic()
+    controller.scanToDocument(service.host, jobId, prefetch=1)
+
+    # The first lookup takes a second; the second one is still in flight when the insert fails.
+    assert time.monotonic() - started < 1.8
+    assert service._documents == {}
+
+
+def test_failed_lookup_is_reported_and_cleaned_up(service, new_job, monkeypatch):
+    controller = ScannerController()
+    jobId = new_job(controller)
+
+    def lookup_fails(host, jobId):
+        controller.last_error = {'statusCode': 503, 'message': 'Injected failure.'}
+        return {}
+
+    monkeypatch.setattr(controller, 'getImageInfo', lookup_fails)
+
+    assert controller.scanToDocument(service.host, jobId) == {}
+    assert controller.last_error == {'statusCode': 503, 'message': 'Injected failure.'}
+    assert service._documents == {}
+
+
+def test_existing_document_is_kept_on_failure(service, new_job, monkeypatch):
+    controller = ScannerController()
+    jobId = new_job(controller)
+    docId = controller.createDocument(service.host, {})['uid']
+    monkeypatch.setattr(controller, 'insertPage', lambda host, docId, parameters: {})
+
+    assert controller.scanToDocument(service.host, jobId, docId=docId) == {}
+    assert list(service._documents) == [docId]
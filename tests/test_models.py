@@ -0,0 +1,31 @@
+from dynamsoftservice import DeviceRegistry, Job, JobStatus, ScannerController
+from dynamsoftservice.registry import get_scanner_id
+
+
+def test_models_copy_fields_and_drop_the_payload(service, new_job):
+    controller = ScannerController()
+    jobId = new_job(controller)
+    payload = controller.checkJob(service.host, jobId)
+
+    job = controller.getJob(service.host, jobId)
+
+    assert not hasattr(job, '__dict__')
+    assert (job.jobId, job.status, job.device) == (jobId, payload['status'], payload['device'])
+    assert job['jobuid'] == jobId
+    assert job.to_dict() == {key: payload[key] for key in ('jobuid', 'status', 'device', 'pageCount')}
+    assert Job.from_payload(payload) == job
+
+
+def test_device_ids_match_the_registry(service):
+    controller = ScannerController()
+
+    devices = controller.listDevices(service.host)
+    registry = DeviceRegistry(controller, service.host)
+
+    assert [device.id for device in devices] == [get_scanner_id(device) for device in controller.getDevices(service.host)]
+    assert sorted(device.id for device in devices) == sorted(scanner_id for scanner_id, _ in registry.items())
+
+
+def test_job_done_follows_status():
+    assert Job.from_payload({'jobuid': 'a', 'status': JobStatus.COMPLETED}).done
+    assert not Job(jobId='a', status=JobStatus.RUNNING).done
@@ -0,0 +1,74 @@
+import threading
+import time
+
+import pytest
+from fakeservice import FakeScannerService
+
+from dynamsoftservice import PageProcessor, RequestHook, ScannerController
+
+
+class _RecordUrls(RequestHook):
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.urls = []
+
+    def before_request(self, event):
+        with self.lock:
+            self.urls.append(event['url'])
+
+
+@pytest.fixture
+def blank_service():
+    with FakeScannerService(pages_per_job=12, page_size=1024, blank_rate=0.5, seed=0) as fake:
+        yield fake
+
+
+def _start_job(controller, service):
+    device = controller.getDevices(service.host)[0]
+    return controller.createJob(service.host, {'device': device['device'], 'autoRun': True})['jobuid']
+
+
+def test_pages_come_back_in_scan_order_with_results(blank_service):
+    controller = ScannerController()
+    jobId = _start_job(controller, blank_service)
+
+    pages = list(PageProcessor(controller, blank_service.host, max_workers=4).run(jobId))
+
+    assert [page.index for page in pages] == list(range(1, 13))
+    for page in pages:
+        assert page.url.endswith(f'/pages/{page.index}')
+        assert page.blank == blank_service._is_blank(page.url)
+        assert page.barcodes == [{'format': 'QR_CODE', 'text': str(page.index)}]
+        assert len(page.content) == 1024
+
+
+def test_blank_pages_are_dropped_before_download(blank_service):
+    recorder = _RecordUrls()
+    controller = ScannerController(hooks=[recorder])
+    jobId = _start_job(controller, blank_service)
+    processor = PageProcessor(controller, blank_service.host, drop_blank=True, read_barcodes=False)
+
+    pages = list(processor.run(jobId))
+
+    kept = [page.url for page in pages]
+    blank = [f'{blank_service.host}/api/device/scanners/jobs/{jobId}/pages/{index}' for index in range(1, 13)]
+    blank = [url for url in blank if blank_service._is_blank(url)]
+    assert blank and len(kept) + len(blank) == 12
+    assert processor.dropped == len(blank)
+    assert [page.index for page in pages] == sorted(page.index for page in pages)
+    assert not set(blank) & set(recorder.urls)
+    assert set(kept) <= set(recorder.urls)
+
+
+def test_closing_early_stops_the_workers(blank_service):
+    controller = ScannerController()
+    jobId = _start_job(controller, blank_service)
+
+    pages = PageProcessor(controller, blank_service.host, max_workers=2).run(jobId)
+    first = next(pages)
+    pages.close()
+    requests_after_close = blank_service.request_count
+    time.sleep(0.2)
+
+    assert first.index == 1
+    assert blank_service.request_count == requests_after_close
@@ -0,0 +1,36 @@
+from dynamsoftservice import RetryPolicy, ScannerController
+
+
+def test_get_is_retried_until_it_succeeds(service):
+    def recover(attempt):
+        # The service starts failing every request and heals after the first failed attempt.
+        service.error_rate = 0.0
+
+    controller = ScannerController(retry=RetryPolicy(backoff_factor=0.01, on_attempt=recover))
+    service.error_rate = 1.0
+
+    devices = controller.getDevices(service.host)
+
+    assert len(devices) == 4
+    assert [attempt['statusCode'] for attempt in controller.last_attempts] == [503, 200]
+    assert controller.last_error is None
+
+
+def test_retries_stop_after_max_retries(service):
+    controller = ScannerController(retry=RetryPolicy(max_retries=2, backoff_factor=0.01))
+    service.error_rate = 1.0
+
+    assert controller.getDevices(service.host) == []
+    assert len(controller.last_attempts) == 3
+    assert controller.last_error['statusCode'] == 503
+    assert service.request_count == 3
+
+
+def test_next_page_is_never_replayed(service, new_job):
+    controller = ScannerController(retry=RetryPolicy(backoff_factor=0.01))
+    jobId = new_job(controller)
+    service.error_rate = 1.0
+    requests_before = service.request_count
+
+    assert controller.getImageStream(service.host, jobId) is None
+    assert service.request_count == requests_before + 1
@@ -0,0 +1,67 @@
+import json
+import os
+
+import pytest
+
+from dynamsoftservice import ScanSession, ScannerController
+
+
+@pytest.fixture
+def start_session(service, tmp_path):
+    def start(controller):
+        device = controller.getDevices(service.host)[0]
+        return ScanSession.start(
+            controller,
+            service.host,
+            {'device': device['device'], 'autoRun': True},
+            str(tmp_path / 'output'),
+            str(tmp_path / 'job.journal'),
+        )
+
+    return start
+
+
+def test_resume_continues_where_the_journal_stopped(service, start_session, tmp_path):
+    controller = ScannerController()
+    session = start_session(controller)
+    pages = session.iterImageFiles()
+    received = [next(pages), next(pages)]
+    # The process dies here; a new one picks the job up from the journal.
+    del pages, session
+
+    resumed = ScanSession.resume(ScannerController(), str(tmp_path / 'job.journal'))
+
+    assert resumed.pages == 2
+    assert resumed.files == received
+    assert resumed.alive
+    files = resumed.getImageFiles()
+    assert len(files) == 3 and files[:2] == received
+    assert sorted(os.listdir(tmp_path / 'output')) == files
+    resumed.close()
+    assert not os.path.exists(tmp_path / 'job.journal')
+    assert not resumed.alive
+
+
+def test_resume_adopts_a_page_saved_before_the_crash(service, start_session, tmp_path):
+    controller = ScannerController()
+    session = start_session(controller)
+    next(session.iterImageFiles())
+    # The second page reached disk, but the process died before the journal recorded it.
+    orphan = tmp_path / 'output' / session._filename(2)
+    orphan.write_bytes(b'page')
+
+    resumed = ScanSession.resume(controller, str(tmp_path / 'job.journal'))
+
+    assert resumed.pages == 2
+    assert resumed.files[-1] == orphan.name
+    with open(tmp_path / 'job.journal', encoding='utf-8') as journal:
+        assert json.load(journal)['pages'] == 2
+
+
+@pytest.mark.parametrize('content', [None, 'not json', json.dumps({'version': 0, 'jobId': 'a'}), json.dumps({'version': 1})])
+def test_resume_rejects_missing_or_invalid_journals(tmp_path, content):
+    journal_path = tmp_path / 'job.journal'
+    if content is not None:
+        journal_path.write_text(content, encoding='utf-8')
+
+    assert ScanSession.resume(ScannerController(), str(journal_path)) is None
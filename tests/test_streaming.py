@@ -0,0 +1,72 @@
+import io
+import os
+
+from dynamsoftservice import ScannerController
+
+
+def test_iter_image_streams_yields_every_page(service, new_job):
+    controller = ScannerController()
+    jobId = new_job(controller)
+
+    pages = list(controller.iterImageStreams(service.host, jobId))
+
+    assert [len(page) for page in pages] == [4096] * 3
+    assert controller.last_error is None
+
+
+def test_write_image_stream_copies_pages_in_chunks(service, new_job):
+    controller = ScannerController()
+    jobId = new_job(controller)
+    output = io.BytesIO()
+
+    written = controller.writeImageStream(service.host, jobId, output, chunkSize=1000)
+
+    assert written == 4096
+    assert len(output.getvalue()) == 4096
+
+
+def test_image_files_are_written_without_leftover_parts(service, new_job, tmp_path):
+    controller = ScannerController()
+    jobId = new_job(controller)
+
+    filenames = controller.getImageFiles(service.host, jobId, str(tmp_path))
+
+    assert len(filenames) == 3
+    assert sorted(os.listdir(tmp_path)) == sorted(filenames)
+    assert all(os.path.getsize(tmp_path / filename) == 4096 for filename in filenames)
+
+
+def test_prefetch_hands_back_unconsumed_pages(service, new_job):
+    controller = ScannerController()
+    jobId = new_job(controller)
+
+    pages = controller.iterImageStreams(service.host, jobId, prefetch=3)
+    first = next(pages)
+    pages.close()
+    remaining = list(controller.iterImageStreams(service.host, jobId))
+
+    assert len(first) == 4096
+    assert 1 + len(pages.leftover) + len(remaining) == 3
+
+
+def test_prefetch_reports_a_failed_fetch_on_the_consumer_thread(service, new_job):
+    controller = ScannerController()
+    jobId = new_job(controller)
+    service.error_rate = 1.0
+
+    pages = list(controller.iterImageStreams(service.host, jobId, prefetch=2))
+
+    assert pages == []
+    assert controller.last_error['statusCode'] == 503
+
+
+def test_prefetch_clears_last_error_after_a_clean_run(service, new_job):
+    controller = ScannerController()
+    jobId = new_job(controller)
+    controller.checkJob(service.host, 'missing-job')
+    assert controller.last_error is not None
+
+    pages = list(controller.iterImageStreams(service.host, jobId, prefetch=2))
+
+    assert len(pages) == 3
+    assert controller.last_error is None
@@ -0,0 +1,34 @@
+import io
+
+import pytest
+
+from dynamsoftservice import Transcoder
+
+Image = pytest.importorskip('PIL.Image')
+
+
+def _png(color, mode='RGB'):
+    output = io.BytesIO()
+    Image.new(mode, (32, 24), color).save(output, format='PNG')
+    return output.getvalue()
+
+
+def test_combine_builds_one_pdf_and_caches_it():
+    transcoder = Transcoder()
+    pages = [_png('red'), _png((0, 0, 255, 128), mode='RGBA')]
+
+    pdf = transcoder.combine(pages, 'image/png')
+
+    assert pdf.startswith(b'%PDF')
+    assert b'/Count 2' in pdf
+    assert transcoder.combine(pages, 'image/png') is pdf
+    assert transcoder.stats()['hits'] == 1
+
+
+def test_combine_rejects_truncated_pages():
+    transcoder = Transcoder()
+    page = _png('red')
+
+    with pytest.raises(OSError):
+        transcoder.combine([page, page[:len(page) // 2]], 'image/png')
+    assert transcoder.stats()['entries'] == 0
@@ -0,0 +1,42 @@
+import pytest
+import requests
+
+from dynamsoftservice import RequestsTransport, ScannerController, Transport
+
+
+class _CountingTransport(RequestsTransport):
+    def __init__(self, session) -> None:
+        super().__init__(session)
+        self.urls = []
+
+    def request(self, method, url, **kwargs):
+        self.urls.append(url)
+        return super().request(method, url, **kwargs)
+
+
+def test_incomplete_transport_fails_on_construction():
+    class Incomplete(Transport):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_custom_transport_carries_every_request(service):
+    transport = _CountingTransport(requests.Session())
+    controller = ScannerController(transport=transport)
+
+    assert len(controller.getDevices(service.host)) == 4
+    assert transport.urls == [f'{service.host}/api/device/scanners']
+
+
+def test_httpx_transport_against_the_fake_service(service):
+    pytest.importorskip('httpx')
+    controller = ScannerController(http2=True)
+    device = controller.getDevices(service.host)[0]
+    jobId = controller.createJob(service.host, {'device': device['device'], 'autoRun': True})['jobuid']
+
+    pages = controller.getImageStreams(service.host, jobId)
+
+    assert [len(page) for page in pages] == [4096] * 3
+    assert controller.stats()['httpVersions'] == {'HTTP/1.1': service.request_count}
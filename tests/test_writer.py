@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+from dynamsoftservice import PageWriter, ScannerController
+
+
+def test_pages_get_sequential_names_and_no_part_files(tmp_path):
+    with PageWriter(str(tmp_path), prefix='page', extension='.png', max_workers=4) as writer:
+        for index in range(10):
+            writer.submit(bytes([index]) * 100)
+
+    names = [f'page_{index:05d}.png' for index in range(1, 11)]
+    assert [os.path.basename(path) for path in writer.paths] == names
+    assert sorted(os.listdir(tmp_path)) == names
+    assert (tmp_path / 'page_00004.png').read_bytes() == bytes([3]) * 100
+
+
+def test_fsync_commits_pages_in_batches(tmp_path, monkeypatch):
+    synced = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(os, 'fsync', lambda descriptor: synced.append(descriptor) or real_fsync(descriptor))
+    writer = PageWriter(str(tmp_path), max_workers=1, fsync=True, fsync_batch=3)
+
+    futures = [writer.submit(b'page') for _ in range(5)]
+    for future in futures[:3]:
+        future.result(timeout=5)
+
+    # The last two pages wait for a full batch or for close().
+    assert not any(future.done() for future in futures[3:])
+    assert len(writer.close()) == 5
+    file_syncs = 5
+    directory_syncs = 2 if hasattr(os, 'O_DIRECTORY') else 0
+    assert len(synced) == file_syncs + directory_syncs
+
+
+def test_write_errors_reach_the_future_and_close(tmp_path):
+    writer = PageWriter(str(tmp_path))
+
+    good = writer.submit(b'page')
+    bad = writer.submit('not bytes')
+
+    with pytest.raises(TypeError):
+        writer.close()
+    assert isinstance(bad.exception(), TypeError)
+    assert os.path.basename(good.result()) == 'image_00001.bin'
+    assert os.listdir(tmp_path) == ['image_00001.bin']
+
+
+def test_abort_discards_uncommitted_pages(tmp_path):
+    writer = PageWriter(str(tmp_path), fsync=True, fsync_batch=100)
+    futures = [writer.submit(b'page') for _ in range(3)]
+
+    writer.abort()
+
+    assert all(future.cancelled() for future in futures)
+    assert os.listdir(tmp_path) == []
+    with pytest.raises(RuntimeError):
+        writer.submit(b'page')
+
+
+def test_get_image_files_with_writers(service, new_job, tmp_path):
+    controller = ScannerController()
+    jobId = new_job(controller)
+
+    filenames = controller.getImageFiles(service.host, jobId, str(tmp_path), writers=2, fsync=True)
+
+    assert filenames == [f'image_{jobId}_{index:05d}.png' for index in range(1, 4)]
+    assert sorted(os.listdir(tmp_path)) == filenames
@@ -48,7 +48,16 @@ PROJECT_ROOT = Path(__file__).resolve().parents[2]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from dynamsoftservice import JobStatus, ScannerController, ScannerServiceError, ScannerType
+from dynamsoftservice import (
+    DEFAULT_TIMEOUT_PROFILES,
+    CircuitBreaker,
+    DeviceRegistry,
+    JobStatus,
+    ScannerController,
+    ScannerServiceError,
+    ScannerType,
+    Transcoder,
+)
 
 
 def get_int_env(name: str, default: int) -> int:
@@ -81,9 +90,34 @@ SCANNER_LOCK_TTL_SECONDS = get_int_env('SCANNER_LOCK_TTL_SECONDS', 600)
 DEFAULT_SCANNER_TYPES = ScannerType.TWAINSCANNER | ScannerType.TWAINX64SCANNER
 SCANNER_TYPE_MASK = get_int_env('REMOTE_SCAN_SCANNER_TYPES', DEFAULT_SCANNER_TYPES)
 SERVICE_VERIFY = os.getenv('DWT_SERVICE_VERIFY', 'true').lower() == 'true'
+SERVICE_POOL_SIZE = get_int_env('DWT_SERVICE_POOL_SIZE', 32)
+SERVICE_CACHE_TTL = get_int_env('DWT_SERVICE_CACHE_TTL', 5)
+SERVICE_BREAKER_THRESHOLD = get_int_env('DWT_SERVICE_BREAKER_THRESHOLD', 5)
+SERVICE_BREAKER_RECOVERY = get_int_env('DWT_SERVICE_BREAKER_RECOVERY', 30)
+SERVICE_HTTP2 = os.getenv('DWT_SERVICE_HTTP2', 'false').lower() == 'true'
 
 DB_LOCK = threading.Lock()
-scanner_controller = ScannerController(timeout=120, verify=SERVICE_VERIFY)
+scanner_controller = ScannerController(
+    timeout=120,
+    verify=SERVICE_VERIFY,
+    pool_maxsize=SERVICE_POOL_SIZE,
+    cache_ttl=SERVICE_CACHE_TTL,
+    coalesce=True,
+    http2=SERVICE_HTTP2,
+    timeout_profiles=DEFAULT_TIMEOUT_PROFILES,
+    circuit_breaker=(
+        CircuitBreaker(failure_threshold=SERVICE_BREAKER_THRESHOLD, recovery_timeout=SERVICE_BREAKER_RECOVERY)
+        if SERVICE_BREAKER_THRESHOLD > 0
+        else None
+    ),
+)
+scanner_registry = DeviceRegistry(
+    scanner_controller,
+    SERVICE_HOST,
+    SCANNER_TYPE_MASK,
+    refresh_interval=SERVICE_CACHE_TTL,
+)
+page_transcoder = Transcoder()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl='/api/auth/token')
 
 app = FastAPI(
@@ -499,71 +533,52 @@ def slugify_file_stem(file_stem: str) -> str:
     return cleaned or 'scan-output'
 
 
-def decode_export_images(payload: ExportRequest) -> List[Image.Image]:
+def decode_export_payloads(payload: ExportRequest) -> List[bytes]:
     if payload.image_type not in ('image/png', 'image/jpeg'):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail='image_type must be image/png or image/jpeg.')
     if not payload.images:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail='At least one scanned page is required.')
 
-    decoded_images: List[Image.Image] = []
+    decoded_payloads: List[bytes] = []
     for index, image_payload in enumerate(payload.images, start=1):
         try:
-            image_bytes = base64.b64decode(image_payload, validate=True)
+            decoded_payloads.append(base64.b64decode(image_payload, validate=True))
         except (binascii.Error, ValueError):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail='Invalid base64 image payload for page {index}.'.format(index=index),
             )
-
-        try:
-            with Image.open(io.BytesIO(image_bytes)) as image:
-                image.load()
-                decoded_images.append(image.copy())
-        except OSError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail='Unsupported image payload for page {index}.'.format(index=index),
-            )
-
-    return decoded_images
+    return decoded_payloads
 
 
-def image_to_png_bytes(image: Image.Image) -> bytes:
-    output = io.BytesIO()
-    if image.mode in ('RGBA', 'LA'):
-        prepared_image = image
-    elif image.mode in ('RGB', 'L'):
-        prepared_image = image
-    else:
-        prepared_image = image.convert('RGBA')
-    prepared_image.save(output, format='PNG')
-    return output.getvalue()
+def validate_export_page(image_bytes: bytes, index: int) -> None:
+    # A full decode, so truncated or corrupt pages are rejected even when the transcoder has nothing to convert.
+    try:
+        with Image.open(io.BytesIO(image_bytes)) as image:
+            image.load()
+    except OSError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Unsupported image payload for page {index}.'.format(index=index),
+        )
 
 
-def image_to_pdf_page(image: Image.Image) -> Image.Image:
-    if image.mode in ('RGBA', 'LA'):
-        alpha = image.getchannel('A')
-        flattened = Image.new('RGB', image.size, 'white')
-        flattened.paste(image.convert('RGBA'), mask=alpha)
-        return flattened
-    if image.mode != 'RGB':
-        return image.convert('RGB')
-    return image
+def export_page_as(image_bytes: bytes, image_type: str, target_type: str, index: int) -> bytes:
+    validate_export_page(image_bytes, index)
+    return page_transcoder.transcode(image_bytes, image_type, target_type)
 
 
-def build_pdf_bytes(images: List[Image.Image]) -> bytes:
-    pdf_pages = [image_to_pdf_page(image) for image in images]
-    output = io.BytesIO()
-    first_page, *remaining_pages = pdf_pages
-    first_page.save(output, format='PDF', save_all=True, append_images=remaining_pages)
-    return output.getvalue()
+def build_pdf_bytes(image_payloads: List[bytes], image_type: str) -> bytes:
+    for index, image_bytes in enumerate(image_payloads, start=1):
+        validate_export_page(image_bytes, index)
+    return page_transcoder.combine(image_payloads, image_type, 'application/pdf')
 
 
 def prune_expired_locks(connection: sqlite3.Connection) -> None:
     connection.execute('DELETE FROM scanner_locks WHERE expires_at <= ?', (utcnow_string(),))
 
 
-def get_active_locks() -> Dict[str, Dict[str, Any]]:
+def get_active_locks() -> Dict[str, sqlite3.Row]:
     with DB_LOCK:
         with get_connection() as connection:
             prune_expired_locks(connection)
@@ -571,21 +586,11 @@ def get_active_locks() -> Dict[str, Dict[str, Any]]:
                 'SELECT scanner_id, scanner_name, owner_username, status, job_uid, acquired_at, expires_at FROM scanner_locks'
             ).fetchall()
 
-    locks: Dict[str, Dict[str, Any]] = {}
-    for row in rows:
-        locks[row['scanner_id']] = {
-            'scanner_id': row['scanner_id'],
-            'scanner_name': row['scanner_name'],
-            'owner_username': row['owner_username'],
-            'status': row['status'],
-            'job_uid': row['job_uid'],
-            'acquired_at': row['acquired_at'],
-            'expires_at': row['expires_at'],
-        }
-    return locks
+    # sqlite3.Row already supports lookups by column name, so rows are used as they are.
+    return {row['scanner_id']: row for row in rows}
 
 
-def acquire_lock(scanner_id: str, scanner_name: str, username: str) -> Optional[Dict[str, Any]]:
+def acquire_lock(scanner_id: str, scanner_name: str, username: str) -> Optional[sqlite3.Row]:
     with DB_LOCK:
         with get_connection() as connection:
             prune_expired_locks(connection)
@@ -594,15 +599,7 @@ def acquire_lock(scanner_id: str, scanner_name: str, username: str) -> Optional[
                 (scanner_id,),
             ).fetchone()
             if existing_lock and existing_lock['owner_username'] != username:
-                return {
-                    'scanner_id': existing_lock['scanner_id'],
-                    'scanner_name': existing_lock['scanner_name'],
-                    'owner_username': existing_lock['owner_username'],
-                    'status': existing_lock['status'],
-                    'job_uid': existing_lock['job_uid'],
-                    'acquired_at': existing_lock['acquired_at'],
-                    'expires_at': existing_lock['expires_at'],
-                }
+                return existing_lock
 
             now = utcnow_string()
             expires_at = (utcnow() + timedelta(seconds=SCANNER_LOCK_TTL_SECONDS)).strftime('%Y-%m-%dT%H:%M:%SZ')
@@ -644,16 +641,10 @@ def release_lock(scanner_id: str, username: str) -> None:
             )
 
 
-def get_scanner_id(scanner: Dict[str, Any]) -> str:
-    return hashlib.sha256(scanner['device'].encode('utf-8')).hexdigest()[:16]
-
-
 def list_scanners() -> List[Dict[str, Any]]:
-    scanners = scanner_controller.getDevices(SERVICE_HOST, SCANNER_TYPE_MASK)
     locks = get_active_locks()
     items: List[Dict[str, Any]] = []
-    for scanner in scanners:
-        scanner_id = get_scanner_id(scanner)
+    for scanner_id, scanner in scanner_registry.items():
         active_lock = locks.get(scanner_id)
         items.append(
             {
@@ -670,11 +661,7 @@ def list_scanners() -> List[Dict[str, Any]]:
 
 
 def find_scanner(scanner_id: str) -> Optional[Dict[str, Any]]:
-    scanners = scanner_controller.getDevices(SERVICE_HOST, SCANNER_TYPE_MASK)
-    for scanner in scanners:
-        if get_scanner_id(scanner) == scanner_id:
-            return scanner
-    return None
+    return scanner_registry.get(scanner_id)
 
 
 @app.middleware('http')
@@ -832,6 +819,8 @@ def scan(
                 detail=job or scanner_controller.last_error or {'message': 'Failed to create scan job.'},
             )
 
+        # Keep the whole acquisition within the job timeout the client asked for.
+        scanner_controller.setJobDeadline(job_uid, payload.job_timeout)
         update_lock(scanner_id, current_user['username'], 'pending', job_uid=job_uid)
 
         start_result = scanner_controller.updateJob(SERVICE_HOST, job_uid, {'status': JobStatus.RUNNING})
@@ -843,6 +832,23 @@ def scan(
 
         update_lock(scanner_id, current_user['username'], 'scanning', job_uid=job_uid)
         images = scanner_controller.getImageStreams(SERVICE_HOST, job_uid, imageType=payload.image_type)
+        # The page loop ends quietly on a failed fetch, so a partial result must not be reported as a scan.
+        page_error = scanner_controller.last_error
+        if page_error is not None:
+            budget = scanner_controller.jobBudget(job_uid)
+            if budget is not None and budget <= 0:
+                raise HTTPException(
+                    status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                    detail={
+                        'message': 'Scan job timed out before all pages were received.',
+                        'page_count': len(images),
+                        'error': page_error,
+                    },
+                )
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail={'message': 'Failed to fetch scanned pages.', 'page_count': len(images), 'error': page_error},
+            )
         job_info = scanner_controller.checkJob(SERVICE_HOST, job_uid)
         if job_info.get('status') == JobStatus.FAULTED:
             raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=job_info)
@@ -877,7 +883,7 @@ def export_pdf(
     payload: ExportRequest,
     current_user: Dict[str, Any] = Depends(get_current_user),
 ) -> Response:
-    pdf_bytes = build_pdf_bytes(decode_export_images(payload))
+    pdf_bytes = build_pdf_bytes(decode_export_payloads(payload), payload.image_type)
     filename = '{stem}.pdf'.format(stem=slugify_file_stem(payload.file_stem))
     write_audit_log(current_user['username'], 'export.pdf', detail='{count} page(s)'.format(count=len(payload.images)))
     return Response(
@@ -892,24 +898,24 @@ def export_png(
     payload: ExportRequest,
     current_user: Dict[str, Any] = Depends(get_current_user),
 ) -> Response:
-    images = decode_export_images(payload)
+    png_pages = [
+        export_page_as(image_bytes, payload.image_type, 'image/png', index)
+        for index, image_bytes in enumerate(decode_export_payloads(payload), start=1)
+    ]
     file_stem = slugify_file_stem(payload.file_stem)
-    write_audit_log(current_user['username'], 'export.png', detail='{count} page(s)'.format(count=len(images)))
+    write_audit_log(current_user['username'], 'export.png', detail='{count} page(s)'.format(count=len(png_pages)))
 
-    if len(images) == 1:
+    if len(png_pages) == 1:
         return Response(
-            content=image_to_png_bytes(images[0]),
+            content=png_pages[0],
             media_type='image/png',
             headers={'Content-Disposition': 'attachment; filename="{name}"'.format(name='{stem}.png'.format(stem=file_stem))},
         )
 
     archive = io.BytesIO()
     with zipfile.ZipFile(archive, mode='w', compression=zipfile.ZIP_DEFLATED) as zip_handle:
-        for index, image in enumerate(images, start=1):
-            zip_handle.writestr(
-                '{stem}-{index:02d}.png'.format(stem=file_stem, index=index),
-                image_to_png_bytes(image),
-            )
+        for index, png_page in enumerate(png_pages, start=1):
+            zip_handle.writestr('{stem}-{index:02d}.png'.format(stem=file_stem, index=index), png_page)
     return Response(
         content=archive.getvalue(),
         media_type='application/zip',